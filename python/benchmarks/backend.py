@@ -0,0 +1,295 @@
+"""
+Local stand-in for the Composio API.
+
+Serves the endpoints used on the SDK hot paths with configurable latency and
+payload sizes, so benchmarks don't depend on the network or an account.
+
+Usage:
+    python -m benchmarks.backend --port 9900 --latency 0.05 --payload-size 4096
+    COMPOSIO_BASE_URL=http://localhost:9900/api composio actions --app github
+"""
+
+import argparse
+import json
+import threading
+import time
+import typing as t
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+DEFAULT_APPS = ("github",)
+"""Apps served by the backend."""
+
+API_KEY = "benchmark-api-key"
+"""API key accepted by the backend."""
+
+ENTITY_ID = "default"
+
+CREATED_AT = "2024-01-01T00:00:00+00:00"
+
+
+def _schema(name: str, app: str, payload_size: int) -> t.Dict:
+    """Action schema, padded to roughly `payload_size` bytes."""
+    return {
+        "name": name,
+        "display_name": name.replace("_", " ").title(),
+        "description": "x" * max(payload_size - 512, 0),
+        "appName": app,
+        "appId": app,
+        "tags": ["benchmark"],
+        "enabled": True,
+        "parameters": {
+            "title": "Request",
+            "type": "object",
+            "properties": {
+                "owner": {"type": "string", "description": "Owner"},
+                "repo": {"type": "string", "description": "Repository"},
+            },
+            "required": ["owner"],
+        },
+        "response": {
+            "title": "Response",
+            "type": "object",
+            "properties": {"data": {"type": "object"}},
+        },
+    }
+
+
+def _connected_account(app: str) -> t.Dict:
+    return {
+        "id": f"ca_{app}",
+        "status": "ACTIVE",
+        "createdAt": CREATED_AT,
+        "updatedAt": CREATED_AT,
+        "appUniqueId": app,
+        "appName": app,
+        "integrationId": f"int_{app}",
+        "connectionParams": {
+            "headers": {"Authorization": f"Bearer {app}-token"},
+        },
+        "clientUniqueUserId": ENTITY_ID,
+        "entityId": ENTITY_ID,
+    }
+
+
+class StandInBackend:
+    """
+    Threaded HTTP server implementing a subset of the Composio API.
+
+    Example:
+    ```python
+        with StandInBackend(latency=0.01, payload_size=4096) as backend:
+            toolset = ComposioToolSet(api_key=API_KEY, base_url=backend.base_url)
+            toolset.execute_action(...)
+            print (backend.requests)
+    ```
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        payload_size: int = 1024,
+        apps: t.Sequence[str] = DEFAULT_APPS,
+        actions_per_app: int = 50,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        :param latency: Seconds to wait before responding to a request
+        :param payload_size: Approximate size in bytes of action schemas and
+            execution responses
+        :param apps: Apps served by the backend, actions are picked from the
+            `Action` enum for these apps
+        :param actions_per_app: Maximum number of actions served per app
+        :param host: Host to bind to
+        :param port: Port to bind to, `0` picks a free port
+        """
+        self.latency = latency
+        self.payload_size = payload_size
+        self.apps = [app.lower() for app in apps]
+        self.actions = self._load_actions(actions_per_app=actions_per_app)
+        self.requests: t.Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: t.Optional[threading.Thread] = None
+
+    def _load_actions(self, actions_per_app: int) -> t.Dict[str, t.List[str]]:
+        from composio.client.enums import (  # pylint: disable=import-outside-toplevel
+            Action,
+        )
+
+        actions: t.Dict[str, t.List[str]] = {}
+        for app in self.apps:
+            prefix = f"{app.upper()}_"
+            actions[app] = [
+                name for name in Action.__annotations__ if name.startswith(prefix)
+            ][:actions_per_app]
+        return actions
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as `COMPOSIO_BASE_URL`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def app_of(self, action: str) -> t.Optional[str]:
+        """Get the app serving `action`."""
+        for app, actions in self.actions.items():
+            if action in actions:
+                return app
+        return None
+
+    def route(
+        self, method: str, path: str, queries: t.Dict[str, t.List[str]]
+    ) -> t.Tuple[int, t.Any]:
+        """Get status code and body for a request."""
+        parts = [part for part in path.split("/") if part][2:]
+        with self._lock:
+            self.requests[f"{method} /{'/'.join(parts[:1])}"] += 1
+
+        if parts == ["client", "auth", "client_info"]:
+            return 200, {"client": {"id": "benchmark"}}
+
+        if parts == ["connectedAccounts"]:
+            items = [_connected_account(app=app) for app in self.apps]
+            return 200, {"items": items, "page": 1, "totalPages": 1}
+
+        if len(parts) == 2 and parts[0] == "connectedAccounts":
+            for app in self.apps:
+                account = _connected_account(app=app)
+                if account["id"] == parts[1]:
+                    return 200, account
+            return 404, {"message": "Not Found"}
+
+        if len(parts) == 2 and parts[0] == "apps":
+            app = parts[1].lower()
+            if app not in self.apps:
+                return 404, {"message": "Not Found"}
+            return 200, {"name": app, "key": app, "no_auth": False}
+
+        if parts == ["actions"]:
+            apps = ",".join(queries.get("appNames", [])).split(",")
+            return 200, {
+                "items": [
+                    _schema(name=action, app=app, payload_size=self.payload_size)
+                    for app in apps
+                    for action in self.actions.get(app.lower(), [])
+                ]
+            }
+
+        if len(parts) in (2, 3) and parts[0] == "actions":
+            app = self.app_of(action=parts[1])
+            if app is None:
+                return 404, {"message": "Not Found"}
+            if len(parts) == 2:
+                return 200, _schema(
+                    name=parts[1], app=app, payload_size=self.payload_size
+                )
+            return 200, {
+                "data": {"payload": "x" * self.payload_size},
+                "error": None,
+                "successfull": True,
+            }
+
+        return 404, {"message": "Not Found"}
+
+    def _handler(self) -> t.Type[BaseHTTPRequestHandler]:
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > 0:
+                    self.rfile.read(length)
+
+                if backend.latency > 0:
+                    time.sleep(backend.latency)
+
+                url = urlparse(self.path)
+                if self.headers.get("x-api-key") != API_KEY:
+                    status, body = 401, {"message": "Unauthorized"}
+                else:
+                    status, body = backend.route(
+                        method=method,
+                        path=url.path,
+                        queries=parse_qs(url.query),
+                    )
+
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                self._respond(method="GET")
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                self._respond(method="POST")
+
+            def log_message(
+                self, format, *args
+            ) -> None:  # pylint: disable=redefined-builtin
+                pass
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        """Serve requests until stopped."""
+        self._server.serve_forever()
+
+    def start(self) -> "StandInBackend":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever,
+            name="composio-benchmark-backend",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInBackend":
+        return self.start()
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9900)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=1024)
+    parser.add_argument("--apps", default=",".join(DEFAULT_APPS))
+    args = parser.parse_args()
+
+    backend = StandInBackend(
+        latency=args.latency,
+        payload_size=args.payload_size,
+        apps=args.apps.split(","),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving on {backend.base_url}, use `{API_KEY}` as the API key")
+    try:
+        backend.serve_forever()
+    except KeyboardInterrupt:
+        backend.stop()
+
+
+if __name__ == "__main__":
+    main()
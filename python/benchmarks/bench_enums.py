@@ -0,0 +1,60 @@
+"""
+Benchmark loading enum metadata.
+
+Usage:
+    python -m benchmarks.bench_enums [--runs 20]
+"""
+
+import typing as t
+
+from benchmarks.harness import Config, Result, main, measure
+
+
+APPS = ("SHELLTOOL", "FILETOOL", "MATHEMATICAL")
+"""Local apps whose actions are loaded, these don't need the backend."""
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio.client.enums import Action, base
+
+    names = [
+        name
+        for name in Action.__annotations__
+        if any(name.startswith(f"{app}_") for app in APPS)
+    ]
+
+    def _load() -> None:
+        for name in names:
+            Action(name).load()
+
+    def _evict() -> None:
+        for name in names:
+            base._model_cache.pop(name, None)  # pylint: disable=protected-access
+
+    # Populate the metadata store
+    _load()
+    return [
+        measure(
+            name="enum.load.cold",
+            func=_load,
+            setup=_evict,
+            config=config,
+            ops=len(names),
+        ),
+        measure(
+            name="enum.load.warm",
+            func=_load,
+            config=config,
+            ops=len(names),
+        ),
+        measure(
+            name="enum.all.actions",
+            func=lambda: sum(1 for _ in Action.all()),
+            config=config,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
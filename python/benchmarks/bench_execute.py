@@ -0,0 +1,61 @@
+"""
+Benchmark executing local and remote actions.
+
+Remote actions are executed against the stand-in backend, use `--latency`
+and `--payload-size` to shape the responses.
+
+Usage:
+    python -m benchmarks.bench_execute [--runs 20] [--concurrency 8]
+"""
+
+import typing as t
+
+from benchmarks.backend import API_KEY, StandInBackend
+from benchmarks.harness import Config, Result, main, measure
+
+
+BATCH_SIZE = 32
+"""Number of actions per batch."""
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio import Action, ComposioToolSet
+
+    with StandInBackend(
+        latency=config.latency,
+        payload_size=config.payload_size,
+    ) as backend:
+        toolset = ComposioToolSet(api_key=API_KEY, base_url=backend.base_url)
+        action = Action(backend.actions["github"][0])
+        params = {"owner": "composiohq", "repo": "composio"}
+
+        batch = [(action, params)] * BATCH_SIZE
+        return [
+            measure(
+                name="execute.local",
+                func=lambda: toolset.execute_action(
+                    action=Action.MATHEMATICAL_CALCULATOR,
+                    params={"operation": "200*7"},
+                ),
+                config=config,
+            ),
+            measure(
+                name="execute.remote",
+                func=lambda: toolset.execute_action(action=action, params=params),
+                config=config,
+            ),
+            measure(
+                name="execute.remote.batch",
+                func=lambda: toolset.execute_actions(
+                    calls=batch,
+                    concurrency=config.concurrency,
+                ),
+                config=config,
+                ops=BATCH_SIZE,
+            ),
+        ]
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
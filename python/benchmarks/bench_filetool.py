@@ -0,0 +1,89 @@
+"""
+Benchmark file tool actions on a generated project.
+
+Usage:
+    python -m benchmarks.bench_filetool [--runs 20]
+"""
+
+import tempfile
+import typing as t
+from pathlib import Path
+
+from benchmarks.backend import API_KEY, StandInBackend
+from benchmarks.harness import Config, Result, main, measure
+
+
+NUM_FILES = 200
+"""Number of files in the generated project."""
+
+LINES_PER_FILE = 200
+"""Number of lines per generated file."""
+
+
+def _generate(root: Path) -> None:
+    for idx in range(NUM_FILES):
+        package = root / f"package_{idx % 10}"
+        package.mkdir(exist_ok=True)
+        (package / f"module_{idx}.py").write_text(
+            "".join(
+                f"def function_{idx}_{line}():\n    return {line}\n"
+                for line in range(LINES_PER_FILE // 2)
+            ),
+            encoding="utf-8",
+        )
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio import Action, ComposioToolSet
+
+    with tempfile.TemporaryDirectory(
+        prefix="composio-bench-"
+    ) as tmp, StandInBackend() as backend:
+        root = Path(tmp)
+        _generate(root=root)
+
+        toolset = ComposioToolSet(api_key=API_KEY, base_url=backend.base_url)
+        toolset.execute_action(
+            action=Action.FILETOOL_CHANGE_WORKING_DIRECTORY,
+            params={"path": str(root)},
+        )
+
+        def _execute(action: Action, params: t.Dict) -> t.Callable[[], t.Dict]:
+            return lambda: toolset.execute_action(action=action, params=params)
+
+        return [
+            measure(
+                name="filetool.open",
+                func=_execute(
+                    Action.FILETOOL_OPEN_FILE,
+                    {"file_path": "package_0/module_0.py", "line_number": 100},
+                ),
+                config=config,
+            ),
+            measure(
+                name="filetool.write",
+                func=_execute(
+                    Action.FILETOOL_WRITE,
+                    {"file_path": "scratch.py", "text": "x = 1\n" * LINES_PER_FILE},
+                ),
+                config=config,
+            ),
+            measure(
+                name="filetool.find",
+                func=_execute(Action.FILETOOL_FIND_FILE, {"pattern": "module_1*.py"}),
+                config=config,
+            ),
+            measure(
+                name="filetool.search",
+                func=_execute(
+                    Action.FILETOOL_SEARCH_WORD,
+                    {"word": "function_7_", "pattern": "*.py"},
+                ),
+                config=config,
+            ),
+        ]
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
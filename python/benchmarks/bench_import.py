@@ -0,0 +1,108 @@
+"""
+Benchmark import time for the SDK and loading the local tools.
+
+Every sample runs in a fresh interpreter so module caches don't leak between
+runs, and import times are read from `python -X importtime` so the time spent
+importing the enum modules is reported separately from the rest of the SDK.
+
+`COMPOSIO_LAZY_ENUMS` only changes the time spent in the enum modules, which
+are a small part of `import composio`. The `import.composio.*` cases are
+expected to be within noise of each other and are kept to track the total.
+
+Usage:
+    python -m benchmarks.bench_import [--runs 10]
+"""
+
+import os
+import subprocess
+import sys
+import typing as t
+
+from benchmarks.harness import Config, Result, main, summarise
+
+
+MODES = {
+    "eager": "false",
+    "lazy": "true",
+}
+
+ENUM_MODULES = (
+    "composio.client.enums._action",
+    "composio.client.enums._app",
+    "composio.client.enums._tag",
+    "composio.client.enums._trigger",
+)
+
+LOAD_LOCAL_TOOLS = (
+    "import time\n"
+    "from composio.tools.local import load_local_tools\n"
+    "start = time.perf_counter()\n"
+    "load_local_tools()\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def measure(lazy: str) -> t.Tuple[float, float]:
+    """
+    Import `composio` in a fresh interpreter.
+
+    :return: Tuple of time spent importing the enum modules and time spent
+        importing `composio` in seconds.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import composio"],
+        env={**os.environ, "COMPOSIO_LAZY_ENUMS": lazy},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
+    ).stderr.decode()
+
+    enums = total = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name.strip()
+        if name in ENUM_MODULES:
+            enums += int(cumulative)
+        if name == "composio":
+            total = int(cumulative)
+    return enums / 1e6, total / 1e6
+
+
+def measure_local_tools() -> float:
+    """Time a cold `load_local_tools()` call in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", LOAD_LOCAL_TOOLS],
+        env=os.environ,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    ).stdout.decode()
+    return float(output.split()[0])
+
+
+def run(config: Config) -> t.List[Result]:
+    results = []
+    for mode, lazy in MODES.items():
+        samples = [measure(lazy=lazy) for _ in range(config.runs)]
+        results.append(
+            summarise(name=f"import.enums.{mode}", samples=[s for s, _ in samples])
+        )
+        results.append(
+            summarise(name=f"import.composio.{mode}", samples=[s for _, s in samples])
+        )
+
+    results.append(
+        summarise(
+            name="load_local_tools.cold",
+            samples=[measure_local_tools() for _ in range(config.runs)],
+        )
+    )
+    return results
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
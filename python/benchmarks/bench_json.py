@@ -0,0 +1,90 @@
+"""
+Benchmark the JSON codec on large action responses.
+
+Compares `composio.utils.codec` against the standard library, the cases
+report throughput in operations per second.
+
+Usage:
+    python -m benchmarks.bench_json [--runs 20]
+"""
+
+import json
+import typing as t
+
+from benchmarks.harness import Config, Result, main, measure
+
+
+NUM_ITEMS = 5000
+"""Number of items in the generated response, roughly 1MB of JSON."""
+
+OPS = 10
+"""Number of encode or decode operations per sample."""
+
+
+def _response() -> t.Dict:
+    """Generate a large action response."""
+    items = [
+        {
+            "id": idx,
+            "title": f"Issue {idx} with a reasonably long title ✓",
+            "state": "open" if idx % 2 else "closed",
+            "labels": [{"name": "bug", "color": "d73a4a"}],
+            "score": idx * 0.5,
+            "draft": False,
+            "assignee": None,
+        }
+        for idx in range(NUM_ITEMS)
+    ]
+    return {"data": {"items": items}, "error": None, "successful": True}
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio.utils import codec
+
+    data = _response()
+    encoded = json.dumps(data).encode("utf-8")
+
+    def _repeat(func: t.Callable[[], t.Any]) -> t.Callable[[], None]:
+        def _run() -> None:
+            for _ in range(OPS):
+                func()
+
+        return _run
+
+    return [
+        measure(
+            name="json.loads.stdlib",
+            func=_repeat(lambda: json.loads(encoded)),
+            config=config,
+            ops=OPS,
+        ),
+        measure(
+            name=f"json.loads.{codec.BACKEND}",
+            func=_repeat(lambda: codec.loads(encoded)),
+            config=config,
+            ops=OPS,
+        ),
+        measure(
+            name="json.dumps.stdlib",
+            func=_repeat(lambda: json.dumps(data)),
+            config=config,
+            ops=OPS,
+        ),
+        measure(
+            name=f"json.dumps.{codec.BACKEND}",
+            func=_repeat(lambda: codec.dumps(data)),
+            config=config,
+            ops=OPS,
+        ),
+        measure(
+            name="json.dumps.stdlib.indent",
+            func=_repeat(lambda: json.dumps(data, indent=2)),
+            config=config,
+            ops=OPS,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
@@ -0,0 +1,68 @@
+"""
+Benchmark retrieving tool schemas.
+
+Remote schemas are served by the stand-in backend, use `--latency` and
+`--payload-size` to shape the responses.
+
+Usage:
+    python -m benchmarks.bench_schemas [--runs 20] [--latency 0.05]
+"""
+
+import typing as t
+
+from benchmarks.backend import API_KEY, StandInBackend
+from benchmarks.harness import Config, Result, main, measure
+
+
+NUM_ACTIONS = 10
+"""Number of remote actions to request schemas for."""
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio import App, ComposioToolSet
+    from composio.client.httpcache import http_cache
+
+    with StandInBackend(
+        latency=config.latency,
+        payload_size=config.payload_size,
+    ) as backend:
+        toolset = ComposioToolSet(api_key=API_KEY, base_url=backend.base_url)
+        actions = backend.actions["github"][:NUM_ACTIONS]
+
+        def _invalidate_memory() -> None:
+            toolset.client.actions.invalidate_cache()
+            toolset.schema_cache.invalidate()
+
+        def _invalidate() -> None:
+            _invalidate_memory()
+            http_cache.invalidate()
+
+        return [
+            measure(
+                name="schemas.remote.cold",
+                func=lambda: toolset.get_action_schemas(actions=actions),
+                setup=_invalidate,
+                config=config,
+            ),
+            measure(
+                name="schemas.remote.http_cache",
+                func=lambda: toolset.get_action_schemas(actions=actions),
+                setup=_invalidate_memory,
+                config=config,
+            ),
+            measure(
+                name="schemas.remote.warm",
+                func=lambda: toolset.get_action_schemas(actions=actions),
+                config=config,
+            ),
+            measure(
+                name="schemas.local",
+                func=lambda: toolset.get_action_schemas(apps=[App.FILETOOL]),
+                config=config,
+            ),
+        ]
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
@@ -0,0 +1,41 @@
+"""
+Benchmark command latency on the host shell.
+
+Usage:
+    python -m benchmarks.bench_shell [--runs 20]
+"""
+
+import typing as t
+
+from benchmarks.harness import Config, Result, main, measure
+
+
+OUTPUT_LINES = 1000
+"""Number of lines printed by the large output case."""
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio.tools.env.host.shell import HostShell
+
+    shell = HostShell()
+    shell.setup()
+    try:
+        return [
+            measure(
+                name="shell.exec.echo",
+                func=lambda: shell.exec(cmd="echo composio"),
+                config=config,
+            ),
+            measure(
+                name="shell.exec.output",
+                func=lambda: shell.exec(cmd=f"seq {OUTPUT_LINES}"),
+                config=config,
+            ),
+        ]
+    finally:
+        shell.teardown()
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
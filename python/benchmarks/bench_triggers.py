@@ -0,0 +1,98 @@
+"""
+Benchmark dispatching trigger events to callbacks.
+
+Events are fed to a subscription with a few hundred registered callbacks,
+the cases report throughput in events per second.
+
+Usage:
+    python -m benchmarks.bench_triggers [--runs 20] [--concurrency 8]
+"""
+
+import json
+import typing as t
+
+from benchmarks.harness import Config, Result, main, measure
+
+
+NUM_EVENTS = 1000
+"""Number of events dispatched per sample."""
+
+NUM_APPS = 50
+"""Number of apps with registered callbacks."""
+
+
+def _event(app: str, idx: int) -> str:
+    return json.dumps(
+        {
+            "appName": app,
+            "payload": {"idx": idx, "text": "x" * 256},
+            "originalPayload": {},
+            "metadata": {
+                "id": f"trigger_{idx % 10}",
+                "connectionId": "ca_1",
+                "triggerName": f"{app.upper()}_EVENT",
+                "triggerData": "",
+                "triggerConfig": {},
+                "connection": {
+                    "id": "ca_1",
+                    "integrationId": "integration",
+                    "clientUniqueUserId": "default",
+                    "status": "ACTIVE",
+                },
+            },
+        }
+    )
+
+
+def run(config: Config) -> t.List[Result]:
+    # pylint: disable=import-outside-toplevel
+    from composio.client.collections import TriggerEventData, TriggerSubscription
+
+    subscription = TriggerSubscription(workers=config.concurrency)
+
+    def _callback(_: TriggerEventData) -> None:
+        pass
+
+    for idx in range(NUM_APPS):
+        for trigger in range(4):
+            subscription.callback(
+                filters={
+                    "app_name": f"app_{idx}",
+                    "trigger_name": f"APP_{idx}_EVENT",
+                    "trigger_id": f"trigger_{trigger}",
+                }
+            )(_callback)
+    subscription.callback(filters={"app_name": "app_0"})(_callback)
+
+    events = [_event(app=f"app_{idx % NUM_APPS}", idx=idx) for idx in range(NUM_EVENTS)]
+
+    def _dispatch() -> None:
+        futures = [subscription.dispatch_event(event) for event in events]
+        for future in futures:
+            future.result()
+
+    def _handle() -> None:
+        for event in events:
+            subscription.handle_event(event)
+
+    try:
+        return [
+            measure(
+                name="triggers.dispatch",
+                func=_dispatch,
+                config=config,
+                ops=NUM_EVENTS,
+            ),
+            measure(
+                name="triggers.handle",
+                func=_handle,
+                config=config,
+                ops=NUM_EVENTS,
+            ),
+        ]
+    finally:
+        subscription.close()
+
+
+if __name__ == "__main__":
+    main(run=run, description=__doc__)
@@ -0,0 +1,84 @@
+"""
+Compare two benchmark result files.
+
+Exits with a non-zero status if any case got slower than the threshold.
+
+Usage:
+    python -m benchmarks.compare base.json head.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+import typing as t
+from pathlib import Path
+
+
+DEFAULT_THRESHOLD = 0.1
+"""Relative change in the median above which a case is a regression."""
+
+
+class Change(t.NamedTuple):
+    """Change in the median for a benchmark case."""
+
+    name: str
+    base: t.Optional[float]
+    head: t.Optional[float]
+
+    @property
+    def ratio(self) -> t.Optional[float]:
+        if self.base is None or self.head is None or self.base == 0:
+            return None
+        return self.head / self.base - 1
+
+
+def _load(path: Path) -> t.Dict[str, float]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {result["name"]: result["median"] for result in data["results"]}
+
+
+def compare(base: Path, head: Path) -> t.List[Change]:
+    """Compare medians for the cases in two result files."""
+    _base, _head = _load(path=base), _load(path=head)
+    return [
+        Change(name=name, base=_base.get(name), head=_head.get(name))
+        for name in sorted(set(_base) | set(_head))
+    ]
+
+
+def _ms(value: t.Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    regressions = []
+    print(f"{'case':<40} {'base':>10} {'head':>10} {'change':>8}")
+    for change in compare(base=args.base, head=args.head):
+        ratio = change.ratio
+        marker = ""
+        if ratio is not None and ratio > args.threshold:
+            marker = " !"
+            regressions.append(change)
+        print(
+            f"{change.name:<40} {_ms(change.base):>10} {_ms(change.head):>10} "
+            f"{'-' if ratio is None else f'{ratio:+.1%}':>8}{marker}"
+        )
+
+    if len(regressions) > 0:
+        print(
+            f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Benchmark harness.
+
+Times benchmark cases, summarises the samples and writes the results as JSON
+so they can be compared across commits using `benchmarks.compare`.
+
+The harness does not import `composio`, call `isolate` before importing the
+SDK so benchmarks run against a throwaway cache directory.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+import typing_extensions as te
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+"""Default directory for result files."""
+
+SCHEMA_VERSION = 1
+
+
+class Config(t.NamedTuple):
+    """Benchmark configuration."""
+
+    runs: int = 20
+    """Number of timed samples per case."""
+
+    warmup: int = 2
+    """Number of untimed runs before sampling."""
+
+    latency: float = 0.0
+    """Latency of the stand-in backend in seconds."""
+
+    payload_size: int = 1024
+    """Payload size of the stand-in backend in bytes."""
+
+    concurrency: int = 8
+    """Concurrency for batch execution cases."""
+
+
+class Result(te.TypedDict):
+    """Summary of the samples for a benchmark case."""
+
+    name: str
+    runs: int
+    ops: int
+    min: float
+    median: float
+    mean: float
+    p95: float
+    stdev: float
+    throughput: float
+    """Operations per second at the median."""
+
+
+def summarise(name: str, samples: t.Sequence[float], ops: int = 1) -> Result:
+    """
+    Summarise timing samples.
+
+    :param name: Name of the benchmark case
+    :param samples: Time in seconds for each sample
+    :param ops: Number of operations per sample
+    :return: Result summary
+    """
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        "name": name,
+        "runs": len(ordered),
+        "ops": ops,
+        "min": ordered[0],
+        "median": median,
+        "mean": statistics.fmean(ordered),
+        "p95": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "throughput": ops / median if median > 0 else 0.0,
+    }
+
+
+def measure(
+    name: str,
+    func: t.Callable[[], t.Any],
+    config: Config,
+    setup: t.Optional[t.Callable[[], t.Any]] = None,
+    ops: int = 1,
+) -> Result:
+    """
+    Time `func`.
+
+    :param name: Name of the benchmark case
+    :param func: Function to time
+    :param config: Benchmark configuration
+    :param setup: Function to call before every run, not included in the time
+    :param ops: Number of operations performed by a single call to `func`
+    :return: Result summary
+    """
+    for _ in range(config.warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    samples = []
+    for _ in range(config.runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarise(name=name, samples=samples, ops=ops)
+
+
+def isolate() -> Path:
+    """
+    Point the SDK at a temporary home directory.
+
+    Needs to be called before `composio` is imported, returns the new home
+    directory.
+    """
+    home = Path(tempfile.mkdtemp(prefix="composio-bench-"))
+    os.environ["HOME"] = str(home)
+    os.environ["COMPOSIO_DISABLE_VERSION_CHECK"] = "true"
+    os.environ["COMPOSIO_LOGGING_LEVEL"] = "error"
+    return home
+
+
+def environment() -> t.Dict[str, t.Any]:
+    """Describe the environment the results were recorded in."""
+    try:
+        commit = (
+            subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                check=True,
+                cwd=Path(__file__).parent,
+            )
+            .stdout.decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.time(),
+    }
+
+
+def report(results: t.Sequence[Result]) -> str:
+    """Format results as a table."""
+    lines = [
+        f"{'case':<40} {'median':>10} {'p95':>10} {'ops/s':>12}",
+    ]
+    for result in results:
+        lines.append(
+            f"{result['name']:<40} "
+            f"{result['median'] * 1000:>8.2f}ms "
+            f"{result['p95'] * 1000:>8.2f}ms "
+            f"{result['throughput']:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def write(
+    path: Path,
+    results: t.Sequence[Result],
+    config: Config,
+) -> None:
+    """Write results as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "version": SCHEMA_VERSION,
+                "environment": environment(),
+                "config": config._asdict(),
+                "results": list(results),
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+def parser(description: t.Optional[str]) -> argparse.ArgumentParser:
+    """Argument parser with the common benchmark options."""
+    defaults = Config()
+    parser_ = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser_.add_argument("--runs", type=int, default=defaults.runs)
+    parser_.add_argument("--warmup", type=int, default=defaults.warmup)
+    parser_.add_argument("--latency", type=float, default=defaults.latency)
+    parser_.add_argument("--payload-size", type=int, default=defaults.payload_size)
+    parser_.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser_.add_argument("--output", type=Path, help="Write results as JSON")
+    return parser_
+
+
+def config_from(args: argparse.Namespace) -> Config:
+    return Config(
+        runs=args.runs,
+        warmup=args.warmup,
+        latency=args.latency,
+        payload_size=args.payload_size,
+        concurrency=args.concurrency,
+    )
+
+
+def main(
+    run: t.Callable[[Config], t.List[Result]],
+    description: t.Optional[str] = None,
+) -> None:
+    """Command line entry point for a single benchmark module."""
+    args = parser(description=description).parse_args()
+    config = config_from(args=args)
+    isolate()
+    results = run(config)
+    print(report(results=results), file=sys.stderr)
+    if args.output is not None:
+        write(path=args.output, results=results, config=config)
@@ -0,0 +1,64 @@
+"""
+Run the benchmark suite.
+
+Runs every `bench_*` module in this directory against a throwaway cache
+directory and the local stand-in backend, and writes the results as JSON.
+Compare two result files using `python -m benchmarks.compare`.
+
+Usage:
+    python -m benchmarks.run [-k execute] [--runs 20] [--latency 0.05]
+"""
+
+import importlib
+import sys
+import typing as t
+from pathlib import Path
+
+from benchmarks.harness import (
+    RESULTS_DIR,
+    Result,
+    config_from,
+    environment,
+    isolate,
+    parser,
+    report,
+    write,
+)
+
+
+def discover() -> t.List[str]:
+    """Get names of the benchmark modules."""
+    return sorted(path.stem for path in Path(__file__).parent.glob("bench_*.py"))
+
+
+def main() -> None:
+    parser_ = parser(description=__doc__)
+    parser_.add_argument(
+        "-k",
+        dest="select",
+        action="append",
+        default=[],
+        help="Only run modules containing this string, can be repeated",
+    )
+    args = parser_.parse_args()
+    config = config_from(args=args)
+
+    isolate()
+    results: t.List[Result] = []
+    for name in discover():
+        if args.select and not any(select in name for select in args.select):
+            continue
+        print(f"Running {name}", file=sys.stderr)
+        module = importlib.import_module(f"benchmarks.{name}")
+        results += module.run(config)
+
+    print(report(results=results), file=sys.stderr)
+    output = args.output
+    if output is None:
+        output = RESULTS_DIR / f"{(environment()['commit'] or 'local')[:12]}.json"
+    write(path=output, results=results, config=config)
+    print(f"Results written to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
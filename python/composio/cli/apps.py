@@ -18,6 +18,7 @@ from composio.cli.utils.helpfulcmd import HelpfulCmdBase
 from composio.client import enums
 from composio.client.collections import ActionModel, AppModel, TriggerModel
 from composio.core.cls.did_you_mean import DYMGroup
+from composio.storage.base import LocalStorage
 from composio.tools.local import load_local_tools
 from composio.utils import get_enum_key
 
@@ -114,40 +115,43 @@ def update(context: Context, beta: bool = False) -> None:
         actions = filter_non_beta_items(actions)
         triggers = filter_non_beta_items(triggers)
 
-    _update_apps(apps=apps)
-    _update_tags(apps=apps, actions=actions)
-    _update_actions(apps=apps, actions=actions)
-    _update_triggers(apps=apps, triggers=triggers)
+    metadata: t.List[LocalStorage] = []
+    _update_apps(apps=apps, metadata=metadata)
+    _update_tags(apps=apps, actions=actions, metadata=metadata)
+    _update_actions(apps=apps, actions=actions, metadata=metadata)
+    _update_triggers(apps=apps, triggers=triggers, metadata=metadata)
+    enums.base.update_metadata(items=metadata)
 
 
-def _update_apps(apps: t.List[AppModel]) -> None:
+def _update_apps(apps: t.List[AppModel], metadata: t.List[LocalStorage]) -> None:
     """Create App enum class."""
     app_names = []
-    enums.base.APPS_CACHE.mkdir(
-        exist_ok=True,
-    )
     for app in apps:
         app_names.append(
             get_enum_key(
                 name=app.key.lower().replace(" ", "_").replace("-", "_"),
             )
         )
-        enums.base.AppData(
-            name=app.name,
-            path=enums.base.APPS_CACHE / app_names[-1],
-            is_local=False,
-        ).store()
+        metadata.append(
+            enums.base.AppData(
+                name=app.name,
+                path=enums.base.APPS_CACHE / app_names[-1],
+                is_local=False,
+            )
+        )
 
     for tool in load_local_tools()["local"].values():
         if tool.enum in app_names:
             continue
 
         app_names.append(tool.enum)
-        enums.base.AppData(
-            name=tool.name,
-            path=enums.base.APPS_CACHE / app_names[-1],
-            is_local=True,
-        ).store()
+        metadata.append(
+            enums.base.AppData(
+                name=tool.name,
+                path=enums.base.APPS_CACHE / app_names[-1],
+                is_local=True,
+            )
+        )
 
     _update_annotations(
         cls=enums.App,
@@ -155,9 +159,12 @@ def _update_apps(apps: t.List[AppModel]) -> None:
     )
 
 
-def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
+def _update_actions(
+    apps: t.List[AppModel],
+    actions: t.List[ActionModel],
+    metadata: t.List[LocalStorage],
+) -> None:
     """Get Action enum."""
-    enums.base.ACTIONS_CACHE.mkdir(exist_ok=True)
     deprecated = {}
     action_names = []
     for app in sorted(apps, key=lambda x: x.key):
@@ -176,14 +183,16 @@ def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> Non
             else:
                 action_names.append(get_enum_key(name=action.name))
 
-            enums.base.ActionData(
-                name=action.name,
-                app=app.key,
-                tags=action.tags,
-                no_auth=app.no_auth,
-                is_local=False,
-                path=enums.base.ACTIONS_CACHE / get_enum_key(name=action.name),
-            ).store()
+            metadata.append(
+                enums.base.ActionData(
+                    name=action.name,
+                    app=app.key,
+                    tags=action.tags,
+                    no_auth=app.no_auth,
+                    is_local=False,
+                    path=enums.base.ACTIONS_CACHE / get_enum_key(name=action.name),
+                )
+            )
 
     processed = []
     for tool in load_local_tools()["local"].values():
@@ -193,15 +202,17 @@ def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> Non
         processed.append(tool.name)
         for actcls in tool.actions():
             action_names.append(actcls.enum)
-            enums.base.ActionData(
-                name=actcls.enum,
-                app=tool.name,
-                tags=actcls.tags(),
-                no_auth=True,
-                is_local=True,
-                path=enums.base.ACTIONS_CACHE / action_names[-1],
-                shell=False,
-            ).store()
+            metadata.append(
+                enums.base.ActionData(
+                    name=actcls.enum,
+                    app=tool.name,
+                    tags=actcls.tags(),
+                    no_auth=True,
+                    is_local=True,
+                    path=enums.base.ACTIONS_CACHE / action_names[-1],
+                    shell=False,
+                )
+            )
 
     _update_annotations(
         cls=enums.Action,
@@ -210,9 +221,12 @@ def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> Non
     )
 
 
-def _update_tags(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
+def _update_tags(
+    apps: t.List[AppModel],
+    actions: t.List[ActionModel],
+    metadata: t.List[LocalStorage],
+) -> None:
     """Create Tag enum class."""
-    enums.base.TAGS_CACHE.mkdir(exist_ok=True)
     tag_map: t.Dict[str, t.Set[str]] = {}
     for app in apps:
         app_name = app.key
@@ -226,16 +240,20 @@ def _update_tags(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
         for tag in sorted(tag_map[app_name]):
             tag_name = get_enum_key(name=f"{app_name}_{tag}")
             tag_names.append(tag_name)
-            enums.base.TagData(
-                app=app_name,
-                value=tag,
-                path=enums.base.TAGS_CACHE / tag_names[-1],
-            ).store()
-
-    enums.base.TagData(
-        app="default",
-        value="important",
-        path=enums.base.TAGS_CACHE / "DEFAULT",
+            metadata.append(
+                enums.base.TagData(
+                    app=app_name,
+                    value=tag,
+                    path=enums.base.TAGS_CACHE / tag_names[-1],
+                )
+            )
+
+    metadata.append(
+        enums.base.TagData(
+            app="default",
+            value="important",
+            path=enums.base.TAGS_CACHE / "DEFAULT",
+        )
     )
     _update_annotations(
         cls=enums.Tag,
@@ -246,21 +264,23 @@ def _update_tags(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
 def _update_triggers(
     apps: t.List[AppModel],
     triggers: t.List[TriggerModel],
+    metadata: t.List[LocalStorage],
 ) -> None:
     """Get Trigger enum."""
     trigger_names = []
-    enums.base.TRIGGERS_CACHE.mkdir(exist_ok=True)
     for app in apps:
         for trigger in triggers:
             if trigger.appKey != app.key:
                 continue
 
             trigger_names.append(get_enum_key(name=trigger.name).upper())
-            enums.base.TriggerData(
-                name=trigger.name,
-                app=app.key,
-                path=enums.base.TRIGGERS_CACHE / trigger_names[-1],
-            ).store()
+            metadata.append(
+                enums.base.TriggerData(
+                    name=trigger.name,
+                    app=app.key,
+                    path=enums.base.TRIGGERS_CACHE / trigger_names[-1],
+                )
+            )
 
     _update_annotations(
         cls=enums.Trigger,
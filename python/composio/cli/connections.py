@@ -37,7 +37,7 @@ def _connections(context: Context, active: bool = False) -> None:
     if context.click_ctx.invoked_subcommand:
         return
 
-    for connection in context.client.connected_accounts.get(active=active):
+    for connection in context.client.connected_accounts.iterate(active=active):
         context.console.print(f"• Id : {connection.id}")
         context.console.print(f"  App: {connection.appUniqueId}")
 
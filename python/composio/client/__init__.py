@@ -4,6 +4,7 @@
 Composio SDK client.
 """
 
+import asyncio
 import os
 import typing as t
 from datetime import datetime
@@ -11,8 +12,10 @@ from pathlib import Path
 
 import requests
 
-from composio.client.base import BaseClient
+from composio.client.aio import AsyncActions, AsyncApps, AsyncConnectedAccounts
+from composio.client.base import BaseClient, single_flight
 from composio.client.collections import (
+    CONNECTION_RESOLUTION_NEGATIVE_TTL,
     Actions,
     ActiveTriggerModel,
     ActiveTriggers,
@@ -35,7 +38,7 @@ from composio.client.enums import (
     TriggerType,
 )
 from composio.client.exceptions import ComposioClientError, HTTPError, NoItemsFound
-from composio.client.http import HttpClient
+from composio.client.http import AsyncHttpClient, HttpClient
 from composio.constants import (
     DEFAULT_ENTITY_ID,
     ENV_COMPOSIO_API_KEY,
@@ -44,6 +47,7 @@ from composio.constants import (
 )
 from composio.exceptions import ApiKeyNotProvidedError
 from composio.storage.user import UserData
+from composio.utils import codec
 from composio.utils.url import get_api_url_base
 
 
@@ -51,6 +55,21 @@ _valid_keys: t.Set[str] = set()
 _clients: t.List["Composio"] = []
 
 
+def _read_api_key() -> t.Optional[str]:
+    """Read API key from the user data file or the environment."""
+    cache_dir = Path.home() / LOCAL_CACHE_DIRECTORY_NAME
+    user_data_path = cache_dir / USER_DATA_FILE_NAME
+    user_data = (
+        UserData.load(path=user_data_path)
+        if user_data_path.exists() else None
+    )
+    return (
+        (user_data.api_key if user_data else None)
+        or os.environ.get(ENV_COMPOSIO_API_KEY)
+        or None
+    )
+
+
 class Composio(BaseClient):
     """Composio SDK Client."""
 
@@ -92,18 +111,7 @@ class Composio(BaseClient):
     @property
     def api_key(self) -> str:
         if self._api_key is None:
-            cache_dir = Path.home() / LOCAL_CACHE_DIRECTORY_NAME
-            user_data_path = cache_dir / USER_DATA_FILE_NAME
-            user_data = (
-                UserData.load(path=user_data_path)
-                if user_data_path.exists() else None
-            )
-            env_api_key = (
-                (user_data.api_key if user_data else None)
-                or os.environ.get(ENV_COMPOSIO_API_KEY)
-            )
-            if env_api_key:
-                self._api_key = env_api_key
+            self._api_key = _read_api_key()
 
         if self._api_key is None:
             raise ApiKeyNotProvidedError()
@@ -135,26 +143,41 @@ class Composio(BaseClient):
 
     @staticmethod
     def validate_api_key(key: str, base_url: t.Optional[str] = None) -> str:
-        """Validate given API key."""
+        """
+        Validate given API key.
+
+        Concurrent validations of the same key are merged into one request.
+        """
         if key in _valid_keys:
             return key
 
-        base_url = base_url or get_api_url_base()
-        response = requests.get(
-            url=base_url + str(v1 / "client" / "auth" / "client_info"),
-            headers={
-                "x-api-key": key,
-            },
-            timeout=60,
+        url = (base_url or get_api_url_base()) + str(
+            v1 / "client" / "auth" / "client_info"
         )
-        if response.status_code in (401, 403):
-            raise ComposioClientError("API Key is not valid!")
 
-        if response.status_code != 200:
-            raise ComposioClientError(f"Unexpected error: HTTP {response.status_code}")
+        def _validate() -> str:
+            response = requests.get(
+                url=url,
+                headers={
+                    "x-api-key": key,
+                },
+                timeout=60,
+            )
+            if response.status_code in (401, 403):
+                raise ComposioClientError("API Key is not valid!")
 
-        _valid_keys.add(key)
-        return key
+            if response.status_code != 200:
+                raise ComposioClientError(
+                    f"Unexpected error: HTTP {response.status_code}"
+                )
+
+            _valid_keys.add(key)
+            return key
+
+        return single_flight.do(
+            key=("validate_api_key", url, key),
+            func=_validate,
+        )
 
     @staticmethod
     def generate_auth_key(base_url: t.Optional[str] = None) -> str:
@@ -169,7 +192,7 @@ class Composio(BaseClient):
                 message=response.content.decode(),
                 status_code=response.status_code,
             )
-        data = response.json()
+        data = codec.loads(response.content)
         return data["key"]
 
     @staticmethod
@@ -194,7 +217,7 @@ class Composio(BaseClient):
                 message=response.content.decode(),
                 status_code=response.status_code,
             )
-        data = response.json()
+        data = codec.loads(response.content)
         return data["apiKey"]
 
     def get_entity(self, id: str = DEFAULT_ENTITY_ID) -> "Entity":
@@ -207,6 +230,37 @@ class Composio(BaseClient):
         return Entity(id=id, client=self)
 
 
+def _get_latest_connection(
+    connected_accounts: t.Iterable[ConnectedAccountModel],
+    app: str,
+) -> t.Optional[ConnectedAccountModel]:
+    """Get most recently created connected account for the app."""
+    latest_account = None
+    latest_creation_date = datetime.fromtimestamp(0.0)
+    for connected_account in connected_accounts:
+        if app == connected_account.appUniqueId:
+            creation_date = datetime.fromisoformat(
+                connected_account.createdAt.replace("Z", "+00:00")
+            )
+            if latest_account is None or creation_date > latest_creation_date:
+                latest_creation_date = creation_date
+                latest_account = connected_account
+    return latest_account
+
+
+def _no_connection_found(
+    entity_id: str,
+    app: str,
+    connected_account_id: t.Optional[str] = None,
+) -> NoItemsFound:
+    """Error for entity/app pairs without a connected account."""
+    return NoItemsFound(
+        f"Could not find a connection with app='{app}',"
+        f"connected_account_id=`{connected_account_id}` and "
+        f"entity=`{entity_id}`"
+    )
+
+
 class Entity:
     """Class to represent Entity object."""
 
@@ -273,33 +327,50 @@ class Entity:
         :return: Connected account object
         :raises: If no connected account found for given entity ID
         """
+        app = str(app).lower() if app is not None else ""
+        cache = self.client.connected_accounts.resolutions
+        key = (self.id, app, connected_account_id)
+        cached = cache.get(key)
+        if cached is ConnectedAccounts.NO_CONNECTION:
+            raise _no_connection_found(
+                entity_id=self.id,
+                app=app,
+                connected_account_id=connected_account_id,
+            )
+
+        # Copied, so callers mutating the result do not corrupt the cache
+        if cached is not None:
+            return t.cast(ConnectedAccountModel, cached).model_copy(deep=True)
+
         if connected_account_id is not None:
-            return self.client.connected_accounts.get(
+            account = self.client.connected_accounts.get(
                 connection_id=connected_account_id
             )
-
-        latest_account = None
-        latest_creation_date = datetime.fromtimestamp(0.0)
-        connected_accounts = self.client.connected_accounts.get(
-            entity_ids=[self.id],
-            active=True,
+            cache.set(key, account.model_copy(deep=True))
+            return account
+
+        latest_account = _get_latest_connection(
+            connected_accounts=self.client.connected_accounts.iterate(
+                entity_ids=[self.id],
+                active=True,
+                apps=[app] if app else None,
+                where=lambda account: account.get("appUniqueId") == app,
+            ),
+            app=app,
         )
-        app = str(app).lower()
-        for connected_account in connected_accounts:
-            if app == connected_account.appUniqueId:
-                creation_date = datetime.fromisoformat(
-                    connected_account.createdAt.replace("Z", "+00:00")
-                )
-                if latest_account is None or creation_date > latest_creation_date:
-                    latest_creation_date = creation_date
-                    latest_account = connected_account
-
         if latest_account is None:
-            raise NoItemsFound(
-                f"Could not find a connection with app='{app}',"
-                f"connected_account_id=`{connected_account_id}` and "
-                f"entity=`{self.id}`"
+            cache.set(
+                key,
+                ConnectedAccounts.NO_CONNECTION,
+                ttl=CONNECTION_RESOLUTION_NEGATIVE_TTL,
+            )
+            raise _no_connection_found(
+                entity_id=self.id,
+                app=app,
+                connected_account_id=connected_account_id,
             )
+
+        cache.set(key, latest_account.model_copy(deep=True))
         return latest_account
 
     def get_connections(self) -> t.List[ConnectedAccountModel]:
@@ -396,6 +467,226 @@ class Entity:
         )
 
 
+class AsyncComposio(BaseClient):
+    """
+    Composio SDK client for `asyncio` runtimes.
+
+    The HTTP session is bound to the running event loop, so the client needs
+    to be used from within a coroutine. Unlike `Composio`, the API key is not
+    validated eagerly, an invalid key surfaces as an `HTTPError` on the first
+    request.
+    """
+
+    _api_key: t.Optional[str] = None
+    _http: t.Optional[AsyncHttpClient] = None  # type: ignore
+    _loop: t.Optional[asyncio.AbstractEventLoop] = None
+
+    def __init__(
+        self,
+        api_key: t.Optional[str] = None,
+        base_url: t.Optional[str] = None,
+        runtime: t.Optional[str] = None
+    ) -> None:
+        """
+        Initialize async Composio SDK client
+
+        :param api_key: Authentication key for Composio server
+        :param base_url: Base URL for Composio server
+        :param runtime: Runtime specifier
+        """
+        self._api_key = api_key
+        self.runtime = runtime
+        self.base_url = base_url or get_api_url_base()
+        self._closing: t.Set["asyncio.Task[None]"] = set()
+
+        self.apps = AsyncApps(client=self)
+        self.actions = AsyncActions(client=self)
+        self.connected_accounts = AsyncConnectedAccounts(client=self)
+
+    @property
+    def api_key(self) -> str:
+        if self._api_key is None:
+            self._api_key = _read_api_key()
+
+        if self._api_key is None:
+            raise ApiKeyNotProvidedError()
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self._api_key = value
+
+    @property
+    def http(self) -> AsyncHttpClient:  # type: ignore
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._loop is not loop:
+            self._close_stale_session(loop=loop)
+            self._loop = loop
+            self._http = AsyncHttpClient(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                runtime=self.runtime,
+                loop=loop,
+            )
+        return self._http
+
+    def _close_stale_session(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the session created for a different event loop."""
+        http, previous = self._http, self._loop
+        if http is None or http.closed or previous is None:
+            return
+
+        if previous.is_running() and not previous.is_closed():
+            asyncio.run_coroutine_threadsafe(http.close(), previous)
+            return
+
+        # The loop the session was created on is gone, close it on this one
+        task = loop.create_task(http.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+    async def __aenter__(self) -> "AsyncComposio":
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    def get_entity(self, id: str = DEFAULT_ENTITY_ID) -> "AsyncEntity":
+        """
+        Create Entity object.
+
+        :param id: Entity ID
+        :return: Entity object.
+        """
+        return AsyncEntity(id=id, client=self)
+
+
+class AsyncEntity:
+    """Class to represent Entity object in `asyncio` runtimes."""
+
+    def __init__(
+        self,
+        client: AsyncComposio,
+        id: str = DEFAULT_ENTITY_ID,
+    ) -> None:
+        """
+        Initialize Entity object.
+
+        :param client: Async Composio client object.
+        :param id: Entity ID string
+        """
+        self.client = client
+        self.id = id
+
+    async def execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        connected_account_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """
+        Execute an action.
+
+        :param action: Action ID (Enum)
+        :param params: Parameters for executing actions
+        :param connected_account_id: Connection ID if you want to use a specific
+                connection
+        :return: Dictionary containing execution result
+        """
+        if action.no_auth:
+            return await self.client.actions.execute(
+                action=action,
+                params=params,
+                entity_id=self.id,
+                text=text,
+            )
+
+        connected_account = await self.get_connection(
+            app=action.app,
+            connected_account_id=connected_account_id,
+        )
+        return await self.client.actions.execute(
+            action=action,
+            params=params,
+            entity_id=t.cast(str, connected_account.clientUniqueUserId),
+            connected_account=connected_account.id,
+            text=text,
+        )
+
+    async def get_connection(
+        self,
+        app: t.Optional[AppType] = None,
+        connected_account_id: t.Optional[str] = None,
+    ) -> ConnectedAccountModel:
+        """
+        Get connected account for an action.
+
+        :param app: App name
+        :param connected_account_id: Connected account ID to use as filter
+        :return: Connected account object
+        :raises: If no connected account found for given entity ID
+        """
+        app = str(app).lower() if app is not None else ""
+        cache = self.client.connected_accounts.resolutions
+        key = (self.id, app, connected_account_id)
+        cached = cache.get(key)
+        if cached is AsyncConnectedAccounts.NO_CONNECTION:
+            raise _no_connection_found(
+                entity_id=self.id,
+                app=app,
+                connected_account_id=connected_account_id,
+            )
+
+        # Copied, so callers mutating the result do not corrupt the cache
+        if cached is not None:
+            return t.cast(ConnectedAccountModel, cached).model_copy(deep=True)
+
+        if connected_account_id is not None:
+            account = await self.client.connected_accounts.get(
+                connection_id=connected_account_id
+            )
+            cache.set(key, account.model_copy(deep=True))
+            return account
+
+        latest_account = _get_latest_connection(
+            connected_accounts=await self.client.connected_accounts.get(
+                entity_ids=[self.id],
+                active=True,
+            ),
+            app=app,
+        )
+        if latest_account is None:
+            cache.set(
+                key,
+                AsyncConnectedAccounts.NO_CONNECTION,
+                ttl=CONNECTION_RESOLUTION_NEGATIVE_TTL,
+            )
+            raise _no_connection_found(
+                entity_id=self.id,
+                app=app,
+                connected_account_id=connected_account_id,
+            )
+
+        cache.set(key, latest_account.model_copy(deep=True))
+        return latest_account
+
+    async def get_connections(self) -> t.List[ConnectedAccountModel]:
+        """
+        Get all connections for an entity.
+        """
+        return await self.client.connected_accounts.get(
+            entity_ids=[self.id],
+            active=True,
+        )
+
+
 __all__ = (
     "Action",
     "App",
@@ -405,4 +696,5 @@ __all__ = (
     "Trigger",
     "TriggerType",
     "Composio",
+    "AsyncComposio",
 )
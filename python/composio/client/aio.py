@@ -0,0 +1,258 @@
+"""
+Composio server object collections for `asyncio` runtimes.
+"""
+
+import asyncio
+import typing as t
+
+from composio.client.base import AsyncCollection
+from composio.client.collections import (
+    ActionModel,
+    AppModel,
+    ConnectedAccountModel,
+    ConnectionRequestModel,
+    _ActionsBase,
+    _ConnectedAccountsBase,
+)
+from composio.client.endpoints import v1
+from composio.client.enums import Action, ActionType, AppType, TagType
+from composio.client.exceptions import ComposioClientError
+
+
+class AsyncConnectedAccounts(
+    _ConnectedAccountsBase,
+    AsyncCollection[ConnectedAccountModel],
+):
+    """Collection of connected accounts."""
+
+    model = ConnectedAccountModel
+
+    @t.overload  # type: ignore
+    async def get(self, connection_id: t.Optional[str] = None) -> ConnectedAccountModel:
+        """
+        Get an account by connection ID
+
+        :param connection_id: ID of the connection to filter by
+        :return: Connected account
+        """
+
+    @t.overload
+    async def get(
+        self,
+        connection_id: t.Optional[str] = None,
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+    ) -> t.List[ConnectedAccountModel]:
+        """
+        Get a list of connected accounts by entity IDs
+
+        :param entity_ids: List of entity IDs to filter by
+        :param active: Returns account which are currently active
+        :return: List of connected accounts
+        """
+
+    async def get(
+        self,
+        connection_id: t.Optional[str] = None,
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+    ) -> t.Union[ConnectedAccountModel, t.List[ConnectedAccountModel]]:
+        """
+        Get a list of connected accounts.
+
+        :param entity_ids: List of entity IDs to filter by
+        :param connection_id: Return the connected account by a specific
+                connection ID
+        :param active: Returns account which are currently active
+        :return: List of connected accounts
+        """
+        response = await self._raise_if_required(
+            await self.http.get(
+                url=self._build_url(
+                    connection_id=connection_id,
+                    entity_ids=entity_ids,
+                    active=active,
+                ),
+            )
+        )
+        data = await response.json(content_type=None)
+        if connection_id is not None:
+            return self.model(**data)
+        return [self.model(**account) for account in data.get("items", [])]
+
+    async def initiate(
+        self,
+        integration_id: str,
+        entity_id: t.Optional[str] = None,
+        params: t.Optional[t.Dict] = None,
+        redirect_url: t.Optional[str] = None,
+    ) -> ConnectionRequestModel:
+        """Initiate a new connected account."""
+        if entity_id is not None:
+            self.invalidate_resolutions(entity_id=entity_id)
+
+        response = await self._raise_if_required(
+            response=await self.http.post(
+                url=str(self.endpoint),
+                json={
+                    "integrationId": integration_id,
+                    "userUuid": entity_id,
+                    "data": params or {},
+                    "redirectUri": redirect_url,
+                },
+            )
+        )
+        return ConnectionRequestModel(**await response.json(content_type=None))
+
+
+class AsyncApps(AsyncCollection[AppModel]):
+    """Collection of composio apps.."""
+
+    model = AppModel
+    endpoint = v1.apps
+
+    @t.overload  # type: ignore
+    async def get(self) -> t.List[AppModel]:
+        """Get available apps."""
+
+    @t.overload
+    async def get(self, name: t.Optional[str] = None) -> AppModel:
+        """Get a specific app."""
+
+    async def get(
+        self, name: t.Optional[str] = None
+    ) -> t.Union[AppModel, t.List[AppModel]]:
+        """Get apps."""
+        if name is not None:
+            response = await self._raise_if_required(
+                response=await self.http.get(
+                    url=str(self.endpoint / name),
+                )
+            )
+            return self.model(**await response.json(content_type=None))
+
+        return await super().get(queries={})
+
+
+class AsyncActions(_ActionsBase, AsyncCollection[ActionModel]):
+    """Collection of composio actions.."""
+
+    model = ActionModel
+
+    async def get(  # type: ignore
+        self,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+        limit: t.Optional[int] = None,
+        use_case: t.Optional[str] = None,
+        allow_all: bool = False,
+    ) -> t.List[ActionModel]:
+        """
+        Get a list of apps by the specified filters.
+
+        :param actions: Filter by the list of Actions.
+        :param apps: Filter by the list of Apps.
+        :param tags: Filter by the list of given Tags.
+        :param limit: Limit the number of actions to a specific number.
+        :param use_case: Filter by use case.
+        :param allow_all: Allow querying all of the actions for a specific
+                        app
+        :return: List of actions
+        """
+        filters = self._parse_filters(actions=actions, apps=apps, tags=tags)
+        if filters.only_local:
+            return self._get_local(filters=filters)
+
+        filters = self._validate_filters(filters=filters, allow_all=allow_all)
+        if filters.empty and allow_all:
+            response = await self._raise_if_required(
+                response=await self.http.get(
+                    url=str(self.endpoint),
+                )
+            )
+            data = await response.json(content_type=None)
+            items = [self.model(**action) for action in data.get("items")]
+            self._set_cached(items=items)
+            return items
+
+        requested = filters.actions
+        cached, filters = self._from_cache(
+            filters=filters,
+            limit=limit,
+            use_case=use_case,
+        )
+        if len(cached) > 0 and len(filters.actions) == 0:
+            return self._get_local(filters=filters) + list(cached.values())
+
+        response = await self._raise_if_required(
+            response=await self.http.get(
+                url=str(
+                    self.endpoint(
+                        queries=self._build_queries(
+                            filters=filters,
+                            limit=limit,
+                            use_case=use_case,
+                        ),
+                    )
+                )
+            )
+        )
+        data = await response.json(content_type=None)
+        items = [self.model(**action) for action in data.get("items")]
+        self._set_cached(items=items)
+        return self._get_local(filters=filters) + self._filter_items(
+            items=items,
+            filters=filters,
+            cached=cached,
+            requested=requested,
+        )
+
+    async def execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = "default",
+        connected_account: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """
+        Execute an action on the specified entity with optional connected account.
+
+        :param action: The Action object to be executed.
+        :param params: A dictionary of parameters to be passed to the action.
+        :param entity_id: The unique identifier of the entity on which the action is executed.
+        :param connected_account: Optional connected account ID if required for the action.
+        :return: A dictionary containing the response from the executed action.
+        """
+        if action.is_local:
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: self.client.local.execute_action(
+                    action=action,
+                    request_data=params,
+                ),
+            )
+
+        actions = await self.get(actions=[action])
+        if len(actions) == 0:
+            raise ComposioClientError(f"Action {action} not found")
+
+        (action_model,) = actions
+        # Attachments are read from disk, keep that off the event loop
+        params = await asyncio.to_thread(
+            self._prepare_params,
+            action_model=action_model,
+            params=params,
+        )
+        url, request = self._build_execute_request(
+            action=action,
+            params=params,
+            entity_id=entity_id,
+            connected_account=connected_account,
+            text=text,
+        )
+        response = await self._raise_if_required(
+            await self.http.post(url=url, **self._request_body(request=request))
+        )
+        return await response.json(content_type=None)
@@ -5,16 +5,26 @@ Composio client base.
 import typing as t
 
 import requests
+from aiohttp import ClientResponse
 
 from composio.client.endpoints import Endpoint
 from composio.client.exceptions import HTTPError, NoItemsFound
-from composio.client.http import HttpClient
-from composio.utils import logging
+from composio.client.http import AsyncHttpClient, HttpClient
+from composio.client.httpcache import http_cache
+from composio.utils import codec, logging
+from composio.utils.cache import SingleFlight
 
 
 ModelType = t.TypeVar("ModelType")
 CollectionType = t.TypeVar("CollectionType", list, dict)
 
+DEFAULT_PAGE_SIZE = 100
+"""Number of items to request per page when iterating over a collection."""
+
+single_flight: SingleFlight[t.Tuple[str, ...], t.Any] = SingleFlight()
+"""Group for merging identical in-flight `GET` requests, use
+`single_flight.stats()` to see how many requests were saved."""
+
 
 class Collection(t.Generic[ModelType], logging.WithLogger):
     """Data model collection for representing server objects."""
@@ -24,6 +34,9 @@ class Collection(t.Generic[ModelType], logging.WithLogger):
 
     _list_key: str = "items"
 
+    _cacheable: bool = False
+    """Serve `GET` requests using the persistent HTTP cache."""
+
     def __init__(self, client: "BaseClient") -> None:
         """Initialize connected accounts models namespace."""
         logging.WithLogger.__init__(self)
@@ -55,15 +68,41 @@ class Collection(t.Generic[ModelType], logging.WithLogger):
             return collection
         raise NoItemsFound(message="No items found")
 
+    def _get(self, url: str, cached: t.Optional[bool] = None) -> requests.Response:
+        """
+        Perform a `GET` request, merged with identical in-flight requests.
+
+        The response body is read before the response is shared, so every
+        caller decodes its own copy of the data.
+
+        :param url: Request URL
+        :param cached: Use the persistent HTTP cache, defaults to the
+            collection's `_cacheable` setting
+        :return: Http response
+        """
+        http = self.client.http
+        cached = self._cacheable if cached is None else cached
+
+        def _request() -> requests.Response:
+            if cached:
+                return http_cache.get(http=http, url=url)
+
+            response = http.get(url=url)
+            _ = response.content
+            return response
+
+        return single_flight.do(
+            key=("GET", http.base_url, str(http.headers.get("x-api-key")), url),
+            func=_request,
+        )
+
     def get(self, queries: t.Optional[t.Dict[str, str]] = None) -> t.List[ModelType]:
         """List available models."""
         request = self._raise_if_required(
-            response=self.client.http.get(
-                url=str(self.endpoint(queries=queries or {})),
-            ),
+            response=self._get(url=str(self.endpoint(queries=queries or {}))),
         )
 
-        data = request.json()
+        data = codec.loads(request.content)
         if isinstance(data, list):
             return [self.model(**item) for item in data]
 
@@ -75,6 +114,139 @@ class Collection(t.Generic[ModelType], logging.WithLogger):
             status_code=request.status_code,
         )
 
+    def iterate(
+        self,
+        queries: t.Optional[t.Dict[str, str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        where: t.Optional[t.Callable[[t.Dict], bool]] = None,
+    ) -> t.Iterator[ModelType]:
+        """
+        Iterate over available models, fetching one page at a time.
+
+        Example:
+        ```python
+            for integration in client.integrations.iterate(page_size=50):
+                if integration.appName == "github":
+                    break
+        ```
+
+        Pages are requested lazily, so breaking out of the loop stops the
+        remaining pages from being fetched. Iteration stops after the last
+        page reported by the server, or on an empty page or a page repeating
+        the previous one, eg. for endpoints which do not paginate.
+
+        :param queries: Server side filters
+        :param page_size: Number of items to request per page
+        :param where: Filter applied to the raw items, items which do not
+            match are never validated
+        :return: Iterator over the models
+        """
+        page = 1
+        previous: t.Optional[t.Dict] = None
+        while True:
+            response = self._raise_if_required(
+                response=self._get(
+                    url=str(
+                        self.endpoint(
+                            queries={
+                                **(queries or {}),
+                                "page": str(page),
+                                "pageSize": str(page_size),
+                            }
+                        )
+                    )
+                ),
+            )
+            data = codec.loads(response.content)
+            items = data if isinstance(data, list) else data.get(self._list_key)
+            if not isinstance(items, list):
+                raise HTTPError(
+                    message=f"Received invalid data object: {response.content.decode()}",
+                    status_code=response.status_code,
+                )
+
+            # Stop if the endpoint ignores the page parameter
+            if len(items) == 0 or items[0] == previous:
+                return
+
+            for item in items:
+                if where is None or where(item):
+                    yield self.model(**item)
+
+            total_pages = data.get("totalPages") if isinstance(data, dict) else None
+            if total_pages is not None and page >= int(total_pages):
+                return
+
+            previous = items[0]
+            page += 1
+
+
+class AsyncCollection(t.Generic[ModelType], logging.WithLogger):
+    """Data model collection for representing server objects in `asyncio` runtimes."""
+
+    endpoint: Endpoint
+    model: t.Type[ModelType]
+
+    _list_key: str = "items"
+
+    def __init__(self, client: "BaseClient") -> None:
+        """Initialize connected accounts models namespace."""
+        logging.WithLogger.__init__(self)
+        self.client = client
+
+    @property
+    def http(self) -> AsyncHttpClient:
+        """HTTP client bound to the running event loop."""
+        return t.cast(AsyncHttpClient, self.client.http)
+
+    async def _raise_if_required(
+        self,
+        response: ClientResponse,
+        status_code: int = 200,
+    ) -> ClientResponse:
+        """
+        Raise if HTTP response is not expected.
+
+        :param response: Http response
+        :param status_code: Expected status code
+        :raises composio.client.exceptions.HTTPError: If the status code does
+                not match with the expected status code
+        """
+        if response.status != status_code:
+            raise HTTPError(
+                message=await response.text(encoding="utf-8"),
+                status_code=response.status,
+            )
+        return response
+
+    def _raise_if_empty(self, collection: CollectionType) -> CollectionType:
+        """Raise if provided collection is empty."""
+        if len(collection) > 0:
+            return collection
+        raise NoItemsFound(message="No items found")
+
+    async def get(
+        self, queries: t.Optional[t.Dict[str, str]] = None
+    ) -> t.List[ModelType]:
+        """List available models."""
+        response = await self._raise_if_required(
+            response=await self.http.get(
+                url=str(self.endpoint(queries=queries or {})),
+            ),
+        )
+
+        data = await response.json(content_type=None)
+        if isinstance(data, list):
+            return [self.model(**item) for item in data]
+
+        if self._list_key in data:
+            return [self.model(**item) for item in data[self._list_key]]
+
+        raise HTTPError(
+            message=f"Received invalid data object: {await response.text()}",
+            status_code=response.status,
+        )
+
 
 class BaseClient:
     """Composio client abstraction."""
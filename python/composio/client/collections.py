@@ -3,13 +3,17 @@ Composio server object collections
 """
 
 import base64
-import json
+import hashlib
+import itertools
 import os
+import sqlite3
+import threading
 import time
 import traceback
 import typing as t
 import warnings
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
+from logging import DEBUG
 from unittest import mock
 
 import pysher
@@ -18,8 +22,14 @@ import typing_extensions as te
 from pydantic import BaseModel, ConfigDict, Field
 from pysher.channel import Channel
 
-from composio.client.base import BaseClient, Collection
-from composio.client.endpoints import v1
+from composio.client.base import DEFAULT_PAGE_SIZE, BaseClient, Collection
+from composio.client.dispatch import (
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_WORKERS,
+    DispatchStats,
+    Dispatcher,
+)
+from composio.client.endpoints import Endpoint, v1
 from composio.client.enums import (
     Action,
     ActionType,
@@ -31,8 +41,29 @@ from composio.client.enums import (
     TriggerType,
 )
 from composio.client.exceptions import ComposioClientError
+from composio.client.files import (
+    FileReference,
+    StreamingJSONBody,
+    get_streaming_threshold,
+)
+from composio.client.httpcache import http_cache
+from composio.client.journal import DEFAULT_BATCH_SIZE, DEFAULT_RETAIN, EventJournal
+from composio.client.reassembly import (
+    DEFAULT_CHUNK_TTL,
+    DEFAULT_MAX_BUFFER_SIZE,
+    ChunkBuffer,
+    DropCallback,
+    ReassemblyStats,
+)
 from composio.constants import PUSHER_CLUSTER, PUSHER_KEY
-from composio.utils import logging
+from composio.utils import codec, logging
+from composio.utils.cache import TTLCache
+from composio.utils.instrumentation import (
+    OUTCOME_ERROR,
+    PHASE_TRIGGER_CALLBACK,
+    instrumentation,
+)
+from composio.utils.readiness import Backoff, Readiness, async_wait_until, wait_until
 
 
 def to_trigger_names(
@@ -110,33 +141,192 @@ class ConnectionRequestModel(BaseModel):
                 "userUuid": entity_id,
             },
         )
-        return resp.json()
+        return codec.loads(resp.content)
+
+    def _active(
+        self,
+        client: BaseClient,
+        connection: "ConnectedAccountModel",
+    ) -> t.Optional["ConnectedAccountModel"]:
+        """Get the connection if it is active."""
+        if connection.status != "ACTIVE":
+            return None
+        client.connected_accounts.invalidate_resolutions(  # type: ignore
+            entity_id=connection.clientUniqueUserId,
+            app=connection.appUniqueId,
+        )
+        return connection
 
     def wait_until_active(
         self,
         client: BaseClient,
         timeout=60,
+        backoff: Backoff = Backoff(),
+    ) -> "ConnectedAccountModel":
+        """
+        Wait for the connection to become active.
+
+        The connection is polled frequently at first and less often the
+        longer it takes, see `Backoff`.
+
+        :param client: Composio client
+        :param timeout: Number of seconds to wait
+        :param backoff: Delays between polls
+        :raises ComposioClientError: If the connection is not active within
+            `timeout`
+        :return: Active connected account
+        """
+        try:
+            return wait_until(
+                check=lambda: self._active(
+                    client=client,
+                    connection=client.connected_accounts.get(  # type: ignore
+                        connection_id=self.connectedAccountId,
+                    ),
+                ),
+                timeout=timeout,
+                backoff=backoff,
+            )
+        except TimeoutError:
+            # TODO: Replace with timeout error.
+            raise ComposioClientError(
+                "Connection did not become active within the timeout period."
+            ) from None
+
+    async def async_wait_until_active(
+        self,
+        client: BaseClient,
+        timeout=60,
+        backoff: Backoff = Backoff(),
     ) -> "ConnectedAccountModel":
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            connection = client.connected_accounts.get(  # type: ignore
+        """
+        Wait for the connection to become active using an `AsyncComposio` client.
+
+        :param client: Async Composio client
+        :param timeout: Number of seconds to wait
+        :param backoff: Delays between polls
+        :raises ComposioClientError: If the connection is not active within
+            `timeout`
+        :return: Active connected account
+        """
+
+        async def _check() -> t.Optional["ConnectedAccountModel"]:
+            connection = await client.connected_accounts.get(  # type: ignore
                 connection_id=self.connectedAccountId,
             )
-            if connection.status == "ACTIVE":
-                return connection
-            time.sleep(1)
+            return self._active(client=client, connection=connection)
+
+        try:
+            return await async_wait_until(
+                check=_check,
+                timeout=timeout,
+                backoff=backoff,
+            )
+        except TimeoutError:
+            raise ComposioClientError(
+                "Connection did not become active within the timeout period."
+            ) from None
+
+
+CONNECTION_RESOLUTION_CACHE_SIZE = 1024
+CONNECTION_RESOLUTION_CACHE_TTL = 300.0
+CONNECTION_RESOLUTION_NEGATIVE_TTL = 10.0
+
+ConnectionResolutionKey = t.Tuple[str, str, t.Optional[str]]
+"""Connection resolution key, `(entity_id, app, connected_account_id)`"""
+
+
+class _NoConnection:
+    """Sentinel for entity/app pairs without a connected account."""
+
+
+class _ConnectedAccountsBase:
+    """Helpers shared by sync and async connected accounts collections."""
+
+    endpoint: Endpoint = v1 / "connectedAccounts"
+
+    NO_CONNECTION = _NoConnection
+    """Cached value for entity/app pairs without a connected account."""
+
+    def __init__(self, client: BaseClient) -> None:
+        """Initialize connected accounts collection."""
+        super().__init__(client=client)  # type: ignore
+        self.resolutions: TTLCache[
+            ConnectionResolutionKey,
+            t.Union[ConnectedAccountModel, t.Type[_NoConnection]],
+        ] = TTLCache(
+            maxsize=CONNECTION_RESOLUTION_CACHE_SIZE,
+            ttl=CONNECTION_RESOLUTION_CACHE_TTL,
+        )
+
+    def invalidate_resolutions(
+        self,
+        entity_id: t.Optional[str] = None,
+        app: t.Optional[str] = None,
+    ) -> int:
+        """
+        Invalidate cached connection resolutions.
+
+        :param entity_id: Invalidate resolutions for this entity, if not
+            provided resolutions for all of the entities are invalidated.
+        :param app: Invalidate resolutions for this app only.
+        :return: Number of invalidated entries
+        """
+        app = str(app).lower() if app is not None else None
+
+        def _predicate(key: ConnectionResolutionKey) -> bool:
+            _entity_id, _app, _ = key
+            return (entity_id is None or _entity_id == entity_id) and (
+                app is None or _app in (app, "")
+            )
 
-        # TODO: Replace with timeout error.
-        raise ComposioClientError(
-            "Connection did not become active within the timeout period."
+        return self.resolutions.invalidate(predicate=_predicate)
+
+    def _build_url(
+        self,
+        connection_id: t.Optional[str] = None,
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+    ) -> str:
+        """Build URL for fetching connected accounts."""
+        entity_ids = entity_ids or ()
+        if connection_id is not None and len(entity_ids) > 0:
+            raise ComposioClientError(
+                message="Cannot use both `connection_id` and `entity_ids` parameters as filter"
+            )
+
+        if connection_id is not None:
+            return str(self.endpoint / connection_id)
+
+        return str(
+            self.endpoint(
+                queries=self._build_queries(entity_ids=entity_ids, active=active)
+            )
         )
 
+    @staticmethod
+    def _build_queries(
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+        apps: t.Optional[t.Sequence[str]] = None,
+    ) -> t.Dict[str, str]:
+        """Build server side filters for listing connected accounts."""
+        queries = {}
+        if entity_ids:
+            queries["user_uuid"] = ",".join(entity_ids)
+
+        if apps:
+            queries["appNames"] = ",".join(apps)
+
+        if active:
+            queries["showActiveOnly"] = "true"
+        return queries
 
-class ConnectedAccounts(Collection[ConnectedAccountModel]):
+
+class ConnectedAccounts(_ConnectedAccountsBase, Collection[ConnectedAccountModel]):
     """Collection of connected accounts."""
 
     model = ConnectedAccountModel
-    endpoint = v1 / "connectedAccounts"
 
     @t.overload  # type: ignore
     def get(self, connection_id: t.Optional[str] = None) -> ConnectedAccountModel:
@@ -177,33 +367,50 @@ class ConnectedAccounts(Collection[ConnectedAccountModel]):
         :param active: Returns account which are currently active
         :return: List of connected accounts
         """
-        entity_ids = entity_ids or ()
-        if connection_id is not None and len(entity_ids) > 0:
-            raise ComposioClientError(
-                message="Cannot use both `connection_id` and `entity_ids` parameters as filter"
+        response = self._raise_if_required(
+            self._get(
+                url=self._build_url(
+                    connection_id=connection_id,
+                    entity_ids=entity_ids,
+                    active=active,
+                ),
             )
-
+        )
         if connection_id is not None:
-            response = self._raise_if_required(
-                self.client.http.get(
-                    url=str(self.endpoint / connection_id),
-                )
-            )
-            return self.model(**response.json())
+            return self.model(**codec.loads(response.content))
+        return [
+            self.model(**account)
+            for account in codec.loads(response.content).get("items", [])
+        ]
 
-        queries = {}
-        if len(entity_ids) > 0:
-            queries["user_uuid"] = ",".join(entity_ids)
-
-        if active:
-            queries["showActiveOnly"] = "true"
+    def iterate(  # type: ignore
+        self,
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+        apps: t.Optional[t.Sequence[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        where: t.Optional[t.Callable[[t.Dict], bool]] = None,
+    ) -> t.Iterator[ConnectedAccountModel]:
+        """
+        Iterate over connected accounts, fetching one page at a time.
 
-        response = self._raise_if_required(
-            self.client.http.get(
-                url=str(self.endpoint(queries=queries)),
-            )
+        :param entity_ids: List of entity IDs to filter by
+        :param active: Only return accounts which are currently active
+        :param apps: List of app names to filter by
+        :param page_size: Number of accounts to request per page
+        :param where: Filter applied to the raw account data, accounts which
+            do not match are never validated
+        :return: Iterator over connected accounts
+        """
+        return super().iterate(
+            queries=self._build_queries(
+                entity_ids=entity_ids,
+                active=active,
+                apps=apps,
+            ),
+            page_size=page_size,
+            where=where,
         )
-        return [self.model(**account) for account in response.json().get("items", [])]
 
     def initiate(
         self,
@@ -213,6 +420,9 @@ class ConnectedAccounts(Collection[ConnectedAccountModel]):
         redirect_url: t.Optional[str] = None,
     ) -> ConnectionRequestModel:
         """Initiate a new connected account."""
+        if entity_id is not None:
+            self.invalidate_resolutions(entity_id=entity_id)
+
         response = self._raise_if_required(
             response=self.client.http.post(
                 url=str(self.endpoint),
@@ -224,7 +434,7 @@ class ConnectedAccounts(Collection[ConnectedAccountModel]):
                 },
             )
         )
-        return ConnectionRequestModel(**response.json())
+        return ConnectionRequestModel(**codec.loads(response.content))
 
 
 class AuthSchemeField(BaseModel):
@@ -284,6 +494,8 @@ class Apps(Collection[AppModel]):
     model = AppModel
     endpoint = v1.apps
 
+    _cacheable = True
+
     @t.overload  # type: ignore
     def get(self) -> t.List[AppModel]:
         """Get available apps."""
@@ -295,13 +507,12 @@ class Apps(Collection[AppModel]):
     def get(self, name: t.Optional[str] = None) -> t.Union[AppModel, t.List[AppModel]]:
         """Get apps."""
         if name is not None:
-            return self.model(
-                **self._raise_if_required(
-                    response=self.client.http.get(
-                        url=str(self.endpoint / name),
-                    )
-                ).json()
+            response = self._raise_if_required(
+                response=self._get(
+                    url=str(self.endpoint / name),
+                )
             )
+            return self.model(**codec.loads(response.content))
 
         return super().get(queries={})
 
@@ -371,16 +582,16 @@ class CallbackCollection(Collection[CallbackModel]):
                 },
             )
         )
-        return response.json()
+        return codec.loads(response.content)
 
     def get(self) -> str:  # type: ignore
         """Get current callback URL."""
         response = self._raise_if_required(
-            response=self.client.http.get(
+            response=self._get(
                 url=str(self.endpoint / "callback_url"),
             )
         )
-        return response.json().get("callbackURL")
+        return codec.loads(response.content).get("callbackURL")
 
 
 class TriggerModel(BaseModel):
@@ -465,19 +676,111 @@ class _TriggerEventFilters(te.TypedDict):
 
 TriggerCallback = t.Callable[[TriggerEventData], None]
 
+_RouteKeyType = t.Tuple[t.Optional[str], t.Optional[str], t.Optional[str]]
+_ROUTE_FILTERS = ("app_name", "trigger_name", "trigger_id")
+
+
+class _CallbackRegistration(t.NamedTuple):
+    """Registered trigger callback."""
+
+    order: int
+    callback: TriggerCallback
+    filters: _TriggerEventFilters
+
+
+def _event_checks(data: TriggerEventData) -> t.Tuple[t.Tuple[str, t.Any], ...]:
+    """Get values to check the callback filters against."""
+    return (
+        ("app_name", data.appName),
+        ("trigger_id", data.metadata.id),
+        ("connection_id", data.metadata.connectionId),
+        ("trigger_name", data.metadata.triggerName),
+        ("entity_id", data.metadata.connection.clientUniqueUserId),
+        ("integration_id", data.metadata.connection.integrationId),
+    )
+
+
+def _route_key(filters: _TriggerEventFilters) -> _RouteKeyType:
+    """Get the routing key for the app, trigger name and trigger ID filters."""
+    values = t.cast(t.Dict[str, t.Any], filters)
+    app, name, trigger_id = (
+        None if values.get(key) is None else str(values[key]).lower()
+        for key in _ROUTE_FILTERS
+    )
+    return app, name, trigger_id
+
+
+def _mismatch(
+    filters: _TriggerEventFilters,
+    checks: t.Iterable[t.Tuple[str, t.Any]],
+) -> t.Optional[str]:
+    """Get the name of the first filter which does not match the event."""
+    for name, check in checks:
+        value = filters.get(name)
+        if value is None or str(value).lower() == str(check).lower():
+            continue
+        return name
+    return None
+
 
 class TriggerSubscription(logging.WithLogger):
-    """Trigger subscription."""
+    """
+    Trigger subscription.
+
+    Callbacks are indexed by their app, trigger name and trigger ID
+    filters, so routing an event does not depend on the number of
+    registered callbacks. Events are handled by a long lived pool of
+    workers, the callbacks matching an event run in the order they were
+    registered.
+
+    Chunked events which do not receive their final chunk within
+    `chunk_ttl` seconds, or which do not fit in `max_chunk_size`, are dropped
+    and reported to the callbacks registered using `on_drop`.
+
+    If a `journal` is provided, received events are appended to it and
+    handled in batches by a consumer thread started by `listen` or `start`.
+    Events are committed once their callbacks have run, so events which
+    were not handled before a restart are delivered again.
+    """
 
     _channel: Channel
-    _alive: bool
 
-    def __init__(self) -> None:
-        """Initialize subscription object."""
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        chunk_ttl: float = DEFAULT_CHUNK_TTL,
+        max_chunk_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        journal: t.Optional[EventJournal] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize subscription object.
+
+        :param workers: Number of threads for running callbacks
+        :param queue_size: Number of events which can wait for a worker
+            before new events block the listener
+        :param chunk_ttl: Number of seconds a chunked event has to receive
+            its final chunk
+        :param max_chunk_size: Maximum total length of the buffered chunks
+        :param journal: Journal for persisting received events before they
+            are handled
+        :param batch_size: Number of journaled events handled per batch
+        """
         logging.WithLogger.__init__(self)
-        self._alive = False
-        self._chunks: t.Dict[str, t.Dict[int, str]] = {}
-        self._callbacks: t.List[t.Tuple[TriggerCallback, _TriggerEventFilters]] = []
+        self._alive: Readiness[None] = Readiness()
+        self._chunks = ChunkBuffer(ttl=chunk_ttl, max_size=max_chunk_size)
+        self._journal = journal
+        self._batch_size = batch_size
+        self._consumer: t.Optional[threading.Thread] = None
+        self._closed: Readiness[None] = Readiness()
+        self._callbacks: t.List[_CallbackRegistration] = []
+        self._routes: t.Dict[_RouteKeyType, t.List[_CallbackRegistration]] = {}
+        self._dispatcher = Dispatcher(
+            workers=workers,
+            queue_size=queue_size,
+            name="composio-trigger",
+        )
 
     def callback(
         self,
@@ -486,56 +789,88 @@ class TriggerSubscription(logging.WithLogger):
         """Register a trigger callaback."""
 
         def _wrap(f: TriggerCallback) -> TriggerCallback:
-            self._callbacks.append((f, filters or {}))
+            _filters = filters or {}
+            registration = _CallbackRegistration(
+                order=len(self._callbacks),
+                callback=f,
+                filters=_filters,
+            )
+            self._callbacks.append(registration)
+            self._routes.setdefault(_route_key(filters=_filters), []).append(
+                registration
+            )
             return f
 
         return _wrap
 
+    def on_drop(self, f: DropCallback) -> DropCallback:
+        """Register a callback for chunked events dropped before completion."""
+        return self._chunks.on_drop(f)
+
+    def _route(self, data: TriggerEventData) -> t.List[_CallbackRegistration]:
+        """Get the callbacks matching an event, in registration order."""
+        app = str(data.appName).lower()
+        name = str(data.metadata.triggerName).lower()
+        trigger_id = str(data.metadata.id).lower()
+        checks = _event_checks(data=data)
+
+        matched = []
+        for key in itertools.product((app, None), (name, None), (trigger_id, None)):
+            for registration in self._routes.get(key, ()):
+                if _mismatch(filters=registration.filters, checks=checks) is None:
+                    matched.append(registration)
+        matched.sort(key=lambda registration: registration.order)
+
+        if self.logger.isEnabledFor(DEBUG):
+            orders = {registration.order for registration in matched}
+            for registration in self._callbacks:
+                if registration.order in orders:
+                    continue
+                self.logger.debug(
+                    f"Skipping `{registration.callback.__name__}` since "
+                    f"`{_mismatch(filters=registration.filters, checks=checks)}` "
+                    "filter does not match the event metadata",
+                )
+        return matched
+
     def _handle_callback(
         self,
         callback: TriggerCallback,
         data: TriggerEventData,
-        filters: _TriggerEventFilters,
     ) -> t.Any:
         """Handle callback."""
-        for name, check in (
-            ("app_name", data.appName),
-            ("trigger_id", data.metadata.id),
-            ("connection_id", data.metadata.connectionId),
-            ("trigger_name", data.metadata.triggerName),
-            ("entity_id", data.metadata.connection.clientUniqueUserId),
-            ("integration_id", data.metadata.connection.integrationId),
-        ):
-            value = filters.get(name)
-            if value is None or str(value).lower() == check.lower():
-                continue
-
-            self.logger.debug(
-                f"Skipping `{callback.__name__}` since "
-                f"`{name}` filter does not match the event metadata",
-            )
-            return None
+        with instrumentation.span(
+            PHASE_TRIGGER_CALLBACK,
+            app=str(data.appName),
+            trigger=str(data.metadata.triggerName),
+            callback=callback.__name__,
+        ) as span:
+            try:
+                return callback(data)
+            except BaseException:
+                span.tag(outcome=OUTCOME_ERROR)
+                self.logger.info(
+                    f"Error executing `{callback.__name__}` for "
+                    f"event `{data.metadata.triggerName}` "
+                    f"with error:\n {traceback.format_exc()}"
+                )
+                return None
 
-        try:
-            return callback(data)
-        except BaseException:
-            self.logger.info(
-                f"Error executing `{callback.__name__}` for "
-                f"event `{data.metadata.triggerName}` "
-                f"with error:\n {traceback.format_exc()}"
-            )
-            return None
+    def _handle_callbacks(self, data: TriggerEventData) -> None:
+        """Run the callbacks matching an event."""
+        for registration in self._route(data=data):
+            self._handle_callback(callback=registration.callback, data=data)
 
     def _parse_payload(self, event: str) -> t.Optional[TriggerEventData]:
         """Parse event payload."""
         try:
-            return TriggerEventData(**json.loads(event))
+            return TriggerEventData(**codec.loads(event))
         except Exception as e:
             self.logger.warning(f"Error decoding payload: {e}")
             return None
 
     def handle_event(self, event: str) -> None:
-        """Filter events and call the callback function."""
+        """Filter events and call the callback function, waits for the callbacks."""
         data = self._parse_payload(event=event)
         if data is None:
             self.logger.error(f"Error parsing trigger payload: {event}")
@@ -545,56 +880,155 @@ class TriggerSubscription(logging.WithLogger):
             f"Received trigger event with trigger ID: {data.metadata.id} "
             f"and trigger name: {data.metadata.triggerName}"
         )
-        awaitables: t.List[Future] = []
-        with ThreadPoolExecutor() as executor:
-            for callback, filters in self._callbacks:
-                awaitables.append(
-                    executor.submit(
-                        self._handle_callback,
-                        callback,
-                        data,
-                        filters,
-                    )
-                )
-        _ = [future.result() for future in awaitables]
+        if self._dispatcher.in_worker():
+            self._handle_callbacks(data=data)
+            return
+        self._dispatcher.submit(self._handle_callbacks, data).result()
+
+    def dispatch_event(self, event: str) -> "Future[None]":
+        """
+        Queue an event for the workers without waiting for the callbacks.
+
+        Blocks while the queue is full.
+
+        :param event: Event payload
+        :return: Future which completes once the callbacks have run
+        """
+        return self._dispatcher.submit(self.handle_event, event)
+
+    def receive_event(self, event: str) -> None:
+        """
+        Accept an event from the listener.
+
+        The event is appended to the journal if one is configured, otherwise
+        it is queued for the workers.
+
+        :param event: Event payload
+        """
+        if self._journal is None:
+            self.dispatch_event(event=event)
+            return
+
+        try:
+            self._journal.append(event=event)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.error(f"Error journaling trigger event: {e}")
+            self.dispatch_event(event=event)
+
+    def start(self) -> None:
+        """Start handling journaled events, no-op without a journal."""
+        if self._journal is None or self._consumer is not None:
+            return
+        self._consumer = threading.Thread(
+            target=self._consume,
+            args=(self._journal,),
+            name="composio-trigger-journal",
+            daemon=True,
+        )
+        self._consumer.start()
+
+    def _consume(self, journal: EventJournal) -> None:
+        """Handle journaled events in batches and commit them."""
+        while not self._closed.is_set():
+            try:
+                entries = journal.poll(limit=self._batch_size, timeout=1.0)
+                if len(entries) == 0:
+                    continue
+
+                futures = [self.dispatch_event(event=entry.event) for entry in entries]
+                for future in futures:
+                    future.exception()
+                journal.commit(offset=entries[-1].offset)
+                journal.compact(retain=DEFAULT_RETAIN)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.error(f"Error reading trigger event journal: {e}")
+                self._closed.wait(timeout=1.0)
+
+    def stats(self) -> DispatchStats:
+        """Get queue depth and latency counters for handling events."""
+        return self._dispatcher.stats()
+
+    def chunk_stats(self) -> ReassemblyStats:
+        """Get counters for reassembling chunked events."""
+        return self._chunks.stats()
+
+    def close(self) -> None:
+        """Stop the workers once the queued events are handled."""
+        self._closed.set()
+        if self._consumer is not None:
+            self._consumer.join()
+        self._dispatcher.shutdown()
 
     def handle_chunked_events(self, event: str) -> None:
         """Handle chunked events."""
-        data = _ChunkedTriggerEventData(**json.loads(event))
-        if data.id not in self._chunks:
-            self._chunks[data.id] = {}
-
-        self._chunks[data.id][data.index] = data.chunk
-        if data.final:
-            _chunks = self._chunks.pop(data.id)
-            self.handle_event(
-                event="".join([_chunks[idx] for idx in sorted(_chunks)]),
-            )
+        data = _ChunkedTriggerEventData(**codec.loads(event))
+        _event = self._chunks.add(
+            key=data.id,
+            index=data.index,
+            chunk=data.chunk,
+            final=data.final,
+        )
+        if _event is not None:
+            self.receive_event(event=_event)
 
     def is_alive(self) -> bool:
         """Check if subscription is live."""
-        return self._alive
+        return self._alive.is_set()
 
     def set_alive(self) -> None:
-        """Set `_alive` to True."""
-        self._alive = True
+        """Mark the subscription as live and wake up the waiters."""
+        self._alive.set()
+
+    def wait_until_alive(self, timeout: t.Optional[float] = None) -> None:
+        """
+        Wait for the subscription to go live.
+
+        :param timeout: Number of seconds to wait, waits indefinitely if `None`
+        :raises TimeoutError: If the subscription is not live within `timeout`
+        """
+        self._alive.result(timeout=timeout)
+
+    async def async_wait_until_alive(self, timeout: t.Optional[float] = None) -> None:
+        """
+        Wait for the subscription to go live without blocking the event loop.
+
+        :param timeout: Number of seconds to wait, waits indefinitely if `None`
+        :raises TimeoutError: If the subscription is not live within `timeout`
+        """
+        await self._alive.async_result(timeout=timeout)
 
     def listen(self) -> None:
-        """Wait infinitely."""
+        """Handle events until the subscription is closed."""
+        self.start()
+        while not self._closed.wait(timeout=1.0):
+            self._chunks.expire()
+
+    async def async_listen(self) -> None:
+        """Handle events until the subscription is closed, for `asyncio` runtimes."""
+        self.start()
         while True:
-            time.sleep(1)
+            try:
+                return await self._closed.async_result(timeout=1.0)
+            except TimeoutError:
+                self._chunks.expire()
 
 
 class _PusherClient(logging.WithLogger):
     """Pusher client for Composio SDK."""
 
-    def __init__(self, client_id: str, base_url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        base_url: str,
+        api_key: str,
+        journal: t.Optional[EventJournal] = None,
+    ) -> None:
         """Initialize pusher client."""
         super().__init__()
         self.client_id = client_id
         self.base_url = base_url
         self.api_key = api_key
-        self.subscription = TriggerSubscription()
+        self.subscription = TriggerSubscription(journal=journal)
 
     def _get_connection_handler(
         self,
@@ -611,7 +1045,7 @@ class _PusherClient(logging.WithLogger):
             )
             channel.bind(
                 event_name="trigger_to_client",
-                callback=subscription.handle_event,
+                callback=subscription.receive_event,
             )
             channel.bind(
                 event_name="chunked-trigger_to_client",
@@ -669,14 +1103,13 @@ class _PusherClient(logging.WithLogger):
         pusher.connect()
 
         # Wait for connection to get established
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if self.subscription.is_alive():
-                return self.subscription
-            time.sleep(0.5)
-        raise TimeoutError(
-            "Timed out while waiting for trigger listener to be established"
-        )
+        try:
+            self.subscription.wait_until_alive(timeout=timeout)
+        except TimeoutError as e:
+            raise TimeoutError(
+                "Timed out while waiting for trigger listener to be established"
+            ) from e
+        return self.subscription
 
 
 class Triggers(Collection[TriggerModel]):
@@ -686,6 +1119,8 @@ class Triggers(Collection[TriggerModel]):
     endpoint = v1.triggers
     callbacks: CallbackCollection
 
+    _cacheable = True
+
     def __init__(self, client: BaseClient) -> None:
         """Initialize triggers collections."""
         super().__init__(client)
@@ -727,7 +1162,7 @@ class Triggers(Collection[TriggerModel]):
                 json={"triggerConfig": config},
             )
         )
-        return response.json()
+        return codec.loads(response.content)
 
     def disable(self, id: str) -> t.Dict:
         """
@@ -744,17 +1179,29 @@ class Triggers(Collection[TriggerModel]):
                 },
             )
         )
-        return response.json()
+        return codec.loads(response.content)
 
-    def subscribe(self, timeout: float = 15.0) -> TriggerSubscription:
-        """Subscribe to a trigger and receive trigger events."""
+    def subscribe(
+        self,
+        timeout: float = 15.0,
+        journal: t.Optional[EventJournal] = None,
+    ) -> TriggerSubscription:
+        """
+        Subscribe to a trigger and receive trigger events.
+
+        :param timeout: Number of seconds to wait for the connection
+        :param journal: Journal for persisting received events before they
+            are handled
+        :return: Trigger subscription
+        """
         self.logger.info("Creating trigger subscription")
         response = self._raise_if_required(
-            response=self.client.http.get(
+            response=self._get(
                 url="/v1/client/auth/client_info",
+                cached=False,
             )
         )
-        client_id = response.json().get("client", {}).get("id")
+        client_id = codec.loads(response.content).get("client", {}).get("id")
         if client_id is None:
             raise ComposioClientError("Error fetching client ID")
 
@@ -762,6 +1209,7 @@ class Triggers(Collection[TriggerModel]):
             client_id=client_id,
             base_url=self.client.http.base_url,
             api_key=self.client.api_key,
+            journal=journal,
         )
         return pusher.connect(
             timeout=timeout,
@@ -860,69 +1308,134 @@ class ActionModel(BaseModel):
     description: t.Optional[str] = None
 
 
-class Actions(Collection[ActionModel]):
-    """Collection of composio actions.."""
+class _ActionFilters(t.NamedTuple):
+    """Parsed filters for querying actions."""
 
-    model = ActionModel
-    endpoint = v1.actions
+    actions: t.List[Action]
+    apps: t.List[App]
+    tags: t.List[t.Union[Tag, str]]
+    local_actions: t.List[Action]
+    local_apps: t.List[App]
 
-    # TODO: Overload
-    def get(  # type: ignore
-        self,
-        actions: t.Optional[t.Sequence[ActionType]] = None,
-        apps: t.Optional[t.Sequence[AppType]] = None,
-        tags: t.Optional[t.Sequence[TagType]] = None,
-        limit: t.Optional[int] = None,
-        use_case: t.Optional[str] = None,
-        allow_all: bool = False,
-    ) -> t.List[ActionModel]:
+    @property
+    def only_local(self) -> bool:
+        """Check if the filters only contain local apps and actions."""
+        return (
+            len(self.apps) == 0
+            and len(self.actions) == 0
+            and (len(self.local_apps) > 0 or len(self.local_actions) > 0)
+        )
+
+    @property
+    def empty(self) -> bool:
+        """Check if none of the filters are set."""
+        return not any(self)
+
+
+ACTION_SCHEMA_CACHE_SIZE = 4096
+ACTION_SCHEMA_CACHE_TTL = 600.0
+
+action_schema_cache: TTLCache[t.Tuple[str, str, str], ActionModel] = TTLCache(
+    maxsize=ACTION_SCHEMA_CACHE_SIZE,
+    ttl=ACTION_SCHEMA_CACHE_TTL,
+)
+"""Process wide cache for remote action schemas, keyed by `(base_url, action)`."""
+
+
+class _ActionsBase:
+    """Request building helpers shared by sync and async actions collections."""
+
+    client: BaseClient
+
+    endpoint: Endpoint = v1.actions
+
+    cache = action_schema_cache
+
+    def _cache_key(self, action: str) -> t.Tuple[str, str, str]:
         """
-        Get a list of apps by the specified filters.
+        Cache key for an action schema.
 
-        :param actions: Filter by the list of Actions.
-        :param apps: Filter by the list of Apps.
-        :param tags: Filter by the list of given Tags.
-        :param limit: Limit the number of actions to a specific number.
-        :param use_case: Filter by use case.
-        :param allow_all: Allow querying all of the actions for a specific
-                        app
-        :return: List of actions
+        Schemas are tailored to the account, so the key includes a digest of
+        the API key along with the base URL.
         """
-        actions = t.cast(t.List[Action], [Action(action) for action in actions or []])
-        apps = t.cast(t.List[App], [App(app) for app in apps or []])
-        tags = t.cast(t.List[Tag], [Tag(tag) for tag in tags or []])
-
-        # Filter out local apps and actions
-        local_apps = [app for app in apps if app.is_local]
-        local_actions = [action for action in actions if action.is_local]
-        apps = [app for app in apps if not app.is_local]
-        actions = [action for action in actions if not action.is_local]
-        only_local_apps = (
-            len(apps) == 0
-            and len(actions) == 0
-            and (len(local_apps) > 0 or len(local_actions) > 0)
+        return (
+            hashlib.sha256(str(self.client.api_key).encode()).hexdigest()[:16],
+            str(getattr(self.client, "base_url", "")),
+            action,
         )
-        if only_local_apps:
-            local_items = self.client.local.get_action_schemas(
-                apps=local_apps,
-                actions=local_actions,
-                tags=tags,
+
+    def _get_cached(self, actions: t.Sequence[Action]) -> t.Dict[str, ActionModel]:
+        """Get cached schemas for given actions."""
+        cached = {}
+        for action in actions:
+            item = self.cache.get(self._cache_key(action=action.slug))
+            if item is not None:
+                cached[action.slug] = item.model_copy(deep=True)
+        return cached
+
+    def _set_cached(self, items: t.Sequence[ActionModel]) -> None:
+        """Add action schemas to the cache."""
+        for item in items:
+            self.cache.set(
+                key=self._cache_key(action=item.name),
+                value=item.model_copy(deep=True),
             )
-            return [self.model(**item) for item in local_items]
 
-        if len(actions) > 0 and len(apps) > 0:
+    def invalidate_cache(
+        self, actions: t.Optional[t.Sequence[ActionType]] = None
+    ) -> int:
+        """
+        Invalidate cached action schemas.
+
+        :param actions: Invalidate only these actions, if not provided all of
+            the cached schemas for this client are dropped.
+        :return: Number of invalidated entries
+        """
+        if actions is None:
+            prefix = self._cache_key(action="")[:2]
+            return self.cache.invalidate(predicate=lambda key: key[:2] == prefix)
+
+        return sum(
+            self.cache.invalidate(key=self._cache_key(action=Action(action).slug))
+            for action in actions
+        )
+
+    def _parse_filters(
+        self,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+    ) -> "_ActionFilters":
+        """Parse action filters and split out local apps and actions."""
+        _actions = [Action(action) for action in actions or []]
+        _apps = [App(app) for app in apps or []]
+        return _ActionFilters(
+            actions=[action for action in _actions if not action.is_local],
+            apps=[app for app in _apps if not app.is_local],
+            tags=[Tag(tag) for tag in tags or []],
+            local_actions=[action for action in _actions if action.is_local],
+            local_apps=[app for app in _apps if app.is_local],
+        )
+
+    def _validate_filters(
+        self,
+        filters: "_ActionFilters",
+        allow_all: bool = False,
+    ) -> "_ActionFilters":
+        """Validate filters for querying remote actions."""
+        if len(filters.actions) > 0 and len(filters.apps) > 0:
             raise ComposioClientError(
                 "Error retrieving Actions, Both actions and apps "
                 "cannot be used as filters at the same time."
             )
 
-        if len(actions) > 0 and len(tags) > 0:
+        if len(filters.actions) > 0 and len(filters.tags) > 0:
             raise ComposioClientError(
                 "Error retrieving Actions, Both actions and tags "
                 "cannot be used as filters at the same time."
             )
 
-        if len(apps) > 0 and len(tags) == 0 and not allow_all:
+        if len(filters.apps) > 0 and len(filters.tags) == 0 and not allow_all:
             warnings.warn(
                 "Using all the actions of an app is not recommended. "
                 "Please use tags to filter actions or provide specific actions. "
@@ -930,63 +1443,87 @@ class Actions(Collection[ActionModel]):
                 "to be used in production. Check out https://docs.composio.dev/sdk/python/actions for more information.",
                 UserWarning,
             )
-            tags = ["important"]
+            filters = filters._replace(tags=["important"])
+        return filters
+
+    def _from_cache(
+        self,
+        filters: "_ActionFilters",
+        limit: t.Optional[int] = None,
+        use_case: t.Optional[str] = None,
+    ) -> t.Tuple[t.Dict[str, ActionModel], "_ActionFilters"]:
+        """
+        Lookup action filtered queries in the schema cache.
 
+        :return: Cached schemas and filters for the actions which still need
+            to be fetched from the server.
+        """
         if (
-            len(actions) == 0
-            and len(apps) == 0
-            and len(tags) == 0
-            and allow_all
-            and len(local_apps) == 0
-            and len(local_actions) == 0
+            len(filters.actions) == 0
+            or len(filters.tags) > 0
+            or limit is not None
+            or (use_case is not None and use_case != "")
         ):
-            response = self._raise_if_required(
-                response=self.client.http.get(
-                    url=str(self.endpoint),
-                )
-            )
-            return [self.model(**action) for action in response.json().get("items")]
+            return {}, filters
 
+        cached = self._get_cached(actions=filters.actions)
+        return cached, filters._replace(
+            actions=[action for action in filters.actions if action.slug not in cached]
+        )
+
+    def _build_queries(
+        self,
+        filters: "_ActionFilters",
+        limit: t.Optional[int] = None,
+        use_case: t.Optional[str] = None,
+    ) -> t.Dict[str, str]:
+        """Build HTTP queries for fetching remote actions."""
         queries: t.Dict[str, str] = {}
         if use_case is not None and use_case != "":
-            if len(apps) != 1:
+            if len(filters.apps) != 1:
                 raise ComposioClientError(
                     "Error retrieving Actions, Use case "
                     "should be provided with exactly one app."
                 )
             queries["useCase"] = use_case
 
-        if len(apps) > 0:
-            queries["appNames"] = ",".join(
-                list(map(lambda x: t.cast(App, x).slug, apps))
-            )
+        if len(filters.apps) > 0:
+            queries["appNames"] = ",".join([app.slug for app in filters.apps])
 
-        if len(actions) > 0:
+        if len(filters.actions) > 0:
             queries["appNames"] = ",".join(
-                set(map(lambda x: t.cast(Action, x).app, actions))
+                set(action.app for action in filters.actions)
             )
 
         if limit is not None:
             queries["limit"] = str(limit)
+        return queries
 
-        response = self._raise_if_required(
-            response=self.client.http.get(
-                url=str(
-                    self.endpoint(
-                        queries=queries,
-                    )
-                )
-            )
-        )
-
-        response_json = response.json()
-        items = [self.model(**action) for action in response_json.get("items")]
-        if len(actions) > 0:
-            required = [t.cast(Action, action).slug for action in actions]
-            items = [item for item in items if item.name in required]
+    def _filter_items(
+        self,
+        items: t.List[ActionModel],
+        filters: "_ActionFilters",
+        cached: t.Dict[str, ActionModel],
+        requested: t.Sequence[Action],
+    ) -> t.List[ActionModel]:
+        """
+        Filter remote items using action and tag filters.
 
-        if len(tags) > 0:
-            required_tags = [tag.app if isinstance(tag, Tag) else tag for tag in tags]
+        :param requested: Actions from the filters before the cache lookup,
+            cached and fetched schemas are returned in this order
+        """
+        if len(filters.actions) > 0:
+            found = {
+                **{item.name: item for item in items},
+                **cached,
+            }
+            slugs = dict.fromkeys(action.slug for action in requested)
+            items = [found[slug] for slug in slugs if slug in found]
+
+        if len(filters.tags) > 0:
+            required_tags = [
+                tag.app if isinstance(tag, Tag) else tag for tag in filters.tags
+            ]
             only_important_tag = required_tags == ["important"]
             should_not_filter_using_tags = len(items) < 15 and only_important_tag
             if not should_not_filter_using_tags:
@@ -997,41 +1534,35 @@ class Actions(Collection[ActionModel]):
                 ]
                 if len(filtered_items) > 0 or not only_important_tag:
                     items = filtered_items
+        return items
 
-        if len(local_apps) > 0 or len(local_actions) > 0:
-            local_items = self.client.local.get_action_schemas(
-                apps=local_apps, actions=local_actions, tags=tags
+    def _get_local(self, filters: "_ActionFilters") -> t.List[ActionModel]:
+        """Get schemas for local apps and actions."""
+        if len(filters.local_apps) == 0 and len(filters.local_actions) == 0:
+            return []
+
+        return [
+            ActionModel(**item)
+            for item in self.client.local.get_action_schemas(
+                apps=filters.local_apps,
+                actions=filters.local_actions,
+                tags=filters.tags,
             )
-            items = [self.model(**item) for item in local_items] + items
-        return items
+        ]
 
-    def execute(
+    def _prepare_params(
         self,
-        action: Action,
+        action_model: ActionModel,
         params: t.Dict,
-        entity_id: str = "default",
-        connected_account: t.Optional[str] = None,
-        text: t.Optional[str] = None,
-    ) -> t.Dict:
+    ) -> t.Dict[str, t.Union[str, t.Dict[str, t.Any]]]:
         """
-        Execute an action on the specified entity with optional connected account.
+        Read file parameters and prepare request input for remote execution.
 
-        :param action: The Action object to be executed.
-        :param params: A dictionary of parameters to be passed to the action.
-        :param entity_id: The unique identifier of the entity on which the action is executed.
-        :param connected_account: Optional connected account ID if required for the action.
-        :return: A dictionary containing the response from the executed action.
+        Attachments larger than the streaming threshold are added as
+        `FileReference` objects, use `_request_body` to encode the request.
         """
-        if action.is_local:
-            return self.client.local.execute_action(action=action, request_data=params)
-
-        actions = self.get(actions=[action])
-        if len(actions) == 0:
-            raise ComposioClientError(f"Action {action} not found")
-
-        (action_model,) = actions
         action_req_schema = action_model.parameters.properties
-        modified_params: t.Dict[str, t.Union[str, t.Dict[str, str]]] = {}
+        modified_params: t.Dict[str, t.Union[str, t.Dict[str, t.Any]]] = {}
         for param, value in params.items():
             request_param_schema = action_req_schema[param]
             file_readable = request_param_schema.get("file_readable", False)
@@ -1051,6 +1582,15 @@ class Actions(Collection[ActionModel]):
                 if not os.path.isfile(value):
                     raise ValueError(f"Attachment File with path `{value}` not found.")
 
+                reference = FileReference.from_path(value)
+                if reference.size > get_streaming_threshold():
+                    # Large attachments are encoded while the request is sent
+                    modified_params[param] = {
+                        "name": os.path.basename(value),
+                        "content": reference,
+                    }
+                    continue
+
                 with open(value, "rb") as file:
                     file_content = file.read()
 
@@ -1060,19 +1600,24 @@ class Actions(Collection[ActionModel]):
                 }
             else:
                 modified_params[param] = value
+        return modified_params
 
+    def _build_execute_request(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = "default",
+        connected_account: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Tuple[str, t.Dict]:
+        """Build URL and request body for executing a remote action."""
         if action.no_auth:
-            return self._raise_if_required(
-                self.client.http.post(
-                    url=str(self.endpoint / action.name / "execute"),
-                    json={
-                        "appName": action.app,
-                        "input": modified_params,
-                        "entityId": entity_id,
-                        "text": text,
-                    },
-                )
-            ).json()
+            return str(self.endpoint / action.name / "execute"), {
+                "appName": action.app,
+                "input": params,
+                "entityId": entity_id,
+                "text": text,
+            }
 
         if connected_account is None:
             raise ComposioClientError(
@@ -1080,17 +1625,140 @@ class Actions(Collection[ActionModel]):
                 "an app which requires authentication"
             )
 
-        return self._raise_if_required(
-            self.client.http.post(
-                url=str(self.endpoint / action.slug / "execute"),
-                json={
-                    "connectedAccountId": connected_account,
-                    "input": modified_params,
-                    "entityId": entity_id,
-                    "text": text,
-                },
+        return str(self.endpoint / action.slug / "execute"), {
+            "connectedAccountId": connected_account,
+            "input": params,
+            "entityId": entity_id,
+            "text": text,
+        }
+
+    @staticmethod
+    def _request_body(request: t.Dict) -> t.Dict[str, t.Any]:
+        """Get keyword arguments for sending `request` as the JSON body."""
+        if not StreamingJSONBody.has_references(request):
+            return {"json": request}
+
+        body = StreamingJSONBody(request)
+        return {"data": body, "headers": body.headers}
+
+
+class Actions(_ActionsBase, Collection[ActionModel]):
+    """Collection of composio actions.."""
+
+    model = ActionModel
+
+    _cacheable = True
+
+    # TODO: Overload
+    def get(  # type: ignore
+        self,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+        limit: t.Optional[int] = None,
+        use_case: t.Optional[str] = None,
+        allow_all: bool = False,
+    ) -> t.List[ActionModel]:
+        """
+        Get a list of apps by the specified filters.
+
+        :param actions: Filter by the list of Actions.
+        :param apps: Filter by the list of Apps.
+        :param tags: Filter by the list of given Tags.
+        :param limit: Limit the number of actions to a specific number.
+        :param use_case: Filter by use case.
+        :param allow_all: Allow querying all of the actions for a specific
+                        app
+        :return: List of actions
+        """
+        filters = self._parse_filters(actions=actions, apps=apps, tags=tags)
+        if filters.only_local:
+            return self._get_local(filters=filters)
+
+        filters = self._validate_filters(filters=filters, allow_all=allow_all)
+        if filters.empty and allow_all:
+            response = self._raise_if_required(
+                response=self._get(
+                    url=str(self.endpoint),
+                )
+            )
+            items = [
+                self.model(**action)
+                for action in codec.loads(response.content).get("items")
+            ]
+            self._set_cached(items=items)
+            return items
+
+        requested = filters.actions
+        cached, filters = self._from_cache(
+            filters=filters,
+            limit=limit,
+            use_case=use_case,
+        )
+        if len(cached) > 0 and len(filters.actions) == 0:
+            return self._get_local(filters=filters) + list(cached.values())
+
+        response = self._raise_if_required(
+            response=self._get(
+                url=str(
+                    self.endpoint(
+                        queries=self._build_queries(
+                            filters=filters,
+                            limit=limit,
+                            use_case=use_case,
+                        ),
+                    )
+                )
             )
-        ).json()
+        )
+        items = [
+            self.model(**action)
+            for action in codec.loads(response.content).get("items")
+        ]
+        self._set_cached(items=items)
+        return self._get_local(filters=filters) + self._filter_items(
+            items=items,
+            filters=filters,
+            cached=cached,
+            requested=requested,
+        )
+
+    def execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = "default",
+        connected_account: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """
+        Execute an action on the specified entity with optional connected account.
+
+        :param action: The Action object to be executed.
+        :param params: A dictionary of parameters to be passed to the action.
+        :param entity_id: The unique identifier of the entity on which the action is executed.
+        :param connected_account: Optional connected account ID if required for the action.
+        :return: A dictionary containing the response from the executed action.
+        """
+        if action.is_local:
+            return self.client.local.execute_action(action=action, request_data=params)
+
+        actions = self.get(actions=[action])
+        if len(actions) == 0:
+            raise ComposioClientError(f"Action {action} not found")
+
+        (action_model,) = actions
+        url, request = self._build_execute_request(
+            action=action,
+            params=self._prepare_params(action_model=action_model, params=params),
+            entity_id=entity_id,
+            connected_account=connected_account,
+            text=text,
+        )
+        response = self._raise_if_required(
+            self.client.http.post(url=url, **self._request_body(request=request))
+        )
+        return codec.loads(response.content)
 
 
 class IntegrationModel(BaseModel):
@@ -1120,6 +1788,8 @@ class Integrations(Collection[IntegrationModel]):
     model = IntegrationModel
     endpoint = v1.integrations
 
+    _cacheable = True
+
     def create(
         self,
         app_id: str,
@@ -1162,7 +1832,8 @@ class Integrations(Collection[IntegrationModel]):
                 json=request,
             )
         )
-        return IntegrationModel(**response.json())
+        http_cache.invalidate(http=self.client.http, url=str(self.endpoint))
+        return IntegrationModel(**codec.loads(response.content))
 
     def get_by_id(
         self,
@@ -1175,6 +1846,6 @@ class Integrations(Collection[IntegrationModel]):
         :return: Integration model.
         """
         response = self._raise_if_required(
-            self.client.http.get(url=str(self.endpoint / integration_id))
+            self._get(url=str(self.endpoint / integration_id))
         )
-        return IntegrationModel(**response.json())
+        return IntegrationModel(**codec.loads(response.content))
@@ -0,0 +1,207 @@
+"""
+Bounded worker pool for dispatching trigger events.
+"""
+
+import os
+import queue
+import threading
+import time
+import typing as t
+from concurrent.futures import Future
+
+from composio.utils import logging
+from composio.utils.instrumentation import Histogram
+
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+"""Number of worker threads, same default as `ThreadPoolExecutor`."""
+
+DEFAULT_QUEUE_SIZE = 1024
+"""Number of tasks which can wait for a worker before submitters block."""
+
+_TaskType = t.Tuple["Future[t.Any]", t.Callable[..., t.Any], t.Tuple[t.Any, ...]]
+
+
+class DispatchStats(t.NamedTuple):
+    """Dispatcher counters."""
+
+    workers: int
+    """Number of running worker threads."""
+
+    queue_depth: int
+    """Number of tasks waiting for a worker."""
+
+    max_queue_depth: int
+    """Highest number of tasks seen waiting for a worker."""
+
+    submitted: int
+    """Number of tasks submitted."""
+
+    completed: int
+    """Number of tasks completed, including failed ones."""
+
+    failed: int
+    """Number of tasks which raised an exception."""
+
+    blocked: int
+    """Number of submissions which had to wait for space in the queue."""
+
+    latency: Histogram
+    """Time taken to run the tasks in seconds."""
+
+
+class Dispatcher(logging.WithLogger):
+    """
+    Long lived pool of worker threads with a bounded queue.
+
+    Example:
+    ```python
+        dispatcher = Dispatcher(workers=4, queue_size=128)
+        future = dispatcher.submit(print, "hello")
+        future.result()
+        print (dispatcher.stats())
+    ```
+
+    Workers are started on the first submission. Once `queue_size` tasks
+    are waiting, `submit` blocks until a worker frees up a slot, which
+    slows down producers instead of buffering an unbounded backlog.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        name: str = "composio-dispatch",
+    ) -> None:
+        """
+        Initialize dispatcher.
+
+        :param workers: Number of worker threads
+        :param queue_size: Number of tasks which can wait for a worker
+        :param name: Prefix for the worker thread names
+        """
+        super().__init__()
+        self.workers = max(workers, 1)
+        self.queue_size = max(queue_size, 1)
+        self.name = name
+        self._queue: "queue.Queue[t.Optional[_TaskType]]" = queue.Queue(
+            maxsize=self.queue_size
+        )
+        self._threads: t.List[threading.Thread] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._max_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._blocked = 0
+        self._latency = Histogram()
+
+    def in_worker(self) -> bool:
+        """Check if the current thread is one of the workers."""
+        return getattr(self._local, "worker", False)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit tasks after shutdown")
+            if len(self._threads) > 0:
+                return
+            for idx in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.name}-{idx}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(
+        self,
+        func: t.Callable[..., t.Any],
+        *args: t.Any,
+        timeout: t.Optional[float] = None,
+    ) -> "Future[t.Any]":
+        """
+        Submit a task, waiting for space in the queue if it is full.
+
+        :param func: Function to call
+        :param args: Arguments for the function
+        :param timeout: Number of seconds to wait for space in the queue
+        :raises queue.Full: If the queue is still full after `timeout`
+        :return: Future for the result of the task
+        """
+        self._start()
+        future: "Future[t.Any]" = Future()
+        task = (future, func, args)
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            with self._lock:
+                self._blocked += 1
+            self._queue.put(task, timeout=timeout)
+
+        depth = self._queue.qsize()
+        with self._lock:
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, depth)
+        return future
+
+    def _work(self) -> None:
+        self._local.worker = True
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+
+            future, func, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            start = time.perf_counter()
+            failed = False
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:  # pylint: disable=broad-except
+                failed = True
+                future.set_exception(e)
+
+            with self._lock:
+                self._completed += 1
+                self._failed += failed
+                self._latency.observe(time.perf_counter() - start)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers once the queued tasks are done.
+
+        :param wait: Wait for the workers to exit
+        """
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+
+        for _ in threads:
+            self._queue.put(None)
+
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    def stats(self) -> DispatchStats:
+        """Get dispatcher counters."""
+        with self._lock:
+            latency = Histogram(buckets=self._latency.buckets)
+            latency.merge(self._latency)
+            return DispatchStats(
+                workers=sum(thread.is_alive() for thread in self._threads),
+                queue_depth=self._queue.qsize(),
+                max_queue_depth=self._max_queue_depth,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                blocked=self._blocked,
+                latency=latency,
+            )
@@ -9,7 +9,13 @@ import typing as t
 import typing_extensions as te  # noqa: F401
 
 from composio.client.enums._action import Action
-from composio.client.enums.base import APPS_CACHE, AppData, _AnnotatedEnum, enum
+from composio.client.enums.base import (
+    APPS_CACHE,
+    AppData,
+    _AnnotatedEnum,
+    enum,
+    get_index,
+)
 
 
 @enum
@@ -101,6 +107,17 @@ class App(_AnnotatedEnum[AppData], path=APPS_CACHE):
         :return: Iterator object which yields `Action`
         """
         tags = tags or []
+        by_app = get_index(name="apps")
+        by_tag = get_index(name="tags")
+        if by_app is not None and by_tag is not None and self.slug.lower() in by_app:
+            slugs = set(by_app[self.slug.lower()])
+            if len(tags) > 0:
+                slugs &= {slug for tag in tags for slug in by_tag.get(tag, [])}
+            for name in Action.__annotations__:
+                if name in slugs:
+                    yield getattr(Action, name)
+            return
+
         app = f"{self.slug.lower()}_"
         for action in Action.all():
             if not action.slug.lower().startswith(app):
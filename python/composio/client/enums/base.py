@@ -3,6 +3,7 @@ Enum helper base.
 """
 
 import os
+import sqlite3
 import typing as t
 import warnings
 from pathlib import Path
@@ -12,9 +13,13 @@ import typing_extensions as te
 from composio.constants import LOCAL_CACHE_DIRECTORY
 from composio.exceptions import ComposioSDKError
 from composio.storage.base import LocalStorage
+from composio.storage.metadata import MetadataStore
+from composio.utils import codec
 
 
 _model_cache: t.Dict[str, LocalStorage] = {}
+_index_cache: t.Dict[str, t.Optional[t.Dict[str, t.List[str]]]] = {}
+_raw_cache: t.Dict[str, str] = {}
 _local_actions: t.Dict[str, "ActionData"] = {}
 _runtime_actions: t.Dict[str, "ActionData"] = {}
 
@@ -25,11 +30,23 @@ TAGS_CACHE = LOCAL_CACHE_DIRECTORY / "tags"
 APPS_CACHE = LOCAL_CACHE_DIRECTORY / "apps"
 ACTIONS_CACHE = LOCAL_CACHE_DIRECTORY / "actions"
 TRIGGERS_CACHE = LOCAL_CACHE_DIRECTORY / "triggers"
+METADATA_STORE = LOCAL_CACHE_DIRECTORY / "metadata.db"
+
+metadata_store = MetadataStore(
+    path=METADATA_STORE,
+    legacy={
+        cache.name: cache
+        for cache in (TAGS_CACHE, APPS_CACHE, ACTIONS_CACHE, TRIGGERS_CACHE)
+    },
+)
 
 NO_REMOTE_ENUM_FETCHING = (
     os.environ.get("COMPOSIO_NO_REMOTE_ENUM_FETCHING", "false") == "true"
 )
 
+LAZY_ENUMS = os.environ.get("COMPOSIO_LAZY_ENUMS", "true") != "false"
+"""Create enum members on first access instead of at class creation."""
+
 
 class EnumStringNotFound(ComposioSDKError):
     """Raise when user provides invalid enum string."""
@@ -101,7 +118,29 @@ class TriggerData(LocalStorage):
     "Name of the app where this trigger belongs to."
 
 
-class _AnnotatedEnum(t.Generic[EntityType]):
+class _AnnotatedEnumMeta(type):
+    """Metaclass for creating `_AnnotatedEnum` members on first access."""
+
+    def __getattr__(cls, name: str) -> t.Any:
+        if name.startswith("_") or name not in cls.__dict__.get("__annotations__", {}):
+            raise AttributeError(
+                f"type object '{cls.__name__}' has no attribute '{name}'"
+            )
+        member = cls(name, warn=False)
+        setattr(cls, name, member)
+        return member
+
+    def __dir__(cls) -> t.Iterable[str]:
+        return sorted(
+            set(super().__dir__()).union(
+                name
+                for name in cls.__dict__.get("__annotations__", {})
+                if not name.startswith("_")
+            )
+        )
+
+
+class _AnnotatedEnum(t.Generic[EntityType], metaclass=_AnnotatedEnumMeta):
     """Enum class that uses class annotations as values."""
 
     _slug: str
@@ -163,10 +202,12 @@ class _AnnotatedEnum(t.Generic[EntityType]):
             trigger_registry,
         )
         from composio.tools.local import (  # pylint: disable=import-outside-toplevel
+            is_local_name,
             load_local_tools,
         )
 
-        load_local_tools()
+        if is_local_name(name=self._slug):
+            load_local_tools()
 
         for gid, actions in action_registry.items():
             if self._slug in actions:
@@ -274,10 +315,32 @@ class _AnnotatedEnum(t.Generic[EntityType]):
         data = self._cache_from_local() or self._cache_from_remote()
         _model_cache[self._slug] = data
         try:
-            data.store()
-        except (OSError, PermissionError):
+            metadata_store.put(
+                kind=self._path.name,
+                slug=self._slug,
+                data=_serialize(data),
+            )
+        except (OSError, PermissionError, sqlite3.Error):
             pass
 
+    def _load_from_store(self, raw: t.Optional[str] = None) -> t.Optional[EntityType]:
+        """Load enum metadata from the metadata store or the legacy cache."""
+        path = self._path / self._slug
+        obj = (
+            codec.loads(raw)
+            if raw is not None
+            else metadata_store.get(kind=self._path.name, slug=self._slug)
+        )
+        if obj is not None:
+            data = self._model.from_json(obj=obj, path=path)
+        elif path.exists():
+            data = self._model.load(path)
+        else:
+            return None
+
+        _model_cache[self._slug] = data
+        return data
+
     def load(self) -> EntityType:
         """Load action data."""
         if self._slug is None:
@@ -291,21 +354,28 @@ class _AnnotatedEnum(t.Generic[EntityType]):
         if self._slug in _runtime_actions:
             return _runtime_actions[self._slug]  # type: ignore
 
-        if not (self._path / self._slug).exists():
+        # Prefetched by `all()`, decoded on first load
+        raw = _raw_cache.pop(self._slug, None)
+        if self._load_from_store(raw=raw) is None:
             self._cache()
 
-        if self._slug not in _model_cache:
-            _model_cache[self._slug] = self._model.load(self._path / self._slug)
-
         return t.cast(EntityType, _model_cache[self._slug])
 
     @classmethod
     def all(cls) -> t.Iterator[te.Self]:
-        """Iterate over available object."""
+        """
+        Iterate over available object, members are created as they are yielded.
+
+        Metadata for all members is read from the metadata store in a single
+        query and is decoded when a member is loaded for the first time.
+        """
+        stored = metadata_store.items(kind=cls._path.name)
         for name in cls.__annotations__:
             if name == "_deprecated":
                 continue
-            yield cls._create(name=name)
+            if name in stored and name not in _model_cache:
+                _raw_cache.setdefault(name, stored[name])
+            yield getattr(cls, name)
 
     @classmethod
     def _create(cls, name: str) -> te.Self:
@@ -329,7 +399,15 @@ class _AnnotatedEnum(t.Generic[EntityType]):
 
 
 def enum(cls: ClassType) -> ClassType:
-    """Decorate class."""
+    """
+    Decorate class.
+
+    Members are created on first access unless `COMPOSIO_LAZY_ENUMS` is set
+    to `false`, in which case they're created right away.
+    """
+    if LAZY_ENUMS:
+        return cls
+
     for attr in cls.__annotations__:
         if attr == "_deprecated":
             continue
@@ -337,6 +415,71 @@ def enum(cls: ClassType) -> ClassType:
     return cls
 
 
+def _serialize(data: LocalStorage) -> t.Dict:
+    """Serialize metadata for the metadata store."""
+    obj = data.to_json()
+    obj.pop("path", None)
+    return obj
+
+
+def _build_indexes(
+    items: t.List[LocalStorage],
+) -> t.Dict[str, t.Dict[str, t.List[str]]]:
+    """Build app -> actions and tag -> actions indexes."""
+    by_app: t.Dict[str, t.List[str]] = {}
+    by_tag: t.Dict[str, t.List[str]] = {}
+    for item in items:
+        if not isinstance(item, ActionData):
+            continue
+        slug = t.cast(Path, item.path).name
+        by_app.setdefault(item.app.lower(), []).append(slug)
+        for tag in item.tags:
+            by_tag.setdefault(tag, []).append(slug)
+    return {"apps": by_app, "tags": by_tag}
+
+
+def update_metadata(items: t.Iterable[LocalStorage]) -> int:
+    """
+    Replace the contents of the metadata store.
+
+    The entry kind and slug are derived from the legacy cache path of the
+    items, eg. `~/.composio/actions/GITHUB_META_ROOT`. The app and tag
+    indexes for actions are rebuilt along with the entries.
+
+    :param items: Metadata objects to store
+    :return: Number of entries written
+    """
+    items = [item for item in items if item.path is not None]
+    count = metadata_store.replace(
+        entries=(
+            (
+                t.cast(Path, item.path).parent.name,
+                t.cast(Path, item.path).name,
+                _serialize(item),
+            )
+            for item in items
+        ),
+        indexes=_build_indexes(items=items),
+    )
+    _model_cache.clear()
+    _index_cache.clear()
+    _raw_cache.clear()
+    return count
+
+
+def get_index(name: str) -> t.Optional[t.Dict[str, t.List[str]]]:
+    """
+    Get an action index from the metadata store.
+
+    :param name: `apps` for app -> actions or `tags` for tag -> actions
+    :return: Dictionary of sorted action slugs by app/tag or `None` if the
+        index has not been built yet, run `composio apps update` to build it
+    """
+    if name not in _index_cache:
+        _index_cache[name] = metadata_store.index(name=name)
+    return _index_cache[name]
+
+
 def add_runtime_action(name: str, data: ActionData) -> None:
     """Add action at runtime."""
     _runtime_actions[name] = data
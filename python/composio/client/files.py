@@ -0,0 +1,258 @@
+"""
+Streaming file helpers for remote action execution.
+
+Files are base64 encoded and decoded in bounded chunks, so the memory used
+for an attachment does not depend on its size.
+"""
+
+import base64
+import binascii
+import io
+import json
+import os
+import re
+import typing as t
+from pathlib import Path
+
+
+ENV_COMPOSIO_FILE_STREAMING_THRESHOLD = "COMPOSIO_FILE_STREAMING_THRESHOLD"
+"""Size in bytes above which attachments are streamed from disk."""
+
+DEFAULT_FILE_STREAMING_THRESHOLD = 4 * 1024 * 1024
+
+CHUNK_SIZE = 3 * 64 * 1024
+"""Size of the raw chunks read from disk, a multiple of 3 so the encoded
+chunks can be concatenated."""
+
+ENCODED_CHUNK_SIZE = CHUNK_SIZE // 3 * 4
+"""Size of the base64 chunks decoded at once, a multiple of 4."""
+
+_NON_ALPHABET = {
+    True: re.compile(r"[^A-Za-z0-9+/=_-]"),
+    False: re.compile(r"[^A-Za-z0-9+/=]"),
+}
+"""Characters discarded by the standard and URL safe decoders."""
+
+
+def get_streaming_threshold() -> int:
+    """Get the size above which attachments are streamed."""
+    try:
+        return int(
+            os.environ.get(
+                ENV_COMPOSIO_FILE_STREAMING_THRESHOLD,
+                DEFAULT_FILE_STREAMING_THRESHOLD,
+            )
+        )
+    except ValueError:
+        return DEFAULT_FILE_STREAMING_THRESHOLD
+
+
+class FileReference(t.NamedTuple):
+    """
+    Reference to a file which is base64 encoded while the request is sent.
+
+    Use in place of the base64 content string in a request body which is
+    encoded using `StreamingJSONBody`.
+    """
+
+    path: Path
+    size: int
+
+    @classmethod
+    def from_path(cls, path: t.Union[str, Path]) -> "FileReference":
+        path = Path(path)
+        return cls(path=path, size=path.stat().st_size)
+
+    @property
+    def encoded_size(self) -> int:
+        """Size of the base64 encoded content."""
+        return (self.size + 2) // 3 * 4
+
+
+def b64encode_file(
+    path: t.Union[str, Path],
+    chunk_size: int = CHUNK_SIZE,
+) -> t.Iterator[bytes]:
+    """
+    Base64 encode a file in chunks.
+
+    :param path: Path to the file
+    :param chunk_size: Number of bytes to read at once, rounded down to a
+        multiple of 3
+    :return: Iterator over base64 encoded chunks
+    """
+    chunk_size = max(chunk_size - chunk_size % 3, 3)
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield base64.b64encode(chunk)
+
+
+def b64decode_to_file(
+    content: str,
+    path: t.Union[str, Path],
+    urlsafe: bool = True,
+    chunk_size: int = ENCODED_CHUNK_SIZE,
+) -> int:
+    """
+    Base64 decode `content` to a file in chunks.
+
+    :param content: Base64 encoded content
+    :param path: Path to write the decoded content to
+    :param urlsafe: Use the URL safe alphabet
+    :param chunk_size: Number of encoded characters to decode at once,
+        rounded down to a multiple of 4
+    :raises binascii.Error: If `content` is not valid base64
+    :return: Number of bytes written
+    """
+    # Like decoding `content` as a whole, characters outside the alphabet are
+    # ignored. They are removed upfront since they would misalign the chunks.
+    non_alphabet = _NON_ALPHABET[urlsafe]
+    if non_alphabet.search(content) is not None:
+        content = non_alphabet.sub("", content)
+
+    altchars = b"-_" if urlsafe else None
+    chunk_size = max(chunk_size - chunk_size % 4, 4)
+    written = 0
+    try:
+        with open(path, "wb") as file:
+            for start in range(0, len(content), chunk_size):
+                end = start + chunk_size
+                written += file.write(
+                    base64.b64decode(content[start:end], altchars=altchars)
+                )
+    except binascii.Error:
+        Path(path).unlink(missing_ok=True)
+        raise
+    return written
+
+
+class StreamingJSONBody(io.RawIOBase):
+    """
+    JSON request body with file references encoded while it's being read.
+
+    Example:
+    ```python
+        body = StreamingJSONBody(
+            {"input": {"file": {"name": "a.bin", "content": FileReference.from_path("a.bin")}}}
+        )
+        requests.post(url, data=body, headers=body.headers)
+    ```
+
+    The length of the body is known upfront, so it's sent with a
+    `Content-Length` header instead of chunked transfer encoding. The body
+    can be rewound using `seek(0)` to resend it.
+    """
+
+    def __init__(self, obj: t.Any, chunk_size: int = CHUNK_SIZE) -> None:
+        super().__init__()
+        self.chunk_size = chunk_size
+        self._parts = _split(obj=obj)
+        self._length = sum(
+            part.encoded_size + 2 if isinstance(part, FileReference) else len(part)
+            for part in self._parts
+        )
+        self._chunks: t.Iterator[bytes] = self._generate()
+        self._buffer = b""
+        self._position = 0
+
+    @staticmethod
+    def has_references(obj: t.Any) -> bool:
+        """Check if `obj` contains any file references."""
+        if isinstance(obj, FileReference):
+            return True
+        if isinstance(obj, dict):
+            return any(StreamingJSONBody.has_references(v) for v in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return any(StreamingJSONBody.has_references(v) for v in obj)
+        return False
+
+    @property
+    def headers(self) -> t.Dict[str, str]:
+        """Headers to send with the body."""
+        return {
+            "Content-Type": "application/json",
+            "Content-Length": str(self._length),
+        }
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _generate(self) -> t.Iterator[bytes]:
+        for part in self._parts:
+            if isinstance(part, FileReference):
+                yield b'"'
+                yield from b64encode_file(path=part.path, chunk_size=self.chunk_size)
+                yield b'"'
+            else:
+                yield part
+
+    def __iter__(self) -> t.Iterator[bytes]:  # type: ignore[override]
+        if self._buffer:
+            self._position += len(self._buffer)
+            yield self._buffer
+            self._buffer = b""
+        for chunk in self._chunks:
+            self._position += len(chunk)
+            yield chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if offset == 0 and whence == io.SEEK_CUR:
+            return self._position
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Can only rewind a streaming body")
+        self._chunks = self._generate()
+        self._buffer = b""
+        self._position = 0
+        return 0
+
+    def readinto(self, buffer: t.Any) -> int:
+        size = len(buffer)
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+_PLACEHOLDER = "\x00composio-file-{}\x00"
+
+
+def _split(obj: t.Any) -> t.List[t.Union[bytes, FileReference]]:
+    """Encode `obj` as JSON, split around the file references."""
+    references: t.List[FileReference] = []
+
+    def _replace(value: t.Any) -> t.Any:
+        if isinstance(value, FileReference):
+            references.append(value)
+            return _PLACEHOLDER.format(len(references) - 1)
+        if isinstance(value, dict):
+            return {k: _replace(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_replace(v) for v in value]
+        return value
+
+    encoded = json.dumps(_replace(obj), separators=(",", ":"))
+    parts: t.List[t.Union[bytes, FileReference]] = []
+    for idx, reference in enumerate(references):
+        placeholder = json.dumps(_PLACEHOLDER.format(idx))
+        head, encoded = encoded.split(placeholder, 1)
+        parts += [head.encode(), reference]
+    parts.append(encoded.encode())
+    return parts
@@ -2,20 +2,260 @@
 Http client implementation for Composio SDK
 """
 
+import io
+import random
+import threading
+import time
 import typing as t
 from asyncio import AbstractEventLoop
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 
+from aiohttp import ClientResponse as AsyncResponse
 from aiohttp import ClientSession as AsyncSession
-from requests import ReadTimeout
+from aiohttp import ClientTimeout
+from requests import ConnectTimeout
+from requests import ConnectionError as RequestsConnectionError
+from requests import ReadTimeout, Response
 from requests import Session as SyncSession
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.exceptions import MaxRetryError, NewConnectionError
 
-from composio.utils import logging
+from composio.client.exceptions import ComposioClientError
+from composio.utils import codec, logging
+from composio.utils.logging import LazyMessage
 
 
 DEFAULT_RUNTIME = "composio"
 SOURCE_HEADER = "python_sdk"
 DEFAULT_REQUEST_TIMEOUT = 60.0
 
+DEFAULT_POOL_CONNECTIONS = 10
+"""Number of hosts to keep connection pools for."""
+
+DEFAULT_POOL_MAXSIZE = 32
+"""Number of connections to keep alive per host."""
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+class CircuitOpenError(ComposioClientError):
+    """
+    Raised when requests to a host are short circuited after repeated failures.
+    """
+
+
+class RetryPolicy(t.NamedTuple):
+    """
+    Retry policy for HTTP requests.
+
+    Requests using idempotent methods (or carrying an `Idempotency-Key`
+    header) are retried on timeouts, connection errors and `retry_statuses`.
+    Other requests are only retried when it is known that the server did not
+    process them, i.e. when the connection could not be established (refused
+    connections, failed DNS lookups, connect timeouts) and on
+    `429 Too Many Requests`.
+    """
+
+    max_retries: int = 3
+    """Maximum number of retries, does not include the initial attempt."""
+
+    backoff_factor: float = 0.5
+    """Base delay in seconds, the delay doubles with every attempt."""
+
+    max_backoff: float = 30.0
+    """Upper bound for a single delay in seconds."""
+
+    jitter: float = 0.5
+    """Fraction of the delay to randomise."""
+
+    retry_statuses: t.FrozenSet[int] = RETRY_STATUS_CODES
+    """Status codes to retry."""
+
+    respect_retry_after: bool = True
+    """Use the `Retry-After` response header as delay when present."""
+
+    def is_idempotent(self, method: str, headers: t.Optional[t.Mapping]) -> bool:
+        """Check if a request can safely be sent more than once."""
+        return method.upper() in IDEMPOTENT_METHODS or IDEMPOTENCY_KEY_HEADER in (
+            headers or {}
+        )
+
+    def should_retry_status(self, status_code: int, idempotent: bool) -> bool:
+        """Check if a response with `status_code` should be retried."""
+        if status_code == 429:
+            return True
+        return idempotent and status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: t.Optional[float] = None) -> float:
+        """
+        Get delay before the next attempt.
+
+        :param attempt: Zero based index of the attempt which failed
+        :param retry_after: Delay requested by the server
+        :return: Delay in seconds
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return min(max(retry_after, 0.0), self.max_backoff)
+
+        delay = min(self.backoff_factor * (2**attempt), self.max_backoff)
+        return delay * (1 - self.jitter * random.random())
+
+
+def _parse_retry_after(response: Response) -> t.Optional[float]:
+    """Parse `Retry-After` header as delay in seconds."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def _failed_to_connect(error: Exception) -> bool:
+    """Check if a request failed before a connection to the server was made."""
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single host.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests fail fast for `reset_timeout` seconds, after which a single
+    trial request is let through. A successful trial closes the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize circuit breaker.
+
+        :param failure_threshold: Number of consecutive failures to open the
+            circuit after
+        :param reset_timeout: Time in seconds to keep the circuit open for
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: t.Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Check if a request is allowed through."""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def release(self) -> None:
+        """Release the trial request without recording an outcome for it."""
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+
+class EndpointStats(t.NamedTuple):
+    """Request counters for an endpoint."""
+
+    requests: int
+    retries: int
+    failures: int
+    total_latency: float
+    max_latency: float
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class _EndpointMetrics:
+    """Thread safe per endpoint request counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: t.Dict[str, EndpointStats] = {}
+
+    def record(self, endpoint: str, latency: float, retries: int, failed: bool) -> None:
+        with self._lock:
+            stats = self._stats.get(endpoint) or EndpointStats(0, 0, 0, 0.0, 0.0)
+            self._stats[endpoint] = EndpointStats(
+                requests=stats.requests + 1,
+                retries=stats.retries + retries,
+                failures=stats.failures + int(failed),
+                total_latency=stats.total_latency + latency,
+                max_latency=max(stats.max_latency, latency),
+            )
+
+    def snapshot(self) -> t.Dict[str, EndpointStats]:
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class _AsyncJSONResponse(AsyncResponse):
+    """Response which decodes JSON bodies using `composio.utils.codec`."""
+
+    async def json(  # type: ignore[override]
+        self,
+        *,
+        loads: t.Callable[[str], t.Any] = codec.loads,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        return await super().json(loads=loads, **kwargs)
+
 
 class AsyncHttpClient(AsyncSession, logging.WithLogger):
     """Async HTTP client for Composio"""
@@ -40,6 +280,8 @@ class AsyncHttpClient(AsyncSession, logging.WithLogger):
         AsyncSession.__init__(
             self,
             loop=loop,
+            json_serialize=codec.dumps,
+            response_class=_AsyncJSONResponse,
             headers={
                 "x-api-key": api_key,
                 "x-source": SOURCE_HEADER,
@@ -56,8 +298,12 @@ class AsyncHttpClient(AsyncSession, logging.WithLogger):
         def request(url: str, **kwargs: t.Any) -> t.Any:
             """Perform HTTP request."""
             self._logger.debug(
-                f"{method.__name__.upper()} {self.base_url}{url} - {kwargs}"
+                LazyMessage(
+                    f"{method.__name__.upper()} {self.base_url}{url}",
+                    kwargs=kwargs,
+                )
             )
+            kwargs.setdefault("timeout", ClientTimeout(total=self._request_timeout))
             return method(url=f"{self.base_url}{url}", **kwargs)
 
         return request
@@ -77,6 +323,10 @@ class HttpClient(SyncSession, logging.WithLogger):
         api_key: str,
         runtime: t.Optional[str] = None,
         timeout: t.Optional[float] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        circuit_breaker: t.Optional[CircuitBreaker] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ) -> None:
         """
         Initialize client channel for Composio API
@@ -85,6 +335,11 @@ class HttpClient(SyncSession, logging.WithLogger):
         :param api_key: API key for Composio API
         :param runtime: Runtime specifier
         :param timeout: Request timeout
+        :param retry_policy: Policy for retrying failed requests
+        :param circuit_breaker: Circuit breaker for the API host
+        :param pool_connections: Number of hosts to keep connection pools for
+        :param pool_maxsize: Number of connections to keep alive per host,
+            set this to at least the number of threads using the client
         """
         SyncSession.__init__(self)
         logging.WithLogger.__init__(self)
@@ -97,6 +352,21 @@ class HttpClient(SyncSession, logging.WithLogger):
             }
         )
         self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = _EndpointMetrics()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def stats(self) -> t.Dict[str, EndpointStats]:
+        """Get request counters by `METHOD /path`."""
+        return self.metrics.snapshot()
 
     def _wrap(self, method: t.Callable) -> t.Callable:
         """Wrap http request."""
@@ -104,19 +374,93 @@ class HttpClient(SyncSession, logging.WithLogger):
         def request(url: str, **kwargs: t.Any) -> t.Any:
             """Perform HTTP request."""
             self._logger.debug(
-                f"{method.__name__.upper()} {self.base_url}{url} - {kwargs}"
+                LazyMessage(
+                    f"{method.__name__.upper()} {self.base_url}{url}",
+                    kwargs=kwargs,
+                )
             )
+            endpoint = f"{method.__name__.upper()} {urlparse(url).path}"
+            idempotent = self.retry_policy.is_idempotent(
+                method=method.__name__,
+                headers=kwargs.get("headers"),
+            )
+            start = time.monotonic()
             retries = 0
-            while retries < 3:
-                try:
-                    return method(
-                        url=f"{self.base_url}{url}",
-                        timeout=self.timeout,
-                        **kwargs,
+            failed = True
+            try:
+                while True:
+                    if not self.circuit_breaker.allow():
+                        raise CircuitOpenError(
+                            f"Circuit open for {self.base_url} after repeated "
+                            "failures, try again later"
+                        )
+
+                    retry_after = None
+                    try:
+                        data = kwargs.get("data")
+                        if retries > 0 and isinstance(data, io.IOBase):
+                            # Streamed bodies are consumed by the previous attempt
+                            data.seek(0)
+
+                        response = method(
+                            url=f"{self.base_url}{url}",
+                            timeout=self.timeout,
+                            **kwargs,
+                        )
+                    except (ConnectTimeout, ReadTimeout, RequestsConnectionError) as e:
+                        self.circuit_breaker.record_failure()
+                        # A request which failed to connect was never received
+                        # by the server, anything else is only safe to resend
+                        # if the request is idempotent.
+                        retryable = idempotent or _failed_to_connect(error=e)
+                        if not retryable or retries >= self.retry_policy.max_retries:
+                            if isinstance(e, (ConnectTimeout, ReadTimeout)):
+                                raise TimeoutError(
+                                    "Timed out while waiting for request to complete"
+                                ) from e
+                            raise
+                    except RequestException:
+                        self.circuit_breaker.record_failure()
+                        raise
+                    except BaseException:
+                        # Not caused by the host, eg. invalid request arguments,
+                        # but the trial request must not be left pending
+                        self.circuit_breaker.release()
+                        raise
+                    else:
+                        if response.status_code < 500:
+                            self.circuit_breaker.record_success()
+                        else:
+                            self.circuit_breaker.record_failure()
+
+                        if (
+                            not self.retry_policy.should_retry_status(
+                                status_code=response.status_code,
+                                idempotent=idempotent,
+                            )
+                            or retries >= self.retry_policy.max_retries
+                        ):
+                            failed = response.status_code >= 400
+                            return response
+                        retry_after = _parse_retry_after(response=response)
+                        response.close()
+
+                    delay = self.retry_policy.backoff(
+                        attempt=retries,
+                        retry_after=retry_after,
                     )
-                except ReadTimeout:
                     retries += 1
-            raise TimeoutError("Timed out while waiting for request to complete")
+                    self._logger.debug(
+                        f"Retrying {endpoint} in {delay:.2f}s ({retries=})"
+                    )
+                    time.sleep(delay)
+            finally:
+                self.metrics.record(
+                    endpoint=endpoint,
+                    latency=time.monotonic() - start,
+                    retries=retries,
+                    failed=failed,
+                )
 
         return request
 
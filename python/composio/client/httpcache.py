@@ -0,0 +1,384 @@
+"""
+Persistent HTTP cache for metadata endpoints.
+
+Responses are stored in a single SQLite file and revalidated using the
+`ETag` and `Last-Modified` validators. Entries validated within the fresh
+TTL are served as is, entries past the TTL but within the
+stale-while-revalidate window are served immediately and revalidated in the
+background, older entries are revalidated before they are served.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+import requests
+
+from composio.client.http import HttpClient
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.utils import logging
+
+
+ENV_COMPOSIO_HTTP_CACHE = "COMPOSIO_HTTP_CACHE"
+"""Set to `false` to disable the HTTP cache."""
+
+ENV_COMPOSIO_HTTP_CACHE_TTL = "COMPOSIO_HTTP_CACHE_TTL"
+"""Fresh TTL in seconds."""
+
+ENV_COMPOSIO_HTTP_CACHE_SWR = "COMPOSIO_HTTP_CACHE_SWR"
+"""Stale-while-revalidate window in seconds."""
+
+DEFAULT_HTTP_CACHE_PATH = LOCAL_CACHE_DIRECTORY / "http.db"
+
+DEFAULT_FRESH_TTL = 60.0
+"""Number of seconds after validation during which an entry is served
+without revalidating it."""
+
+DEFAULT_STALE_WHILE_REVALIDATE = 300.0
+"""Number of seconds after validation during which an entry is served
+without waiting for revalidation."""
+
+DEFAULT_MAX_ENTRIES = 512
+"""Maximum number of responses to keep, least recently validated ones are
+dropped first."""
+
+CACHE_STATUS_HEADER = "X-Composio-Cache"
+"""Header set on responses served from the cache, `hit` or `revalidated`."""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS responses ("
+    "key TEXT PRIMARY KEY, "
+    "url TEXT NOT NULL, "
+    "etag TEXT, "
+    "last_modified TEXT, "
+    "validated_at REAL NOT NULL, "
+    "body BLOB NOT NULL"
+    ") WITHOUT ROWID"
+)
+
+
+class CachedResponse(t.NamedTuple):
+    """Cached response body with its validators."""
+
+    url: str
+    etag: t.Optional[str]
+    last_modified: t.Optional[str]
+    validated_at: float
+    body: bytes
+
+
+class HttpCacheStats(t.NamedTuple):
+    """HTTP cache counters."""
+
+    hits: int
+    """Requests served from the cache without waiting for the network."""
+
+    revalidated: int
+    """Requests served from the cache after a `304 Not Modified`."""
+
+    misses: int
+    """Requests which downloaded the response."""
+
+    errors: int
+    """Failed cache reads, writes or background revalidations."""
+
+
+class HttpCache(logging.WithLogger):
+    """
+    Persistent cache for `GET` responses.
+
+    Example:
+    ```python
+        cache = HttpCache(
+            path=Path("http.db"),
+            fresh_ttl=10.0,
+            stale_while_revalidate=60.0,
+        )
+        response = cache.get(http=client.http, url="/v1/apps")
+        print (cache.stats())
+    ```
+
+    Entries are keyed by API key, base URL and request URL including the
+    query, and only successful responses are stored. Storage errors are
+    logged and the request falls back to the network.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_HTTP_CACHE_PATH,
+        fresh_ttl: float = DEFAULT_FRESH_TTL,
+        stale_while_revalidate: float = DEFAULT_STALE_WHILE_REVALIDATE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Initialize HTTP cache.
+
+        :param path: Path to the cache file
+        :param fresh_ttl: Number of seconds after validation during which an
+            entry is served without revalidating it
+        :param stale_while_revalidate: Number of seconds after validation
+            during which an entry is served while being revalidated in the
+            background, once it is older than `fresh_ttl`
+        :param max_entries: Maximum number of responses to keep
+        :param enabled: Set to `False` to send every request to the network
+        """
+        super().__init__()
+        self.path = path
+        self.fresh_ttl = fresh_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.RLock()
+        self._conn: t.Optional[sqlite3.Connection] = None
+        self._revalidating: t.Set[str] = set()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._errors = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path),
+                timeout=5.0,
+                check_same_thread=False,
+            )
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection to the cache file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def key(http: HttpClient, url: str) -> str:
+        """Get cache key for a request."""
+        api_key = str(http.headers.get("x-api-key") or "")
+        digest = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return f"{digest} {http.base_url}{url}"
+
+    def lookup(self, key: str) -> t.Optional[CachedResponse]:
+        """Get cached response for `key`."""
+        with self._lock:
+            try:
+                row = (
+                    self._connection()
+                    .execute(
+                        "SELECT url, etag, last_modified, validated_at, body "
+                        "FROM responses WHERE key = ?",
+                        (key,),
+                    )
+                    .fetchone()
+                )
+            except (OSError, sqlite3.Error) as e:
+                self._errors += 1
+                self.logger.debug(f"Error reading HTTP cache: {e}")
+                return None
+        return None if row is None else CachedResponse(*row)
+
+    def store(self, key: str, entry: CachedResponse) -> None:
+        """Store a response and drop the least recently validated entries."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, url, etag, last_modified, validated_at, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, *entry),
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN ("
+                    "SELECT key FROM responses ORDER BY validated_at DESC LIMIT ?"
+                    ")",
+                    (self.max_entries,),
+                )
+                conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                self._errors += 1
+                self.logger.debug(f"Error writing HTTP cache: {e}")
+
+    def _touch(self, key: str) -> None:
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "UPDATE responses SET validated_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                self._errors += 1
+                self.logger.debug(f"Error writing HTTP cache: {e}")
+
+    def invalidate(self, http: t.Optional[HttpClient] = None, url: str = "") -> int:
+        """
+        Drop cached responses.
+
+        :param http: Only drop responses cached for this client
+        :param url: Only drop responses for URLs starting with this prefix,
+            requires `http`
+        :return: Number of responses dropped
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                if http is None:
+                    cursor = conn.execute("DELETE FROM responses")
+                else:
+                    prefix = self.key(http=http, url=url)
+                    cursor = conn.execute(
+                        "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                        (len(prefix), prefix),
+                    )
+                conn.commit()
+                return cursor.rowcount
+            except (OSError, sqlite3.Error) as e:
+                self._errors += 1
+                self.logger.debug(f"Error writing HTTP cache: {e}")
+                return 0
+
+    def get(self, http: HttpClient, url: str) -> requests.Response:
+        """
+        Perform a `GET` request using the cache.
+
+        :param http: HTTP client to use for the request
+        :param url: Request URL, relative to the client's base URL
+        :return: Http response, cached responses have status code 200 and
+            the `X-Composio-Cache` header set
+        """
+        if not self.enabled:
+            return http.get(url=url)
+
+        key = self.key(http=http, url=url)
+        entry = self.lookup(key=key)
+        if entry is None:
+            return self._fetch(http=http, url=url, key=key, entry=None)
+
+        age = time.time() - entry.validated_at
+        if age < self.stale_while_revalidate:
+            with self._lock:
+                self._hits += 1
+            if age >= self.fresh_ttl:
+                self._revalidate_in_background(http=http, url=url, key=key, entry=entry)
+            return _response(entry=entry, status="hit")
+
+        return self._fetch(http=http, url=url, key=key, entry=entry)
+
+    def _fetch(
+        self,
+        http: HttpClient,
+        url: str,
+        key: str,
+        entry: t.Optional[CachedResponse],
+    ) -> requests.Response:
+        """Perform a conditional request and update the cache."""
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        response = http.get(url=url, headers=headers) if headers else http.get(url=url)
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self._revalidated += 1
+            self._touch(key=key)
+            return _response(entry=entry, status="revalidated")
+
+        if response.status_code == 200 and isinstance(response.content, bytes):
+            self.store(
+                key=key,
+                entry=CachedResponse(
+                    url=f"{http.base_url}{url}",
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    validated_at=time.time(),
+                    body=response.content,
+                ),
+            )
+        with self._lock:
+            self._misses += 1
+        return response
+
+    def _revalidate_in_background(
+        self,
+        http: HttpClient,
+        url: str,
+        key: str,
+        entry: CachedResponse,
+    ) -> None:
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def _revalidate() -> None:
+            try:
+                self._fetch(http=http, url=url, key=key, entry=entry)
+            except Exception as e:  # pylint: disable=broad-except
+                with self._lock:
+                    self._errors += 1
+                self.logger.debug(f"Error revalidating {url}: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=_revalidate, daemon=True).start()
+
+    def stats(self) -> HttpCacheStats:
+        """Get cache counters."""
+        with self._lock:
+            return HttpCacheStats(
+                hits=self._hits,
+                revalidated=self._revalidated,
+                misses=self._misses,
+                errors=self._errors,
+            )
+
+
+def _response(entry: CachedResponse, status: str) -> requests.Response:
+    """Build a response object for a cached entry."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = entry.url
+    response.encoding = "utf-8"
+    response._content = entry.body  # pylint: disable=protected-access
+    response.headers[CACHE_STATUS_HEADER] = status
+    if entry.etag is not None:
+        response.headers["ETag"] = entry.etag
+    if entry.last_modified is not None:
+        response.headers["Last-Modified"] = entry.last_modified
+    return response
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+http_cache = HttpCache(
+    fresh_ttl=_env_seconds(
+        name=ENV_COMPOSIO_HTTP_CACHE_TTL,
+        default=DEFAULT_FRESH_TTL,
+    ),
+    stale_while_revalidate=_env_seconds(
+        name=ENV_COMPOSIO_HTTP_CACHE_SWR,
+        default=DEFAULT_STALE_WHILE_REVALIDATE,
+    ),
+    enabled=os.environ.get(ENV_COMPOSIO_HTTP_CACHE, "true").lower()
+    not in ("0", "false", "no"),
+)
+"""Process wide HTTP cache for metadata endpoints."""
@@ -0,0 +1,310 @@
+"""
+Durable journal for trigger events.
+
+Events are appended to a SQLite file as they are received and handed to the
+consumers in batches. A consumer commits the offset of the last event it has
+handled, events after the committed offset are delivered again after a
+restart, which makes delivery at-least-once.
+"""
+
+import sqlite3
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.utils import logging
+
+
+DEFAULT_JOURNAL_PATH = LOCAL_CACHE_DIRECTORY / "triggers.db"
+
+DEFAULT_CONSUMER = "default"
+"""Name of the consumer used by the trigger subscription."""
+
+DEFAULT_BATCH_SIZE = 100
+"""Maximum number of events returned by a poll."""
+
+DEFAULT_RETAIN = 1024
+"""Number of handled events the trigger subscription keeps for replays."""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS events ("
+    "offset INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "received_at REAL NOT NULL, "
+    "event TEXT NOT NULL"
+    ")",
+    "CREATE TABLE IF NOT EXISTS consumers ("
+    "name TEXT PRIMARY KEY, "
+    "offset INTEGER NOT NULL"
+    ") WITHOUT ROWID",
+)
+
+
+class JournalEntry(t.NamedTuple):
+    """Journaled event."""
+
+    offset: int
+    """Position of the event in the journal, increases monotonically."""
+
+    received_at: float
+    """Time the event was appended as a UNIX timestamp."""
+
+    event: str
+    """Event payload."""
+
+
+class JournalStats(t.NamedTuple):
+    """Event journal counters."""
+
+    head: int
+    """Offset of the last appended event."""
+
+    committed: int
+    """Lowest offset committed by the consumers."""
+
+    size: int
+    """Number of events stored in the journal."""
+
+    appended: int
+    """Number of events appended by this process."""
+
+    delivered: int
+    """Number of events returned by polls in this process."""
+
+    compacted: int
+    """Number of events removed by compaction in this process."""
+
+
+class EventJournal(logging.WithLogger):
+    """
+    SQLite backed, append only event journal.
+
+    Example:
+    ```python
+        journal = EventJournal(path=Path("triggers.db"))
+        journal.append(event='{"appName": "github", ...}')
+        for entry in journal.poll(limit=10, timeout=1.0):
+            print (entry.offset, entry.event)
+            journal.commit(offset=entry.offset)
+        journal.compact()
+    ```
+
+    Every consumer reads the journal from its own committed offset. Polls
+    advance an in memory position, so consecutive polls return new events
+    while events which were polled but not committed are delivered again
+    once the journal is reopened or `replay` is called.
+    """
+
+    def __init__(self, path: Path = DEFAULT_JOURNAL_PATH) -> None:
+        """
+        Initialize event journal.
+
+        :param path: Path to the journal file
+        """
+        super().__init__()
+        self.path = path
+        self._lock = threading.RLock()
+        self._appended_cond = threading.Condition(self._lock)
+        self._conn: t.Optional[sqlite3.Connection] = None
+        self._positions: t.Dict[str, int] = {}
+        self._appended = 0
+        self._delivered = 0
+        self._compacted = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path),
+                timeout=5.0,
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection to the journal file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._positions.clear()
+
+    def append(self, event: str) -> int:
+        """
+        Append an event.
+
+        :param event: Event payload
+        :return: Offset of the event
+        """
+        return self.append_batch(events=[event])[-1]
+
+    def append_batch(self, events: t.Sequence[str]) -> t.List[int]:
+        """
+        Append events in a single transaction.
+
+        :param events: Event payloads
+        :return: Offsets of the events
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                offsets = [
+                    t.cast(
+                        int,
+                        conn.execute(
+                            "INSERT INTO events (received_at, event) VALUES (?, ?)",
+                            (now, event),
+                        ).lastrowid,
+                    )
+                    for event in events
+                ]
+            self._appended += len(offsets)
+            self._appended_cond.notify_all()
+        return offsets
+
+    def read(
+        self, offset: int = 0, limit: int = DEFAULT_BATCH_SIZE
+    ) -> t.List[JournalEntry]:
+        """
+        Read events without affecting the consumers.
+
+        :param offset: Return events after this offset
+        :param limit: Maximum number of events to return
+        :return: List of journal entries
+        """
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT offset, received_at, event FROM events "
+                    "WHERE offset > ? ORDER BY offset LIMIT ?",
+                    (offset, limit),
+                )
+                .fetchall()
+            )
+        return [JournalEntry(*row) for row in rows]
+
+    def committed(self, consumer: str = DEFAULT_CONSUMER) -> int:
+        """Get the last offset committed by `consumer`, 0 if none."""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT offset FROM consumers WHERE name = ?", (consumer,))
+                .fetchone()
+            )
+        return 0 if row is None else row[0]
+
+    def poll(
+        self,
+        limit: int = DEFAULT_BATCH_SIZE,
+        timeout: t.Optional[float] = None,
+        consumer: str = DEFAULT_CONSUMER,
+    ) -> t.List[JournalEntry]:
+        """
+        Get the next batch of events for a consumer.
+
+        :param limit: Maximum number of events to return
+        :param timeout: Number of seconds to wait for an event, waits
+            indefinitely if `None`
+        :param consumer: Name of the consumer
+        :return: List of journal entries, empty if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                position = self._positions.get(consumer)
+                if position is None:
+                    position = self._positions[consumer] = self.committed(
+                        consumer=consumer
+                    )
+
+                entries = self.read(offset=position, limit=limit)
+                if len(entries) > 0:
+                    self._positions[consumer] = entries[-1].offset
+                    self._delivered += len(entries)
+                    return entries
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return []
+                self._appended_cond.wait(timeout=remaining)
+
+    def commit(self, offset: int, consumer: str = DEFAULT_CONSUMER) -> None:
+        """
+        Mark the events up to `offset` as handled by `consumer`.
+
+        :param offset: Offset of the last handled event
+        :param consumer: Name of the consumer
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO consumers (name, offset) VALUES (?, ?)",
+                    (consumer, offset),
+                )
+            self._positions[consumer] = max(self._positions.get(consumer, 0), offset)
+
+    def replay(self, offset: int = 0, consumer: str = DEFAULT_CONSUMER) -> None:
+        """
+        Deliver the events after `offset` to `consumer` again.
+
+        Only events which have not been compacted can be replayed.
+
+        :param offset: Offset to restart from, events after it are delivered
+        :param consumer: Name of the consumer
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO consumers (name, offset) VALUES (?, ?)",
+                    (consumer, offset),
+                )
+            self._positions[consumer] = offset
+            self._appended_cond.notify_all()
+
+    def compact(self, retain: int = 0) -> int:
+        """
+        Remove the events committed by every consumer.
+
+        :param retain: Number of committed events to keep for replays
+        :return: Number of events removed
+        """
+        with self._lock:
+            conn = self._connection()
+            (committed,) = conn.execute("SELECT MIN(offset) FROM consumers").fetchone()
+            if committed is None:
+                return 0
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM events WHERE offset <= ?",
+                    (committed - max(retain, 0),),
+                )
+            self._compacted += cursor.rowcount
+            return cursor.rowcount
+
+    def stats(self) -> JournalStats:
+        """Get event journal counters."""
+        with self._lock:
+            conn = self._connection()
+            (head,) = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'events'"
+            ).fetchone() or (0,)
+            (committed,) = conn.execute("SELECT MIN(offset) FROM consumers").fetchone()
+            (size,) = conn.execute("SELECT COUNT(*) FROM events").fetchone()
+            return JournalStats(
+                head=head,
+                committed=committed or 0,
+                size=size,
+                appended=self._appended,
+                delivered=self._delivered,
+                compacted=self._compacted,
+            )
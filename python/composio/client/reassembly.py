@@ -0,0 +1,310 @@
+"""
+Bounded, expiring buffer for reassembling chunked trigger events.
+"""
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from composio.utils import logging
+
+
+DEFAULT_CHUNK_TTL = 300.0
+"""Number of seconds an event has to receive its final chunk after the first
+one arrives."""
+
+DEFAULT_MAX_BUFFER_SIZE = 64 * 1024 * 1024
+"""Maximum total length of the buffered chunks across all events."""
+
+DROP_EXPIRED = "expired"
+"""The final chunk did not arrive within the TTL."""
+
+DROP_EVICTED = "evicted"
+"""The event was dropped to keep the buffer within its size limit."""
+
+DROP_LATE = "late"
+"""A chunk arrived for an event which was already dropped."""
+
+DROP_INCOMPLETE = "incomplete"
+"""The final chunk arrived but some of the earlier chunks were missing."""
+
+
+class DroppedEvent(t.NamedTuple):
+    """Chunked event which was dropped before it was complete."""
+
+    id: str
+    """ID of the chunked event."""
+
+    reason: str
+    """Why the event was dropped, `expired`, `evicted`, `incomplete` or
+    `late`."""
+
+    chunks: int
+    """Number of chunks received, or discarded for `late` chunks."""
+
+    size: int
+    """Total length of the chunks received."""
+
+    age: float
+    """Number of seconds since the first chunk arrived, or since the event
+    was dropped for `late` chunks."""
+
+
+DropCallback = t.Callable[[DroppedEvent], None]
+
+
+class ReassemblyStats(t.NamedTuple):
+    """Chunk buffer counters."""
+
+    pending: int
+    """Number of events waiting for more chunks."""
+
+    size: int
+    """Total length of the buffered chunks."""
+
+    completed: int
+    """Number of events reassembled."""
+
+    expired: int
+    """Number of events dropped because they timed out."""
+
+    evicted: int
+    """Number of events dropped to stay within the size limit."""
+
+    late: int
+    """Number of chunks discarded because their event was already dropped."""
+
+    incomplete: int
+    """Number of events dropped because chunks were missing."""
+
+
+class _Pending:
+    """Chunks received for one event."""
+
+    __slots__ = ("created", "chunks", "size")
+
+    def __init__(self, created: float) -> None:
+        self.created = created
+        self.chunks: t.Dict[int, str] = {}
+        self.size = 0
+
+
+class ChunkBuffer(logging.WithLogger):
+    """
+    Reassembly buffer for chunked events.
+
+    Example:
+    ```python
+        buffer = ChunkBuffer(ttl=60.0, max_size=1024 * 1024)
+        buffer.add(key="event", index=0, chunk='{"a": ', final=False)
+        print (buffer.add(key="event", index=1, chunk="1}", final=True))
+        print (buffer.stats())
+    ```
+
+    Events which do not receive their final chunk within `ttl` seconds or
+    which are missing chunks when the final one arrives are dropped, and once the buffered chunks grow past `max_size` the oldest
+    events are dropped first. Expiry is checked whenever a chunk arrives,
+    `expire` can be called to check without adding a chunk. Dropped events
+    are remembered for another `ttl` seconds, chunks arriving for them in
+    that time are discarded and reported as `late`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CHUNK_TTL,
+        max_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        on_drop: t.Optional[DropCallback] = None,
+    ) -> None:
+        """
+        Initialize chunk buffer.
+
+        :param ttl: Number of seconds an event has to receive its final chunk
+        :param max_size: Maximum total length of the buffered chunks
+        :param on_drop: Callback for events dropped before they were complete
+        """
+        super().__init__()
+        self.ttl = ttl
+        self.max_size = max_size
+        self._on_drop = [on_drop] if on_drop is not None else []
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[str, _Pending]" = OrderedDict()
+        self._dropped: "OrderedDict[str, float]" = OrderedDict()
+        self._size = 0
+        self._completed = 0
+        self._expired = 0
+        self._evicted = 0
+        self._late = 0
+        self._incomplete = 0
+
+    def on_drop(self, callback: DropCallback) -> DropCallback:
+        """Register a callback for events dropped before they were complete."""
+        self._on_drop.append(callback)
+        return callback
+
+    def add(self, key: str, index: int, chunk: str, final: bool) -> t.Optional[str]:
+        """
+        Add a chunk.
+
+        :param key: ID of the chunked event
+        :param index: Position of the chunk in the event
+        :param chunk: Chunk content
+        :param final: Whether this is the last chunk of the event
+        :return: Reassembled event once the final chunk arrives, `None`
+            otherwise
+        """
+        now = time.monotonic()
+        dropped = []
+        event = None
+        with self._lock:
+            dropped.extend(self._expire(now=now))
+            if key in self._dropped:
+                dropped.append(self._discard(now=now, key=key, chunk=chunk))
+            else:
+                event = self._append(
+                    now=now,
+                    key=key,
+                    index=index,
+                    chunk=chunk,
+                    final=final,
+                    dropped=dropped,
+                )
+            while self._size > self.max_size and len(self._pending) > 0:
+                dropped.append(self._drop(now=now, reason=DROP_EVICTED))
+
+        self._notify(dropped=dropped)
+        return event
+
+    def _append(
+        self,
+        now: float,
+        key: str,
+        index: int,
+        chunk: str,
+        final: bool,
+        dropped: t.List[DroppedEvent],
+    ) -> t.Optional[str]:
+        """
+        Buffer a chunk and join the chunks once the final one arrives.
+
+        If chunks are missing when the final one arrives the event is dropped
+        and added to `dropped` instead.
+        """
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _Pending(created=now)
+
+        growth = len(chunk) - len(pending.chunks.get(index, ""))
+        pending.chunks[index] = chunk
+        pending.size += growth
+        self._size += growth
+        if not final:
+            return None
+
+        if pending.chunks.keys() != set(range(index + 1)):
+            dropped.append(self._drop(now=now, reason=DROP_INCOMPLETE, key=key))
+            return None
+
+        self._remove(key=key)
+        self._completed += 1
+        return "".join(pending.chunks[idx] for idx in sorted(pending.chunks))
+
+    def _discard(self, now: float, key: str, chunk: str) -> DroppedEvent:
+        """Discard a chunk for an event which was already dropped."""
+        self._late += 1
+        return DroppedEvent(
+            id=key,
+            reason=DROP_LATE,
+            chunks=1,
+            size=len(chunk),
+            age=now - self._dropped[key],
+        )
+
+    def expire(self) -> int:
+        """
+        Drop the events which did not complete within the TTL.
+
+        :return: Number of events dropped
+        """
+        with self._lock:
+            dropped = self._expire(now=time.monotonic())
+        self._notify(dropped=dropped)
+        return len(dropped)
+
+    def _expire(self, now: float) -> t.List[DroppedEvent]:
+        """Drop expired events, the oldest events are at the front."""
+        while len(self._dropped) > 0:
+            if now - next(iter(self._dropped.values())) < self.ttl:
+                break
+            self._dropped.popitem(last=False)
+
+        dropped = []
+        while len(self._pending) > 0:
+            pending = next(iter(self._pending.values()))
+            if now - pending.created < self.ttl:
+                break
+            dropped.append(self._drop(now=now, reason=DROP_EXPIRED))
+        return dropped
+
+    def _remove(self, key: str) -> _Pending:
+        pending = self._pending.pop(key)
+        self._size -= pending.size
+        return pending
+
+    def _drop(
+        self,
+        now: float,
+        reason: str,
+        key: t.Optional[str] = None,
+    ) -> DroppedEvent:
+        """Drop the event for `key`, the oldest event by default."""
+        key = key if key is not None else next(iter(self._pending))
+        pending = self._remove(key=key)
+        self._dropped[key] = now
+        if reason == DROP_EXPIRED:
+            self._expired += 1
+        elif reason == DROP_INCOMPLETE:
+            self._incomplete += 1
+        else:
+            self._evicted += 1
+        return DroppedEvent(
+            id=key,
+            reason=reason,
+            chunks=len(pending.chunks),
+            size=pending.size,
+            age=now - pending.created,
+        )
+
+    def _notify(self, dropped: t.List[DroppedEvent]) -> None:
+        for event in dropped:
+            if event.reason == DROP_LATE:
+                self.logger.warning(
+                    f"Discarded chunk for chunked event `{event.id}` which was "
+                    f"dropped {event.age:.1f}s ago"
+                )
+            else:
+                self.logger.warning(
+                    f"Dropped chunked event `{event.id}` ({event.reason}) after "
+                    f"receiving {event.chunks} chunks in {event.age:.1f}s"
+                )
+            for callback in self._on_drop:
+                try:
+                    callback(event)
+                except Exception as e:  # pylint: disable=broad-except
+                    self.logger.error(
+                        f"Error executing `{callback.__name__}` for dropped "
+                        f"event `{event.id}`: {e}"
+                    )
+
+    def stats(self) -> ReassemblyStats:
+        """Get chunk buffer counters."""
+        with self._lock:
+            return ReassemblyStats(
+                pending=len(self._pending),
+                size=self._size,
+                completed=self._completed,
+                expired=self._expired,
+                evicted=self._evicted,
+                late=self._late,
+                incomplete=self._incomplete,
+            )
@@ -18,19 +18,36 @@ from pathlib import Path
 
 import typing_extensions as te
 from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, JSONResponse
+from pydantic import BaseModel, Field, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from composio import Action, App
 from composio.cli.context import get_context
-from composio.client.collections import ActionModel, AppModel
+from composio.client.collections import ActionModel, AppModel, TriggerSubscription
 from composio.client.enums.base import get_runtime_actions
+from composio.server.webhooks import (
+    DELIVERY_HEADER,
+    ENV_COMPOSIO_WEBHOOK_SECRET,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    DeliveryLog,
+    WebhookDelivery,
+    WebhookDeliveryResponse,
+    WebhookVerificationError,
+    verify,
+)
 from composio.tools.base.abs import action_registry
 from composio.tools.env.base import ENV_ACCESS_TOKEN
 from composio.tools.local import load_local_tools
+from composio.utils import codec
 from composio.utils.logging import get as get_logger
 
 
+WEBHOOK_PATH = "/api/triggers/webhook"
+"""Path for receiving signed trigger event deliveries."""
+
+
 ResponseType = t.TypeVar("ResponseType")
 
 R = t.TypeVar("R")
@@ -109,13 +126,126 @@ class ValidateToolsRequest(BaseModel):
     )
 
 
-def create_app() -> FastAPI:
-    """Create Fast API app."""
+class CodecJSONResponse(JSONResponse):
+    """JSON response encoded using `composio.utils.codec`."""
+
+    def render(self, content: t.Any) -> bytes:
+        return codec.dumpb(content)
+
+
+def _error_response(error: str, status_code: int) -> Response:
+    return Response(
+        content=APIResponse[None](data=None, error=error).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _add_webhook_route(
+    app: FastAPI,
+    subscription: TriggerSubscription,
+    webhook_secret: t.Optional[str],
+) -> None:
+    """Add the route receiving signed webhook deliveries to `app`."""
+    deliveries = DeliveryLog()
+
+    @app.post(
+        WEBHOOK_PATH,
+        response_model=APIResponse[WebhookDeliveryResponse],
+        status_code=202,
+    )
+    async def _receive_webhook(request: Request):
+        """Receive a batch of trigger events."""
+        if webhook_secret is None:
+            return _error_response(
+                error=f"Webhook secret is not configured, set {ENV_COMPOSIO_WEBHOOK_SECRET}",
+                status_code=503,
+            )
+
+        body = await request.body()
+        delivery_id = request.headers.get(DELIVERY_HEADER)
+        try:
+            verify(
+                body=body,
+                secret=webhook_secret,
+                signature=request.headers.get(SIGNATURE_HEADER),
+                timestamp=request.headers.get(TIMESTAMP_HEADER),
+                delivery_id=delivery_id,
+            )
+        except WebhookVerificationError as e:
+            return _error_response(error=str(e), status_code=401)
+
+        try:
+            delivery = WebhookDelivery(**codec.loads(body))
+        except (codec.JSONDecodeError, TypeError, ValidationError) as e:
+            return _error_response(error=f"Invalid delivery: {e}", status_code=400)
+
+        # Verified deliveries always carry an ID. It's reserved before
+        # awaiting, so a retry arriving while this delivery is being handed
+        # over is reported as a duplicate.
+        delivery_id = t.cast(str, delivery_id)
+        accepted = deliveries.reserve(
+            delivery_id=delivery_id,
+            accepted=len(delivery.events),
+        )
+        if accepted is not None:
+            return APIResponse[WebhookDeliveryResponse](
+                data=WebhookDeliveryResponse(accepted=accepted, duplicate=True)
+            )
+
+        def _accept() -> None:
+            for event in delivery.events:
+                subscription.receive_event(event=codec.dumps(event))
+
+        try:
+            # Handing events over blocks while the workers are saturated
+            await run_in_threadpool(_accept)
+        except Exception:
+            deliveries.release(delivery_id=delivery_id)
+            raise
+        return APIResponse[WebhookDeliveryResponse](
+            data=WebhookDeliveryResponse(
+                accepted=len(delivery.events),
+                duplicate=False,
+            )
+        )
+
+
+def create_app(
+    trigger_subscription: t.Optional[TriggerSubscription] = None,
+    webhook_secret: t.Optional[str] = None,
+) -> FastAPI:
+    """
+    Create Fast API app.
+
+    :param trigger_subscription: Subscription for the events received by the
+        webhook receiver, a new one is created if not provided. Available
+        as `app.state.trigger_subscription` for registering callbacks.
+    :param webhook_secret: Secret for verifying webhook deliveries, read
+        from `COMPOSIO_WEBHOOK_SECRET` if not provided. The webhook receiver
+        rejects every delivery if no secret is configured.
+    """
     load_local_tools()
 
     access_token = os.environ.get(ENV_ACCESS_TOKEN)
+    webhook_secret = webhook_secret or os.environ.get(ENV_COMPOSIO_WEBHOOK_SECRET)
+    subscription = trigger_subscription or TriggerSubscription()
     tooldir = tempfile.TemporaryDirectory()
-    app = FastAPI(on_shutdown=[tooldir.cleanup])
+    on_shutdown = [tooldir.cleanup]
+    if trigger_subscription is None:
+        on_shutdown.append(subscription.close)
+
+    app = FastAPI(
+        on_startup=[subscription.start],
+        on_shutdown=on_shutdown,
+        default_response_class=CodecJSONResponse,
+    )
+    app.state.trigger_subscription = subscription
+    _add_webhook_route(
+        app=app,
+        subscription=subscription,
+        webhook_secret=webhook_secret,
+    )
     sys.path.append(tooldir.name)
     logger = get_logger()
 
@@ -140,6 +270,10 @@ def create_app() -> FastAPI:
         if access_token is None:
             return await call_next(request)
 
+        # Webhook deliveries are verified using their signature
+        if request.url.path == WEBHOOK_PATH:
+            return await call_next(request)
+
         if "x-api-key" in request.headers and request.headers["x-api-key"]:
             return await call_next(request)
 
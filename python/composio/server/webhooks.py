@@ -0,0 +1,278 @@
+"""
+Signed webhook deliveries for trigger events.
+
+A delivery is a batch of trigger events posted as JSON, signed with a secret
+shared between the sender and the receivers. The signature covers the
+delivery timestamp, the delivery ID and the raw body, so any receiver with
+the secret can verify a delivery.
+
+Delivery is at-least-once. Each receiver remembers the IDs of the deliveries
+it accepted and reports retries as duplicates, but that log is kept per
+process. When receivers are scaled horizontally a retry landing on another
+replica is handled again, so callbacks should be idempotent.
+"""
+
+import hashlib
+import hmac
+import random
+import threading
+import time
+import typing as t
+import uuid
+from collections import OrderedDict
+
+from pydantic import BaseModel, Field
+
+from composio.utils import codec
+
+
+ENV_COMPOSIO_WEBHOOK_SECRET = "COMPOSIO_WEBHOOK_SECRET"
+"""Secret used to verify webhook deliveries."""
+
+SIGNATURE_HEADER = "X-Composio-Signature"
+"""Header with the hex encoded HMAC-SHA256 signature, prefixed by `sha256=`."""
+
+TIMESTAMP_HEADER = "X-Composio-Timestamp"
+"""Header with the UNIX timestamp of the delivery in seconds."""
+
+DELIVERY_HEADER = "X-Composio-Delivery"
+"""Header with the unique ID of the delivery, retries reuse the same ID."""
+
+DEFAULT_TOLERANCE = 300.0
+"""Maximum age of a delivery in seconds, older deliveries are rejected."""
+
+MAX_CLOCK_SKEW = 30.0
+"""Number of seconds a delivery timestamp may be ahead of the receiver's
+clock, deliveries from further in the future are rejected."""
+
+DELIVERY_ID_TTL = 2 * DEFAULT_TOLERANCE
+"""Number of seconds to remember accepted delivery IDs, long enough that a
+replayed delivery is rejected for being stale before its ID is forgotten."""
+
+MAX_BATCH_SIZE = 1000
+"""Maximum number of events in a delivery."""
+
+
+class WebhookDelivery(BaseModel):
+    """Batch of trigger events."""
+
+    events: t.List[t.Dict[str, t.Any]] = Field(
+        ...,
+        description="Trigger event payloads.",
+        max_length=MAX_BATCH_SIZE,
+    )
+
+
+class WebhookDeliveryResponse(BaseModel):
+    """Response for a webhook delivery."""
+
+    accepted: int = Field(
+        ...,
+        description="Number of events accepted for handling.",
+    )
+    duplicate: bool = Field(
+        False,
+        description="Whether the delivery was already accepted.",
+    )
+
+
+class WebhookVerificationError(Exception):
+    """Raised when a delivery cannot be verified."""
+
+
+class DeliveryLog:
+    """
+    IDs of the deliveries accepted by a receiver.
+
+    Example:
+    ```python
+        deliveries = DeliveryLog()
+        accepted = deliveries.reserve(delivery_id="d_1", accepted=10)
+        if accepted is not None:
+            print (f"Duplicate of a delivery with {accepted} events")
+    ```
+
+    IDs are kept for `ttl` seconds however many deliveries arrive in that
+    time, so a replayed delivery is rejected as stale before its ID can be
+    forgotten. Since every ID lives for the same time, expired IDs are always
+    at the front of the log and are dropped as new ones are added.
+    """
+
+    def __init__(self, ttl: float = DELIVERY_ID_TTL) -> None:
+        """
+        Initialize delivery log.
+
+        :param ttl: Number of seconds to remember a delivery ID
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, t.Tuple[float, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of delivery IDs in the log, including expired ones."""
+        return len(self._entries)
+
+    def reserve(self, delivery_id: str, accepted: int) -> t.Optional[int]:
+        """
+        Record a delivery unless it was already accepted.
+
+        :param delivery_id: ID of the delivery
+        :param accepted: Number of events in the delivery
+        :return: Number of events of the earlier delivery if `delivery_id` is
+            a duplicate, `None` if the delivery was recorded
+        """
+        now = time.monotonic()
+        with self._lock:
+            while len(self._entries) > 0:
+                expires, _ = next(iter(self._entries.values()))
+                if expires > now:
+                    break
+                self._entries.popitem(last=False)
+
+            entry = self._entries.get(delivery_id)
+            if entry is not None:
+                return entry[1]
+
+            self._entries[delivery_id] = (now + self.ttl, accepted)
+            return None
+
+    def release(self, delivery_id: str) -> None:
+        """Forget a delivery which could not be handled, so it can be retried."""
+        with self._lock:
+            self._entries.pop(delivery_id, None)
+
+
+def sign(body: bytes, secret: str, timestamp: str, delivery_id: str) -> str:
+    """
+    Sign a delivery.
+
+    :param body: Raw request body
+    :param secret: Shared webhook secret
+    :param timestamp: Delivery timestamp, as sent in the timestamp header
+    :param delivery_id: Delivery ID, as sent in the delivery header
+    :return: Value for the signature header
+    """
+    digest = hmac.new(
+        key=secret.encode(),
+        msg=f"{timestamp}.{delivery_id}.".encode() + body,
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify(
+    body: bytes,
+    secret: str,
+    signature: t.Optional[str],
+    timestamp: t.Optional[str],
+    delivery_id: t.Optional[str],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> None:
+    """
+    Verify the signature and age of a delivery.
+
+    :param body: Raw request body
+    :param secret: Shared webhook secret
+    :param signature: Value of the signature header
+    :param timestamp: Value of the timestamp header
+    :param delivery_id: Value of the delivery header
+    :param tolerance: Maximum age of the delivery in seconds
+    :raises WebhookVerificationError: If the delivery is not valid
+    """
+    if signature is None or timestamp is None or delivery_id is None:
+        raise WebhookVerificationError("Missing signature headers")
+
+    try:
+        age = time.time() - float(timestamp)
+    except ValueError as e:
+        raise WebhookVerificationError("Invalid delivery timestamp") from e
+
+    if age > tolerance or age < -MAX_CLOCK_SKEW:
+        raise WebhookVerificationError("Delivery timestamp is outside the tolerance")
+
+    expected = sign(
+        body=body,
+        secret=secret,
+        timestamp=timestamp,
+        delivery_id=delivery_id,
+    )
+    if not hmac.compare_digest(expected, signature):
+        raise WebhookVerificationError("Invalid delivery signature")
+
+
+def build_delivery(
+    events: t.Sequence[t.Dict[str, t.Any]],
+    secret: str,
+    delivery_id: t.Optional[str] = None,
+) -> t.Tuple[bytes, t.Dict[str, str]]:
+    """
+    Build a signed delivery.
+
+    :param events: Trigger event payloads
+    :param secret: Shared webhook secret
+    :param delivery_id: ID of the delivery, generated if not provided
+    :return: Request body and headers
+    """
+    body = codec.dumpb({"events": list(events)})
+    timestamp = str(int(time.time()))
+    delivery_id = delivery_id or uuid.uuid4().hex
+    return body, {
+        "Content-Type": "application/json",
+        SIGNATURE_HEADER: sign(
+            body=body,
+            secret=secret,
+            timestamp=timestamp,
+            delivery_id=delivery_id,
+        ),
+        TIMESTAMP_HEADER: timestamp,
+        DELIVERY_HEADER: delivery_id,
+    }
+
+
+SYNTHETIC_TRIGGERS = (
+    ("github", "GITHUB_STAR_ADDED_EVENT"),
+    ("github", "GITHUB_COMMIT_EVENT"),
+    ("slack", "SLACK_RECEIVE_MESSAGE"),
+    ("gmail", "GMAIL_NEW_GMAIL_MESSAGE"),
+)
+"""App and trigger names used by the synthetic event generator."""
+
+
+def generate_events(
+    count: int,
+    triggers: t.Sequence[t.Tuple[str, str]] = SYNTHETIC_TRIGGERS,
+    entity_id: str = "default",
+    payload_size: int = 256,
+    seed: t.Optional[int] = None,
+) -> t.Iterator[t.Dict[str, t.Any]]:
+    """
+    Generate synthetic trigger events for testing receivers offline.
+
+    :param count: Number of events to generate
+    :param triggers: `(app, trigger name)` pairs to pick events from
+    :param entity_id: Entity ID set on the events
+    :param payload_size: Length of the text field in the event payloads
+    :param seed: Seed for picking the triggers, for reproducible runs
+    :return: Iterator over trigger event payloads
+    """
+    rng = random.Random(seed)
+    for idx in range(count):
+        app, name = rng.choice(triggers)
+        yield {
+            "appName": app,
+            "payload": {"idx": idx, "text": "x" * payload_size},
+            "originalPayload": {},
+            "metadata": {
+                "id": f"ti_{app}_{name.lower()}",
+                "connectionId": f"ca_{app}",
+                "triggerName": name,
+                "triggerData": "",
+                "triggerConfig": {},
+                "connection": {
+                    "id": f"ca_{app}",
+                    "integrationId": f"integration_{app}",
+                    "clientUniqueUserId": entity_id,
+                    "status": "ACTIVE",
+                },
+            },
+        }
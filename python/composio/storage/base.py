@@ -2,13 +2,14 @@
 Local storage helpers.
 """
 
-import json
 import typing as t
 from pathlib import Path
 
 import typing_extensions as tx
 from pydantic import BaseModel
 
+from composio.utils import codec
+
 
 class LocalStorage(BaseModel):
     """
@@ -38,6 +39,9 @@ class LocalStorage(BaseModel):
 
     path: t.Optional[Path] = None
 
+    indent: t.ClassVar[t.Optional[int]] = None
+    """Indent for the stored JSON, set for files which are edited by hand."""
+
     def to_json(self) -> t.Dict:
         """Convert object to JSON dictionary."""
         return self.model_dump()
@@ -58,22 +62,12 @@ class LocalStorage(BaseModel):
         if "path" in data:
             del data["path"]
 
-        self.path.write_text(
-            json.dumps(
-                data,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        self.path.write_bytes(codec.dumpb(data, indent=self.indent))
 
     @classmethod
     def load(cls, path: Path) -> tx.Self:
         """Load user account from cache."""
         return cls.from_json(
-            obj=json.loads(
-                path.read_text(
-                    encoding="utf-8",
-                )
-            ),
+            obj=codec.loads(path.read_bytes()),
             path=path,
         )
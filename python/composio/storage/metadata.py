@@ -0,0 +1,305 @@
+"""
+Packed metadata store.
+
+Stores the enum metadata (apps, actions, tags and triggers) in a single
+SQLite file instead of one JSON file per entry.
+"""
+
+import os
+import sqlite3
+import threading
+import typing as t
+from pathlib import Path
+
+from composio.utils import codec
+
+
+SCHEMA_VERSION = "1"
+
+DEFAULT_MMAP_SIZE = 64 * 1024 * 1024
+"""Number of bytes of the store to memory map."""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        "kind TEXT NOT NULL, "
+        "slug TEXT NOT NULL, "
+        "data TEXT NOT NULL, "
+        "PRIMARY KEY (kind, slug)"
+        ") WITHOUT ROWID"
+    ),
+    (
+        "CREATE TABLE IF NOT EXISTS indexes ("
+        "name TEXT NOT NULL, "
+        "key TEXT NOT NULL, "
+        "slug TEXT NOT NULL, "
+        "PRIMARY KEY (name, key, slug)"
+        ") WITHOUT ROWID"
+    ),
+)
+
+EntryType = t.Tuple[str, str, t.Dict]
+IndexType = t.Mapping[str, t.Iterable[str]]
+
+
+class MetadataStore:
+    """
+    Single file, indexed metadata store.
+
+    Example:
+    ```python
+        store = MetadataStore(path=Path("metadata.db"))
+        store.replace(entries=[("apps", "GITHUB", {"name": "github"})])
+        print (store.get(kind="apps", slug="GITHUB"))
+    ```
+
+    Readers memory map the file, updates are written to a temporary file
+    which atomically replaces the store, so concurrent readers either see
+    the old or the new version of the store. Open stores are reopened when
+    the file gets replaced.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        legacy: t.Optional[t.Dict[str, Path]] = None,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+    ) -> None:
+        """
+        Initialize metadata store.
+
+        :param path: Path to the store file
+        :param legacy: Directories containing per entry JSON files indexed by
+            kind, these will be migrated to the store if the store does not
+            exist yet
+        :param mmap_size: Number of bytes to memory map
+        """
+        self.path = path
+        self.legacy = legacy or {}
+        self.mmap_size = mmap_size
+        self._lock = threading.RLock()
+        self._conn: t.Optional[sqlite3.Connection] = None
+        self._inode: t.Optional[int] = None
+        self._migrated = False
+
+    def _connect(self, path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.commit()
+        return conn
+
+    def _connection(self, create: bool = False) -> t.Optional[sqlite3.Connection]:
+        """Get connection to the current version of the store."""
+        if not self._migrated:
+            self._migrated = True
+            self.migrate()
+
+        try:
+            inode = self.path.stat().st_ino
+        except FileNotFoundError:
+            inode = None
+
+        if self._conn is not None and inode == self._inode:
+            return self._conn
+
+        self.close()
+        if inode is None and not create:
+            return None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect(path=self.path)
+        self._inode = self.path.stat().st_ino
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection to the store."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._inode = None
+
+    def get(self, kind: str, slug: str) -> t.Optional[t.Dict]:
+        """
+        Get metadata for an entry.
+
+        :param kind: Entry kind, eg. `actions`
+        :param slug: Entry slug
+        :return: Metadata dictionary or `None` if the entry does not exist
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT data FROM entries WHERE kind = ? AND slug = ?",
+                    (kind, slug),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return None if row is None else codec.loads(row[0])
+
+    def items(self, kind: str) -> t.Dict[str, str]:
+        """
+        Get all entries of a kind.
+
+        :param kind: Entry kind, eg. `actions`
+        :return: Dictionary of JSON encoded metadata by slug, decoding is left
+            to the caller so entries which are not used are never decoded
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return {}
+                return dict(
+                    conn.execute(
+                        "SELECT slug, data FROM entries WHERE kind = ?", (kind,)
+                    ).fetchall()
+                )
+            except sqlite3.Error:
+                return {}
+
+    def index(self, name: str) -> t.Optional[t.Dict[str, t.List[str]]]:
+        """
+        Get an inverted index.
+
+        :param name: Name of the index, eg. `tags`
+        :return: Dictionary of sorted slugs by key or `None` if the index was
+            not built with the current version of the store
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                if conn is None:
+                    return None
+                if (
+                    conn.execute(
+                        "SELECT 1 FROM meta WHERE key = ?", (f"index:{name}",)
+                    ).fetchone()
+                    is None
+                ):
+                    return None
+                rows = conn.execute(
+                    "SELECT key, slug FROM indexes WHERE name = ? ORDER BY key, slug",
+                    (name,),
+                ).fetchall()
+            except sqlite3.Error:
+                return None
+
+        index: t.Dict[str, t.List[str]] = {}
+        for key, slug in rows:
+            index.setdefault(key, []).append(slug)
+        return index
+
+    def put(self, kind: str, slug: str, data: t.Dict) -> None:
+        """
+        Add or update a single entry in place.
+
+        :param kind: Entry kind, eg. `actions`
+        :param slug: Entry slug
+        :param data: Metadata dictionary
+        """
+        with self._lock:
+            conn = self._connection(create=True)
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (kind, slug, data) VALUES (?, ?, ?)",
+                (kind, slug, codec.dumps(data)),
+            )
+            conn.commit()
+
+    def replace(
+        self,
+        entries: t.Iterable[EntryType],
+        indexes: t.Optional[t.Mapping[str, IndexType]] = None,
+    ) -> int:
+        """
+        Atomically replace the contents of the store.
+
+        :param entries: Iterable of `(kind, slug, data)` tuples
+        :param indexes: Inverted indexes to store along with the entries,
+            mapping index name to a dictionary of slugs by key
+        :return: Number of entries written
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        if tmp.exists():
+            tmp.unlink()
+
+        conn = self._connect(path=tmp)
+        try:
+            cursor = conn.executemany(
+                "INSERT OR REPLACE INTO entries (kind, slug, data) VALUES (?, ?, ?)",
+                ((kind, slug, codec.dumps(data)) for kind, slug, data in entries),
+            )
+            count = cursor.rowcount
+            for name, index in (indexes or {}).items():
+                conn.executemany(
+                    "INSERT OR IGNORE INTO indexes (name, key, slug) VALUES (?, ?, ?)",
+                    (
+                        (name, key, slug)
+                        for key, slugs in index.items()
+                        for slug in slugs
+                    ),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, '1')",
+                    (f"index:{name}",),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                (SCHEMA_VERSION,),
+            )
+            conn.commit()
+        except BaseException:
+            conn.close()
+            tmp.unlink()
+            raise
+        conn.close()
+
+        with self._lock:
+            os.replace(tmp, self.path)
+            self.close()
+        return count
+
+    def migrate(self) -> int:
+        """
+        Migrate legacy per entry JSON files to the store.
+
+        Nothing is migrated if the store already exists.
+
+        :return: Number of entries migrated
+        """
+        if self.path.exists():
+            return 0
+
+        entries = list(_read_legacy(directories=self.legacy))
+        if len(entries) == 0:
+            return 0
+
+        try:
+            return self.replace(entries=entries)
+        except (OSError, sqlite3.Error):
+            return 0
+
+
+def _read_legacy(directories: t.Dict[str, Path]) -> t.Iterator[EntryType]:
+    """Read per entry JSON files."""
+    for kind, directory in directories.items():
+        if not directory.is_dir():
+            continue
+        for file in directory.iterdir():
+            if not file.is_file():
+                continue
+            try:
+                data = codec.loads(file.read_bytes())
+            except (OSError, ValueError):
+                continue
+            data.pop("path", None)
+            yield kind, file.name, data
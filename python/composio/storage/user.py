@@ -12,6 +12,8 @@ class UserData(LocalStorage):
     Local user data storage.
     """
 
+    indent = 4
+
     api_key: t.Optional[str] = None
     """
     API key for Composio API server
@@ -2,7 +2,6 @@
 
 import hashlib
 import inspect
-import json
 import typing as t
 from abc import abstractmethod
 from pathlib import Path
@@ -14,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from composio.client.enums import Action as ActionEnum
 from composio.exceptions import ComposioSDKError
+from composio.utils import codec
 from composio.utils.logging import WithLogger
 from composio.utils.pydantic import parse_pydantic_error
 
@@ -33,13 +33,12 @@ trigger_registry: TriggersRegistry = {"runtime": {}, "local": {}, "api": {}}
 
 
 def remove_json_ref(data: t.Dict) -> t.Dict:
-    return json.loads(
+    return codec.loads(
         jsonref.dumps(
             jsonref.replace_refs(
                 obj=data,
                 lazy_load=False,
             ),
-            indent=2,
         )
     )
 
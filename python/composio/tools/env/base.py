@@ -12,6 +12,7 @@ from composio.client.enums import Action, ActionType, AppType, TagType
 from composio.constants import ENV_COMPOSIO_API_KEY, ENV_COMPOSIO_BASE_URL
 from composio.exceptions import ComposioSDKError
 from composio.tools.env.id import generate_id
+from composio.utils import codec
 from composio.utils.logging import WithLogger
 
 
@@ -270,7 +271,7 @@ class RemoteWorkspace(Workspace):
                 "dependencies": obj.requires or [],
             },
         )
-        response = request.json()
+        response = codec.loads(request.content)
         if response["error"] is not None:
             self.logger.error(
                 f"Error while uploading {action.slug}: " + response["error"]
@@ -303,7 +304,7 @@ class RemoteWorkspace(Workspace):
         if request.status_code != 200:
             raise ComposioSDKError(f"Error installing dependencies: {request.text}")
 
-        response = request.json()
+        response = codec.loads(request.content)
         if response["error"] is not None:
             raise ComposioSDKError(
                 f"Error installing dependencies: {response['error']}"
@@ -327,7 +328,7 @@ class RemoteWorkspace(Workspace):
                 "metadata": metadata,
             },
         )
-        response = request.json()
+        response = codec.loads(request.content)
         if response["error"] is None:
             return response["data"]
         raise RuntimeError(f"Error while executing {action.slug}: " + response["error"])
@@ -7,11 +7,14 @@ from dataclasses import dataclass
 from uuid import uuid4
 
 import requests
-from e2b import Sandbox
 
 from composio.tools.env.base import RemoteWorkspace, WorkspaceConfigType
 
 
+if t.TYPE_CHECKING:
+    from e2b import Sandbox
+
+
 DEFAULT_TEMPLATE = "2h9ws7lsk32jyow50lqz"
 
 TOOLSERVER_PORT = 8000
@@ -38,7 +41,7 @@ class Config(WorkspaceConfigType):
 class E2BWorkspace(RemoteWorkspace):
     """Create and manage E2B workspace."""
 
-    sandbox: Sandbox
+    sandbox: "Sandbox"
 
     def __init__(self, config: Config):
         """Initialize E2B workspace."""
@@ -68,6 +71,10 @@ class E2BWorkspace(RemoteWorkspace):
 
     def setup(self) -> None:
         """Start toolserver."""
+        # Imported here, the E2B SDK is slow to import and only needed for
+        # E2B workspaces
+        from e2b import Sandbox  # pylint: disable=import-outside-toplevel
+
         # Start sandbox
         self.sandbox = Sandbox(template=self.template, api_key=self.api_key)
         self.url = TOOLSERVER_URL.format(host=self.sandbox.get_host(self.port))
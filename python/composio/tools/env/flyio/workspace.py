@@ -7,7 +7,10 @@ from dataclasses import dataclass
 from urllib.parse import urlparse
 
 from composio.tools.env.base import RemoteWorkspace, WorkspaceConfigType
-from composio.tools.env.flyio.client import FlyIO, PortRequest
+
+
+if t.TYPE_CHECKING:
+    from composio.tools.env.flyio.client import FlyIO, PortRequest
 
 
 @dataclass
@@ -20,14 +23,14 @@ class Config(WorkspaceConfigType):
     token: t.Optional[str] = None
     """FlyIO API token."""
 
-    ports: t.Optional[t.List[PortRequest]] = None
+    ports: t.Optional[t.List["PortRequest"]] = None
     """Port requests."""
 
 
 class FlyIOWorkspace(RemoteWorkspace):
     """FlyIO Workspace."""
 
-    flyio: FlyIO
+    flyio: "FlyIO"
 
     def __init__(self, config: Config):
         """Initialize FlyIO workspace."""
@@ -38,6 +41,12 @@ class FlyIOWorkspace(RemoteWorkspace):
 
     def setup(self) -> None:
         """Setup workspace."""
+        # Imported here, the GraphQL client is slow to import and only needed
+        # for FlyIO workspaces
+        from composio.tools.env.flyio.client import (  # pylint: disable=import-outside-toplevel
+            FlyIO,
+        )
+
         self.flyio = FlyIO(
             access_token=self.access_token,
             image=self.image,
@@ -1,20 +1,123 @@
 """Local tools."""
 
 import importlib
+import json
+import threading
+import typing as t
 from pathlib import Path
 
+import typing_extensions as te
+
 from composio.tools.base.abs import ToolRegistry, tool_registry
 
 
 TOOLS_PATH = Path(__file__).parent
 
+MANIFEST_PATH = TOOLS_PATH / "manifest.json"
+"""Pre-generated list of local tool modules and the tools/actions they define."""
+
+
+class LocalToolsManifest(te.TypedDict):
+    """Local tools manifest."""
+
+    modules: t.List[str]
+    """Modules defining local tools."""
+
+    tools: t.Dict[str, t.List[str]]
+    """Action names by tool name."""
+
+
+_lock = threading.Lock()
+_loaded = False
+_manifest: t.Optional[LocalToolsManifest] = None
+
+
+def _discover_modules() -> t.List[str]:
+    """Walk the local tools directory for tool modules."""
+    return sorted(
+        "composio.tools.local."
+        + ".".join(tooldef.relative_to(TOOLS_PATH).parent.parts)
+        + ".tool"
+        for tooldef in TOOLS_PATH.glob("**/tool.py")
+    )
+
+
+def get_manifest() -> t.Optional[LocalToolsManifest]:
+    """Get the pre-generated local tools manifest, if available."""
+    global _manifest
+    if _manifest is None and MANIFEST_PATH.exists():
+        _manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    return _manifest
+
+
+def is_local_name(name: str) -> bool:
+    """
+    Check if `name` might refer to a local tool or action.
 
-def load_local_tools() -> ToolRegistry:
-    for tooldef in TOOLS_PATH.glob("**/tool.py"):
-        importlib.import_module(
-            "composio.tools.local."
-            + ".".join(tooldef.relative_to(TOOLS_PATH).parent.parts)
-            + ".tool"
-        )
+    Without a manifest this is always `True` since local tools have to be
+    loaded to find out.
+    """
+    manifest = get_manifest()
+    if manifest is None:
+        return True
+    return name in manifest["tools"] or any(
+        name in actions for actions in manifest["tools"].values()
+    )
+
+
+def load_local_tools(refresh: bool = False) -> ToolRegistry:
+    """
+    Load local tools.
+
+    The tool modules are imported once per process, the module list is read
+    from the manifest if available so the tools directory does not need to be
+    walked.
+
+    :param refresh: Walk the tools directory again and import any modules
+        which were not loaded yet.
+    :return: Tool registry
+    """
+    global _loaded
+    if _loaded and not refresh:
+        return tool_registry
+
+    with _lock:
+        if _loaded and not refresh:
+            return tool_registry
+
+        manifest = None if refresh else get_manifest()
+        if refresh:
+            importlib.invalidate_caches()
+
+        modules = manifest["modules"] if manifest is not None else _discover_modules()
+        for module in modules:
+            importlib.import_module(module)
+        _loaded = True
 
     return tool_registry
+
+
+def refresh_local_tools() -> ToolRegistry:
+    """Reload the local tool registry."""
+    return load_local_tools(refresh=True)
+
+
+def build_manifest() -> LocalToolsManifest:
+    """Build the local tools manifest by loading all local tools."""
+    registry = load_local_tools(refresh=True)
+    modules = _discover_modules()
+    return {
+        "modules": modules,
+        "tools": {
+            name: sorted(action.enum for action in tool.actions())
+            for name, tool in sorted(registry["local"].items())
+            if type(tool).__module__ in modules
+        },
+    }
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> LocalToolsManifest:
+    """Build and write the local tools manifest."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
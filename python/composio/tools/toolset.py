@@ -2,16 +2,16 @@
 Composio SDK tools.
 """
 
-import base64
+import asyncio
 import binascii
 import hashlib
 import itertools
-import json
 import os
 import time
 import typing as t
 import warnings
-from functools import wraps
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial, wraps
 from importlib.util import find_spec
 from pathlib import Path
 
@@ -20,7 +20,7 @@ from pydantic import BaseModel
 from pydantic.v1.main import BaseModel as V1BaseModel
 
 from composio import Action, ActionType, App, AppType, TagType
-from composio.client import Composio, Entity
+from composio.client import AsyncComposio, AsyncEntity, Composio, Entity
 from composio.client.collections import (
     ActionModel,
     AppAuthScheme,
@@ -29,8 +29,10 @@ from composio.client.collections import (
     SuccessExecuteActionResponseModel,
     TriggerSubscription,
 )
-from composio.client.enums.base import EnumStringNotFound
+from composio.client.enums.base import EnumStringNotFound, get_index
 from composio.client.exceptions import ComposioClientError, HTTPError
+from composio.client.files import b64decode_to_file
+from composio.client.journal import EventJournal
 from composio.constants import (
     DEFAULT_ENTITY_ID,
     ENV_COMPOSIO_API_KEY,
@@ -49,8 +51,25 @@ from composio.tools.env.base import (
 from composio.tools.env.factory import HostWorkspaceConfig, WorkspaceFactory
 from composio.tools.local import load_local_tools
 from composio.tools.local.handler import LocalClient
+from composio.utils import codec
+from composio.utils.cache import TTLCache
 from composio.utils.enums import get_enum_key
-from composio.utils.logging import LogLevel, WithLogger
+from composio.utils.instrumentation import (
+    OUTCOME_FAILURE,
+    PHASE_CONNECTED_ACCOUNT,
+    PHASE_EXECUTE,
+    PHASE_HTTP,
+    PHASE_LOCAL,
+    PHASE_POSTPROCESS,
+    PHASE_PREPROCESS,
+    PHASE_PROCESSOR,
+    PHASE_SAVE_FILES,
+    PHASE_SERIALIZE,
+    Instrumentation,
+    SpanType,
+)
+from composio.utils.instrumentation import instrumentation as _instrumentation
+from composio.utils.logging import LazyMessage, LogLevel, WithLogger
 from composio.utils.url import get_api_url_base
 
 
@@ -63,6 +82,17 @@ _ProcessorType = t.Callable[[t.Dict], t.Dict]
 MetadataType = t.Dict[_KeyType, t.Dict]
 ParamType = t.TypeVar("ParamType")
 
+DEFAULT_BATCH_CONCURRENCY = 8
+"""Default number of actions executed in parallel by `execute_actions`."""
+
+DEFAULT_SCHEMA_CACHE_TTL = 300.0
+"""Time in seconds processed action schemas are cached for."""
+
+DEFAULT_SCHEMA_CACHE_SIZE = 128
+"""Number of distinct schema queries cached per toolset."""
+
+_SchemaCacheKey = t.Tuple[t.Hashable, ...]
+
 
 class ProcessorsType(te.TypedDict):
     """Request and response processors."""
@@ -77,6 +107,140 @@ class ProcessorsType(te.TypedDict):
     """Schema processors"""
 
 
+ProcessorKindType = te.Literal["pre", "post", "schema"]
+_ProcessorKeyType = t.Tuple[str, str, str]
+_ProcessorChainType = t.Tuple[t.Tuple[_ProcessorKeyType, _ProcessorType], ...]
+
+_PROCESSOR_LABELS: t.Dict[str, str] = {
+    "pre": "request",
+    "post": "response",
+    "schema": "schema",
+}
+
+
+class _ProcessorDispatch:
+    """
+    Processors compiled into per action chains.
+
+    App and action keys are resolved once when the dispatch table is built,
+    the chain for an action is resolved the first time it's processed and
+    processing is skipped entirely if no processors of a type are registered.
+    Every processor call is recorded as a `processor` span, tagged with the
+    processor name and type.
+    """
+
+    _ORDER: t.Dict[str, t.Tuple[str, str]] = {
+        "pre": ("app", "action"),
+        "post": ("action", "app"),
+        "schema": ("action", "app"),
+    }
+
+    def __init__(
+        self,
+        processors: ProcessorsType,
+        instrumentation: Instrumentation,
+    ) -> None:
+        self._table: t.Dict[_ProcessorKeyType, _ProcessorType] = {}
+        for type_ in self._ORDER:
+            for key, processor in processors.get(type_, {}).items():  # type: ignore
+                kind, slug = self._resolve(key=key)
+                self._table[(type_, kind, slug)] = processor
+
+        self._types = {type_ for type_, _, _ in self._table}
+        self._chains: t.Dict[t.Tuple[str, str], _ProcessorChainType] = {}
+        self._instrumentation = instrumentation
+
+    @staticmethod
+    def _resolve(key: _KeyType) -> t.Tuple[str, str]:
+        """Resolve a processor key to `(kind, slug)`."""
+        if isinstance(key, App):
+            return "app", key.slug
+        if isinstance(key, Action):
+            return "action", key.slug
+
+        slug = str(key).upper()
+        if slug in Action.__annotations__:
+            return "action", slug
+        if slug in App.__annotations__:
+            return "app", slug
+        try:
+            return "action", Action(t.cast(ActionType, key)).slug
+        except EnumStringNotFound:
+            return "app", App(t.cast(AppType, key)).slug
+
+    @property
+    def fingerprint(self) -> t.Tuple[t.Tuple[str, str, str, int], ...]:
+        """Hashable description of the registered processors."""
+        return tuple(
+            sorted((*key, id(processor)) for key, processor in self._table.items())
+        )
+
+    def has(self, type_: ProcessorKindType) -> bool:
+        """Check if any processors of `type_` are registered."""
+        return type_ in self._types
+
+    def chain(self, action: Action, type_: ProcessorKindType) -> _ProcessorChainType:
+        """Get processors of `type_` for `action` in execution order."""
+        chain = self._chains.get((type_, action.slug))
+        if chain is not None:
+            return chain
+
+        slugs = {"action": action.slug, "app": App(action.app).slug}
+        keys = [(type_, kind, slugs[kind]) for kind in self._ORDER[type_]]
+        chain = tuple((key, self._table[key]) for key in keys if key in self._table)
+        self._chains[(type_, action.slug)] = chain
+        return chain
+
+    def run(
+        self,
+        action: Action,
+        data: t.Dict,
+        type_: ProcessorKindType,
+        logger: t.Any,
+    ) -> t.Dict:
+        """Run `data` through the processors of `type_` for `action`."""
+        if type_ not in self._types:
+            return data
+
+        for _, processor in self.chain(action=action, type_=type_):
+            logger.info(
+                f"Running {_PROCESSOR_LABELS[type_]} through: {processor.__name__}"
+            )
+            with self._instrumentation.span(
+                PHASE_PROCESSOR,
+                action=action.slug,
+                processor=processor.__name__,
+                type=type_,
+            ):
+                data = processor(data)
+        return data
+
+
+class ActionCall(t.NamedTuple):
+    """Single action call in a batch execution request."""
+
+    action: ActionType
+    params: t.Dict
+    entity_id: str = DEFAULT_ENTITY_ID
+    connected_account_id: t.Optional[str] = None
+    metadata: t.Optional[t.Dict] = None
+    text: t.Optional[str] = None
+
+
+ActionCallType = t.Union[ActionCall, t.Sequence, t.Dict[str, t.Any]]
+
+
+class ActionCallResult(t.NamedTuple):
+    """Result of a single action call in a batch execution request."""
+
+    response: t.Optional[t.Dict] = None
+    error: t.Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 def _check_agentops() -> bool:
     """Check if AgentOps is installed and initialized."""
     if find_spec("agentops") is None:
@@ -104,7 +268,12 @@ class ComposioToolSet(WithLogger):
 
     _connected_accounts: t.Optional[t.List[ConnectedAccountModel]] = None
     _remote_client: t.Optional[Composio] = None
+    _async_remote_client: t.Optional[AsyncComposio] = None
     _workspace: t.Optional[Workspace] = None
+    _instrumentation: Instrumentation = _instrumentation
+    _processor_dispatch: _ProcessorDispatch = _ProcessorDispatch(
+        processors={}, instrumentation=_instrumentation
+    )
 
     _runtime: str = "composio"
     _description_char_limit: int = 1024
@@ -140,6 +309,8 @@ class ComposioToolSet(WithLogger):
         output_dir: t.Optional[Path] = None,
         verbosity_level: t.Optional[int] = None,
         connected_account_ids: t.Optional[t.Dict[AppType, str]] = None,
+        instrumentation: t.Optional[Instrumentation] = None,
+        schema_cache_ttl: float = DEFAULT_SCHEMA_CACHE_TTL,
         **kwargs: t.Any,
     ) -> None:
         """
@@ -213,6 +384,12 @@ class ComposioToolSet(WithLogger):
             be printed on the console.
         :param connection_ids: Use this to define connection IDs to use when executing
             an action for a specific app.
+        :param instrumentation: Instrumentation for recording spans and timings
+            of the action execution phases, defaults to the global
+            `composio.utils.instrumentation.instrumentation` object.
+        :param schema_cache_ttl: Time in seconds to cache processed action
+            schemas returned by `get_action_schemas` for, set to `0` to
+            disable caching.
         """
         super().__init__(
             logging_level=logging_level,
@@ -250,6 +427,17 @@ class ComposioToolSet(WithLogger):
         self._workspace_id = workspace_id
         self._workspace_config = workspace_config
         self._local_client = LocalClient()
+        self._instrumentation = (
+            instrumentation if instrumentation is not None else _instrumentation
+        )
+        self._processor_dispatch = _ProcessorDispatch(
+            processors=self._processors,
+            instrumentation=self._instrumentation,
+        )
+        self.schema_cache: TTLCache[_SchemaCacheKey, t.List[ActionModel]] = TTLCache(
+            maxsize=DEFAULT_SCHEMA_CACHE_SIZE,
+            ttl=schema_cache_ttl,
+        )
 
         if len(kwargs) > 0:
             self.logger.info(f"Extra kwards while initializing toolset: {kwargs}")
@@ -329,6 +517,17 @@ class ComposioToolSet(WithLogger):
         self._remote_client.local = self._local_client
         return self._remote_client
 
+    @property
+    def async_client(self) -> AsyncComposio:
+        if self._async_remote_client is None:
+            self._async_remote_client = AsyncComposio(
+                api_key=self._api_key,
+                base_url=self._base_url,
+                runtime=self._runtime,
+            )
+        self._async_remote_client.local = self._local_client
+        return self._async_remote_client
+
     @property
     def workspace(self) -> Workspace:
         """Workspace for this toolset instance."""
@@ -370,9 +569,25 @@ class ComposioToolSet(WithLogger):
                 t.List[ConnectedAccountModel],
                 self.client.connected_accounts.get(),
             )
+        self._ensure_connected_account(action=action)
+
+    async def _acheck_connected_account(self, action: ActionType) -> None:
+        """Async version of `check_connected_account`."""
+        action = Action(action)
+        if action.no_auth or action.is_runtime:
+            return
 
+        if self._connected_accounts is None:
+            self._connected_accounts = t.cast(
+                t.List[ConnectedAccountModel],
+                await self.async_client.connected_accounts.get(),
+            )
+        self._ensure_connected_account(action=action)
+
+    def _ensure_connected_account(self, action: Action) -> None:
+        """Raise if no account is connected for the app `action` belongs to."""
         if action.app not in [
-            connection.appUniqueId for connection in self._connected_accounts
+            connection.appUniqueId for connection in self._connected_accounts or []
         ]:
             raise ComposioSDKError(
                 f"No connected account found for app `{action.app}`; "
@@ -404,13 +619,57 @@ class ComposioToolSet(WithLogger):
         text: t.Optional[str] = None,
     ) -> t.Dict:
         """Execute a remote action."""
-        self.check_connected_account(action=action)
-        output = self.client.get_entity(id=entity_id).execute(
-            action=action,
-            params=params,
-            text=text,
-            connected_account_id=connected_account_id,
-        )
+        with self._instrumentation.span(PHASE_CONNECTED_ACCOUNT):
+            self.check_connected_account(action=action)
+        with self._instrumentation.span(PHASE_HTTP):
+            output = self.client.get_entity(id=entity_id).execute(
+                action=action,
+                params=params,
+                text=text,
+                connected_account_id=connected_account_id,
+            )
+        with self._instrumentation.span(PHASE_SAVE_FILES):
+            return self._handle_remote_output(
+                action=action,
+                output=output,
+                entity_id=entity_id,
+            )
+
+    async def _aexecute_remote(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+        connected_account_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """Execute a remote action on the running event loop."""
+        with self._instrumentation.span(PHASE_CONNECTED_ACCOUNT):
+            await self._acheck_connected_account(action=action)
+        with self._instrumentation.span(PHASE_HTTP):
+            output = await self.async_client.get_entity(id=entity_id).execute(
+                action=action,
+                params=params,
+                text=text,
+                connected_account_id=connected_account_id,
+            )
+        with self._instrumentation.span(PHASE_SAVE_FILES):
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: self._handle_remote_output(
+                    action=action,
+                    output=output,
+                    entity_id=entity_id,
+                ),
+            )
+
+    def _handle_remote_output(
+        self,
+        action: Action,
+        output: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+    ) -> t.Dict:
+        """Write output to file or decode file outputs from a remote execution."""
         if self.output_in_file:
             return self._write_to_file(
                 action=action,
@@ -455,9 +714,7 @@ class ComposioToolSet(WithLogger):
                     / f"{file_name_prefix}_{file_model.name.replace('/', '_')}"
                 )
 
-                _write_file(
-                    local_filepath, base64.urlsafe_b64decode(file_model.content)
-                )
+                b64decode_to_file(content=file_model.content, path=local_filepath)
 
                 resp_data[key] = str(local_filepath)
             except binascii.Error:
@@ -484,7 +741,7 @@ class ComposioToolSet(WithLogger):
         self._ensure_output_dir_exists()
         outfile = self.output_dir / filename
         self.logger.info(f"Writing output to: {outfile}")
-        _write_file(outfile, json.dumps(output))
+        _write_file(outfile, codec.dumps(output))
         return {
             "message": f"output written to {outfile.resolve()}",
             "file": str(outfile.resolve()),
@@ -531,67 +788,43 @@ class ComposioToolSet(WithLogger):
         metadata.update(self._get_metadata(key=action))
         return metadata
 
-    def _get_processor(
-        self,
-        key: _KeyType,
-        type_: te.Literal["post", "pre", "schema"],
-    ) -> t.Optional[_ProcessorType]:
-        """Get processor for given app or action"""
-        processor = self._processors.get(type_, {}).get(key)  # type: ignore
-        if processor is not None:
-            return processor
-
-        try:
-            return self._processors.get(type_, {}).get(Action(t.cast(ActionType, key)))  # type: ignore
-        except EnumStringNotFound:
-            return self._processors.get(type_, {}).get(App(t.cast(AppType, key)))  # type: ignore
-
-    def _process(
-        self,
-        key: _KeyType,
-        data: t.Dict,
-        type_: te.Literal["pre", "post", "schema"],
-    ) -> t.Dict:
-        processor = self._get_processor(key=key, type_=type_)
-        if processor is not None:
-            self.logger.info(
-                f"Running {'request' if type_ == 'pre' else 'response' if type_ == 'post' else 'schema'}"
-                f" through: {processor.__name__}"
-            )
-            data = processor(data)
-        return data
-
     def _process_request(self, action: Action, request: t.Dict) -> t.Dict:
-        return self._process(
-            key=action,
-            data=self._process(
-                key=App(action.app),
-                data=request,
-                type_="pre",
-            ),
+        return self._processor_dispatch.run(
+            action=action,
+            data=request,
             type_="pre",
+            logger=self.logger,
         )
 
     def _process_respone(self, action: Action, response: t.Dict) -> t.Dict:
-        return self._process(
-            key=App(action.app),
-            data=self._process(
-                key=action,
-                data=response,
-                type_="post",
-            ),
+        return self._processor_dispatch.run(
+            action=action,
+            data=response,
             type_="post",
+            logger=self.logger,
         )
 
     def _process_schema_properties(self, action: Action, properties: t.Dict) -> t.Dict:
-        return self._process(
-            key=App(action.app),
-            data=self._process(
-                key=action,
-                data=properties,
-                type_="schema",
-            ),
+        return self._processor_dispatch.run(
+            action=action,
+            data=properties,
             type_="schema",
+            logger=self.logger,
+        )
+
+    def _execute_span(self, action: Action) -> SpanType:
+        """Create the root span for executing `action`."""
+        if not self._instrumentation.enabled:
+            return self._instrumentation.span(PHASE_EXECUTE)
+        return self._instrumentation.span(
+            PHASE_EXECUTE,
+            action=action.slug,
+            app=action.app,
+            workspace=(
+                type(self.workspace).__name__.replace("Workspace", "").lower()
+                if action.is_local
+                else "remote"
+            ),
         )
 
     @_record_action_if_available
@@ -616,40 +849,390 @@ class ComposioToolSet(WithLogger):
         :return: Output object from the function call
         """
         action = Action(action)
-        params = self._serialize_execute_params(param=params)
-        if not action.is_runtime:
-            params = self._process_request(action=action, request=params)
-            metadata = self._add_metadata(action=action, metadata=metadata)
-            connected_account_id = connected_account_id or self._get_connected_account(
-                action=action
+        with self._execute_span(action=action) as span:
+            with self._instrumentation.span(PHASE_SERIALIZE):
+                params = self._serialize_execute_params(param=params)
+            if not action.is_runtime:
+                with self._instrumentation.span(PHASE_PREPROCESS):
+                    params = self._process_request(action=action, request=params)
+                    metadata = self._add_metadata(action=action, metadata=metadata)
+                    connected_account_id = (
+                        connected_account_id
+                        or self._get_connected_account(action=action)
+                    )
+
+            self.logger.info(
+                LazyMessage(
+                    f"Executing `{action.slug}` with",
+                    params=params,
+                    metadata=metadata,
+                    connected_account_id=connected_account_id,
+                )
             )
+            if action.is_local:
+                with self._instrumentation.span(PHASE_LOCAL):
+                    response = self._execute_local(
+                        action=action,
+                        params=params,
+                        metadata=metadata,
+                    )
+            else:
+                response = self._execute_remote(
+                    action=action,
+                    params=params,
+                    entity_id=entity_id,
+                    connected_account_id=connected_account_id,
+                    text=text,
+                )
+            if not action.is_runtime:
+                with self._instrumentation.span(PHASE_POSTPROCESS):
+                    response = self._process_respone(action=action, response=response)
+            if _is_unsuccessful(response=response):
+                span.tag(outcome=OUTCOME_FAILURE)
 
         self.logger.info(
-            f"Executing `{action.slug}` with {params=} and {metadata=} {connected_account_id=}"
-        )
-        response = (
-            self._execute_local(
-                action=action,
+            LazyMessage(
+                f"Got response from `{action.slug}`",
+                response=response,
                 params=params,
-                metadata=metadata,
             )
-            if action.is_local
-            else self._execute_remote(
-                action=action,
+        )
+        return response
+
+    async def aexecute_action(
+        self,
+        action: ActionType,
+        params: dict,
+        metadata: t.Optional[t.Dict] = None,
+        entity_id: str = DEFAULT_ENTITY_ID,
+        connected_account_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """
+        Execute an action on a given entity without blocking the event loop.
+
+        Remote actions are executed using the `asyncio` client, local actions
+        and writing output files are offloaded to the default executor.
+
+        :param action: Action to execute
+        :param params: The parameters to pass to the action
+        :param entity_id: The ID of the entity to execute the action on. Defaults to "default"
+        :param text: Extra text to use for generating function calling metadata
+        :param metadata: Metadata for executing local action
+        :param connected_account_id: Connection ID for executing the remote action
+        :return: Output object from the function call
+        """
+        action = Action(action)
+        with self._execute_span(action=action) as span:
+            with self._instrumentation.span(PHASE_SERIALIZE):
+                params = self._serialize_execute_params(param=params)
+            if not action.is_runtime:
+                with self._instrumentation.span(PHASE_PREPROCESS):
+                    params = self._process_request(action=action, request=params)
+                    metadata = self._add_metadata(action=action, metadata=metadata)
+                    connected_account_id = (
+                        connected_account_id
+                        or self._get_connected_account(action=action)
+                    )
+
+            self.logger.info(
+                LazyMessage(
+                    f"Executing `{action.slug}` with",
+                    params=params,
+                    metadata=metadata,
+                    connected_account_id=connected_account_id,
+                )
+            )
+            if action.is_local:
+                with self._instrumentation.span(PHASE_LOCAL):
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        partial(
+                            self._execute_local,
+                            action=action,
+                            params=params,
+                            metadata=metadata,
+                        ),
+                    )
+            else:
+                response = await self._aexecute_remote(
+                    action=action,
+                    params=params,
+                    entity_id=entity_id,
+                    connected_account_id=connected_account_id,
+                    text=text,
+                )
+            if not action.is_runtime:
+                with self._instrumentation.span(PHASE_POSTPROCESS):
+                    response = self._process_respone(action=action, response=response)
+            if _is_unsuccessful(response=response):
+                span.tag(outcome=OUTCOME_FAILURE)
+
+        self.logger.info(
+            LazyMessage(
+                f"Got response from `{action.slug}`",
+                response=response,
                 params=params,
-                entity_id=entity_id,
-                connected_account_id=connected_account_id,
-                text=text,
             )
         )
-        response = (
-            response
-            if action.is_runtime
-            else self._process_respone(action=action, response=response)
-        )
-        self.logger.info(f"Got {response=} from {action=} with {params=}")
         return response
 
+    def _prepare_batch(
+        self,
+        calls: t.Sequence[ActionCallType],
+    ) -> t.Tuple[t.List[ActionCall], t.Dict[int, Exception]]:
+        """
+        Normalise batch calls and resolve the lookups shared by them.
+
+        :return: Tuple of normalised calls and errors for the calls which
+            cannot be executed, indexed by their position in the batch.
+        """
+        normalised: t.List[ActionCall] = []
+        errors: t.Dict[int, Exception] = {}
+        for idx, call in enumerate(calls):
+            try:
+                call = (
+                    ActionCall(**call) if isinstance(call, dict) else ActionCall(*call)
+                )
+                normalised.append(call._replace(action=Action(call.action)))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                normalised.append(ActionCall(action=None, params={}))  # type: ignore
+                errors[idx] = e
+        return normalised, errors
+
+    def _batch_actions(
+        self,
+        calls: t.List[ActionCall],
+        errors: t.Dict[int, Exception],
+    ) -> t.Tuple[t.List[Action], t.List[Action]]:
+        """Get unique remote and local actions in a batch."""
+        actions = list(
+            dict.fromkeys(
+                t.cast(Action, call.action)
+                for idx, call in enumerate(calls)
+                if idx not in errors
+            )
+        )
+        return (
+            [action for action in actions if not action.is_local],
+            [action for action in actions if action.is_local],
+        )
+
+    def _resolve_batch_workspace(
+        self, local: t.List[Action]
+    ) -> t.Dict[Action, Exception]:
+        """Resolve the workspace once for the local actions in a batch."""
+        if len(local) == 0:
+            return {}
+        try:
+            _ = self.workspace
+            return {}
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return {action: e for action in local}
+
+    @staticmethod
+    def _batch_results(
+        calls: t.List[ActionCall],
+        errors: t.Dict[int, Exception],
+        failed: t.Dict[Action, Exception],
+    ) -> t.List[t.Optional[ActionCallResult]]:
+        """Initialise batch results with the errors found before dispatch."""
+        results: t.List[t.Optional[ActionCallResult]] = []
+        for idx, call in enumerate(calls):
+            if idx in errors:
+                results.append(ActionCallResult(error=errors[idx]))
+            elif isinstance(call.action, Action) and call.action in failed:
+                results.append(ActionCallResult(error=failed[call.action]))
+            else:
+                results.append(None)
+        return results
+
+    def execute_actions(
+        self,
+        calls: t.Sequence[ActionCallType],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        timeout: t.Optional[float] = None,
+    ) -> t.List[ActionCallResult]:
+        """
+        Execute a batch of independent actions in parallel.
+
+        Connected accounts, action schemas and the workspace are resolved once
+        for the whole batch before the actions are dispatched.
+
+        Example:
+        ```python
+            results = toolset.execute_actions(
+                calls=[
+                    (Action.GITHUB_GET_THE_AUTHENTICATED_USER, {}),
+                    ActionCall(action=Action.SHELLTOOL_EXEC_COMMAND, params={"cmd": "ls"}),
+                ],
+                concurrency=4,
+                timeout=30.0,
+            )
+            for result in results:
+                print (result.response if result.ok else result.error)
+        ```
+
+        :param calls: List of `ActionCall` objects, or tuples/dictionaries with
+            the same fields
+        :param concurrency: Maximum number of actions to execute in parallel
+        :param timeout: Time in seconds an action is allowed to run for, the
+            result for an action which times out contains a `TimeoutError`.
+            Threads can not be interrupted, so the action itself keeps running
+            in the background.
+        :return: List of results in the same order as `calls`
+        """
+        calls, errors = self._prepare_batch(calls=calls)
+        remote, local = self._batch_actions(calls=calls, errors=errors)
+        if len(remote) > 0:
+            try:
+                self.client.actions.get(actions=remote)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.debug(f"Failed to prefetch action schemas: {e}")
+
+        failed = self._resolve_batch_workspace(local=local)
+        for action in remote:
+            try:
+                self.check_connected_account(action=action)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                failed[action] = e
+
+        results = self._batch_results(calls=calls, errors=errors, failed=failed)
+        started: t.Dict[int, float] = {}
+
+        def _execute(idx: int, call: ActionCall) -> t.Dict:
+            started[idx] = time.monotonic()
+            return self.execute_action(
+                action=call.action,
+                params=call.params,
+                metadata=call.metadata,
+                entity_id=call.entity_id,
+                connected_account_id=call.connected_account_id,
+                text=call.text,
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(concurrency, 1),
+            thread_name_prefix="composio-batch",
+        )
+        pending: t.Dict[Future, int] = {
+            executor.submit(_execute, idx, call): idx
+            for idx, call in enumerate(calls)
+            if results[idx] is None
+        }
+        try:
+            while len(pending) > 0:
+                wait_for = None
+                if timeout is not None:
+                    now = time.monotonic()
+                    wait_for = min(
+                        (
+                            started[idx] + timeout - now
+                            for idx in pending.values()
+                            if idx in started
+                        ),
+                        default=timeout,
+                    )
+                done, _ = wait(
+                    pending,
+                    timeout=max(wait_for, 0.0) if wait_for is not None else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    idx = pending.pop(future)
+                    error = future.exception()
+                    results[idx] = (
+                        ActionCallResult(error=t.cast(Exception, error))
+                        if error is not None
+                        else ActionCallResult(response=future.result())
+                    )
+
+                if timeout is None:
+                    continue
+
+                now = time.monotonic()
+                for future, idx in list(pending.items()):
+                    if idx in started and now - started[idx] >= timeout:
+                        pending.pop(future)
+                        results[idx] = ActionCallResult(
+                            error=TimeoutError(
+                                f"Timed out executing `{calls[idx].action}` "
+                                f"after {timeout} seconds"
+                            )
+                        )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return t.cast(t.List[ActionCallResult], results)
+
+    async def aexecute_actions(
+        self,
+        calls: t.Sequence[ActionCallType],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        timeout: t.Optional[float] = None,
+    ) -> t.List[ActionCallResult]:
+        """
+        Async version of `execute_actions`.
+
+        :param calls: List of `ActionCall` objects, or tuples/dictionaries with
+            the same fields
+        :param concurrency: Maximum number of actions to execute concurrently
+        :param timeout: Time in seconds an action is allowed to run for
+        :return: List of results in the same order as `calls`
+        """
+        calls, errors = self._prepare_batch(calls=calls)
+        remote, local = self._batch_actions(calls=calls, errors=errors)
+        failed = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._resolve_batch_workspace(local=local)
+        )
+        if len(remote) > 0:
+            try:
+                await self.async_client.actions.get(actions=remote)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.debug(f"Failed to prefetch action schemas: {e}")
+            for action in remote:
+                try:
+                    await self._acheck_connected_account(action=action)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    failed[action] = e
+
+        results = self._batch_results(calls=calls, errors=errors, failed=failed)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def _execute(idx: int, call: ActionCall) -> ActionCallResult:
+            result = results[idx]
+            if result is not None:
+                return result
+            async with semaphore:
+                try:
+                    return ActionCallResult(
+                        response=await asyncio.wait_for(
+                            self.aexecute_action(
+                                action=call.action,
+                                params=call.params,
+                                metadata=call.metadata,
+                                entity_id=call.entity_id,
+                                connected_account_id=call.connected_account_id,
+                                text=call.text,
+                            ),
+                            timeout=timeout,
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    return ActionCallResult(
+                        error=TimeoutError(
+                            f"Timed out executing `{call.action}` "
+                            f"after {timeout} seconds"
+                        )
+                    )
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    return ActionCallResult(error=e)
+
+        return list(
+            await asyncio.gather(
+                *(_execute(idx, call) for idx, call in enumerate(calls))
+            )
+        )
+
     def validate_tools(
         self,
         apps: t.Optional[t.Sequence[AppType]] = None,
@@ -665,12 +1248,23 @@ class ComposioToolSet(WithLogger):
             tags=tags,
         )
 
-    def get_action_schemas(
+    def _split_schema_filters(
         self,
         apps: t.Optional[t.Sequence[AppType]] = None,
         actions: t.Optional[t.Sequence[ActionType]] = None,
         tags: t.Optional[t.Sequence[TagType]] = None,
-    ) -> t.List[ActionModel]:
+    ) -> t.Tuple[
+        t.List[ActionModel],
+        t.List[Action],
+        t.List[App],
+        t.List[t.Type[LocalAction]],
+    ]:
+        """
+        Split schema filters in local and remote filters.
+
+        :return: Tuple containing local action schemas, remote actions,
+            remote apps and runtime actions.
+        """
         runtime_actions = t.cast(
             t.List[t.Type[LocalAction]],
             [action for action in actions or [] if hasattr(action, "run_on_shell")],
@@ -700,16 +1294,14 @@ class ComposioToolSet(WithLogger):
 
         remote_actions = [action for action in actions if not action.is_local]
         remote_apps = [app for app in apps if not app.is_local]
-        if len(remote_actions) > 0 or len(remote_apps) > 0:
-            remote_items = self.client.actions.get(
-                apps=remote_apps,
-                actions=remote_actions,
-                tags=tags,
-            )
-            for item in remote_items:
-                self.check_connected_account(action=item.name)
-            items = items + remote_items
+        return items, remote_actions, remote_apps, runtime_actions
 
+    def _finalize_schemas(
+        self,
+        items: t.List[ActionModel],
+        runtime_actions: t.List[t.Type[LocalAction]],
+    ) -> t.List[ActionModel]:
+        """Add runtime action schemas and process the schemas."""
         for act in runtime_actions:
             schema = act.schema()
             schema["name"] = act.enum
@@ -720,6 +1312,140 @@ class ComposioToolSet(WithLogger):
 
         return items
 
+    def _schema_cache_key(
+        self,
+        apps: t.Optional[t.Sequence[AppType]],
+        actions: t.Optional[t.Sequence[ActionType]],
+        tags: t.Optional[t.Sequence[TagType]],
+        check_connected_accounts: bool,
+    ) -> _SchemaCacheKey:
+        """Build schema cache key for a query and the current schema processors."""
+
+        def _normalise(values: t.Optional[t.Sequence]) -> t.Tuple[t.Hashable, ...]:
+            return tuple(
+                value if isinstance(value, type) else str(value).upper()
+                for value in values or []
+            )
+
+        return (
+            _normalise(apps),
+            _normalise(actions),
+            _normalise(tags),
+            self._processor_dispatch.fingerprint,
+            check_connected_accounts,
+        )
+
+    def _get_cached_schemas(
+        self, key: _SchemaCacheKey
+    ) -> t.Optional[t.List[ActionModel]]:
+        """Get copies of cached schemas for `key`."""
+        items = self.schema_cache.get(key)
+        if items is None:
+            return None
+        return [item.model_copy(deep=True) for item in items]
+
+    def _set_cached_schemas(
+        self, key: _SchemaCacheKey, items: t.List[ActionModel]
+    ) -> t.List[ActionModel]:
+        """Cache copies of processed schemas for `key`."""
+        self.schema_cache.set(key, [item.model_copy(deep=True) for item in items])
+        return items
+
+    def get_action_schemas(
+        self,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+        check_connected_accounts: bool = True,
+    ) -> t.List[ActionModel]:
+        """
+        Get processed action schemas.
+
+        Results are cached per toolset by query and schema processors for
+        `schema_cache_ttl` seconds, every call returns a fresh copy so the
+        schemas can be modified by the caller. Use
+        `toolset.schema_cache.invalidate()` to drop the cached schemas and
+        `toolset.schema_cache.stats()` for the hit/miss counters.
+
+        :param apps: Get schemas for actions of these apps
+        :param actions: Get schemas for these actions
+        :param tags: Filter actions by these tags
+        :param check_connected_accounts: Check if the remote actions have a
+            connected account
+        :return: List of action schemas
+        """
+        key = self._schema_cache_key(
+            apps=apps,
+            actions=actions,
+            tags=tags,
+            check_connected_accounts=check_connected_accounts,
+        )
+        cached = self._get_cached_schemas(key=key)
+        if cached is not None:
+            return cached
+
+        (
+            items,
+            remote_actions,
+            remote_apps,
+            runtime_actions,
+        ) = self._split_schema_filters(apps=apps, actions=actions, tags=tags)
+        if len(remote_actions) > 0 or len(remote_apps) > 0:
+            remote_items = self.client.actions.get(
+                apps=remote_apps,
+                actions=remote_actions,
+                tags=tags,
+            )
+            if check_connected_accounts:
+                for item in remote_items:
+                    self.check_connected_account(action=item.name)
+            items = items + remote_items
+
+        return self._set_cached_schemas(
+            key=key,
+            items=self._finalize_schemas(items=items, runtime_actions=runtime_actions),
+        )
+
+    async def aget_action_schemas(
+        self,
+        apps: t.Optional[t.Sequence[AppType]] = None,
+        actions: t.Optional[t.Sequence[ActionType]] = None,
+        tags: t.Optional[t.Sequence[TagType]] = None,
+        check_connected_accounts: bool = True,
+    ) -> t.List[ActionModel]:
+        """Async version of `get_action_schemas`."""
+        key = self._schema_cache_key(
+            apps=apps,
+            actions=actions,
+            tags=tags,
+            check_connected_accounts=check_connected_accounts,
+        )
+        cached = self._get_cached_schemas(key=key)
+        if cached is not None:
+            return cached
+
+        (
+            items,
+            remote_actions,
+            remote_apps,
+            runtime_actions,
+        ) = self._split_schema_filters(apps=apps, actions=actions, tags=tags)
+        if len(remote_actions) > 0 or len(remote_apps) > 0:
+            remote_items = await self.async_client.actions.get(
+                apps=remote_apps,
+                actions=remote_actions,
+                tags=tags,
+            )
+            if check_connected_accounts:
+                for item in remote_items:
+                    await self._acheck_connected_account(action=item.name)
+            items = items + remote_items
+
+        return self._set_cached_schemas(
+            key=key,
+            items=self._finalize_schemas(items=items, runtime_actions=runtime_actions),
+        )
+
     def _process_schema(self, action_item: ActionModel) -> ActionModel:
         required_params = action_item.parameters.required or []
         for param_name, param_details in action_item.parameters.properties.items():
@@ -777,15 +1503,27 @@ class ComposioToolSet(WithLogger):
             action_item.description = action_item.description[
                 : self._description_char_limit
             ]
-        action_item.parameters.properties = self._process_schema_properties(
-            action=Action(action_item.name.upper()),
-            properties=action_item.parameters.properties,
-        )
+        if self._processor_dispatch.has("schema"):
+            action_item.parameters.properties = self._process_schema_properties(
+                action=Action(action_item.name.upper()),
+                properties=action_item.parameters.properties,
+            )
         return action_item
 
-    def create_trigger_listener(self, timeout: float = 15.0) -> TriggerSubscription:
-        """Create trigger subscription."""
-        return self.client.triggers.subscribe(timeout=timeout)
+    def create_trigger_listener(
+        self,
+        timeout: float = 15.0,
+        journal: t.Optional[EventJournal] = None,
+    ) -> TriggerSubscription:
+        """
+        Create trigger subscription.
+
+        :param timeout: Number of seconds to wait for the connection
+        :param journal: Journal for persisting received events before they
+            are handled, see `composio.client.journal.EventJournal`
+        :return: Trigger subscription
+        """
+        return self.client.triggers.subscribe(timeout=timeout, journal=journal)
 
     def find_actions_by_use_case(
         self,
@@ -832,6 +1570,15 @@ class ComposioToolSet(WithLogger):
                 )
             )
 
+        by_tag = get_index(name="tags")
+        if by_tag is not None:
+            tagged = {slug for tag in tags for slug in by_tag.get(tag, [])}
+            return [
+                getattr(Action, name)
+                for name in Action.__annotations__
+                if name in tagged
+            ]
+
         actions = []
         for action in Action.all():
             if any(tag in action.tags for tag in tags):
@@ -903,6 +1650,17 @@ class ComposioToolSet(WithLogger):
         """Get entity object for given ID."""
         return self.client.get_entity(id=id or self.entity_id)
 
+    async def aget_entity(self, id: t.Optional[str] = None) -> AsyncEntity:
+        """Get async entity object for given ID."""
+        return self.async_client.get_entity(id=id or self.entity_id)
+
+
+def _is_unsuccessful(response: t.Any) -> bool:
+    """Check if an action response reports an unsuccessful execution."""
+    if not isinstance(response, dict):
+        return False
+    return response.get("successful", response.get("successfull")) is False
+
 
 def _write_file(file_path: t.Union[str, os.PathLike], content: t.Union[str, bytes]):
     """Write content to a file."""
@@ -0,0 +1,261 @@
+"""
+In-memory caching helpers.
+"""
+
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+KeyType = t.TypeVar("KeyType", bound=t.Hashable)
+ValueType = t.TypeVar("ValueType")
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 300.0
+
+
+class CacheStats(t.NamedTuple):
+    """Cache hit/miss counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class TTLCache(t.Generic[KeyType, ValueType]):
+    """
+    Thread safe, size bounded cache with time based expiry.
+
+    Example:
+    ```python
+        cache = TTLCache[str, int](maxsize=128, ttl=60.0)
+        cache.set("one", 1)
+        print (cache.get("one"))
+        print (cache.stats())
+    ```
+
+    Entries are evicted in LRU order once `maxsize` is reached and are
+    treated as missing once they are older than `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize cache.
+
+        :param maxsize: Maximum number of entries to keep in the cache
+        :param ttl: Time to live for an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[KeyType, t.Tuple[float, ValueType]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Number of entries in the cache, including expired ones."""
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a live entry exists for `key`, does not count as hit/miss."""
+        with self._lock:
+            entry = self._data.get(key)  # type: ignore
+            return entry is not None and entry[0] > time.monotonic()
+
+    def get(
+        self,
+        key: KeyType,
+        default: t.Optional[ValueType] = None,
+    ) -> t.Optional[ValueType]:
+        """
+        Get value for `key`.
+
+        :param key: Cache key
+        :param default: Value to return if the key is missing or has expired
+        :return: Cached value or `default`
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                self._misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(
+        self, key: KeyType, value: ValueType, ttl: t.Optional[float] = None
+    ) -> None:
+        """
+        Set value for `key`.
+
+        :param key: Cache key
+        :param value: Value to cache
+        :param ttl: Override the default time to live for this entry
+        """
+        with self._lock:
+            self._data[key] = (
+                time.monotonic() + (self.ttl if ttl is None else ttl),
+                value,
+            )
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(
+        self,
+        key: t.Optional[KeyType] = None,
+        predicate: t.Optional[t.Callable[[KeyType], bool]] = None,
+    ) -> int:
+        """
+        Invalidate cache entries.
+
+        Without arguments every entry is dropped.
+
+        :param key: Drop entry for this key
+        :param predicate: Drop every entry for which `predicate(key)` is truthy
+        :return: Number of entries dropped
+        """
+        with self._lock:
+            if key is None and predicate is None:
+                count = len(self._data)
+                self._data.clear()
+                return count
+
+            keys = [key] if key is not None else []
+            if predicate is not None:
+                keys += [_key for _key in self._data if predicate(_key)]
+
+            count = 0
+            for _key in keys:
+                if self._data.pop(_key, None) is not None:
+                    count += 1
+            return count
+
+    clear = invalidate
+
+    def stats(self) -> CacheStats:
+        """Get hit/miss counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+class SingleFlightStats(t.NamedTuple):
+    """Single flight call counters."""
+
+    calls: int
+    """Number of calls made."""
+
+    executions: int
+    """Number of calls which executed the function."""
+
+    shared: int
+    """Number of calls which received the result of an in-flight call."""
+
+    inflight: int
+    """Number of calls currently executing."""
+
+
+class SingleFlight(t.Generic[KeyType, ValueType]):
+    """
+    Merge concurrent calls with the same key into a single execution.
+
+    Example:
+    ```python
+        group = SingleFlight[str, requests.Response]()
+        response = group.do(url, lambda: requests.get(url))
+        print (group.stats())
+    ```
+
+    The first caller for a key executes the function, callers arriving while
+    it is in flight wait for and receive the same result or exception.
+    Results are not kept once the call completes, so the returned value has
+    to be safe to share between the callers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single flight group."""
+        self._lock = threading.Lock()
+        self._inflight: t.Dict[KeyType, "Future[ValueType]"] = {}
+        self._calls = 0
+        self._executions = 0
+        self._shared = 0
+
+    def do(self, key: KeyType, func: t.Callable[[], ValueType]) -> ValueType:
+        """
+        Execute `func` or wait for the in-flight call with the same key.
+
+        :param key: Key identifying the call
+        :param func: Function to execute
+        :return: Result of the call
+        """
+        with self._lock:
+            self._calls += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self._shared += 1
+                leader = False
+            else:
+                future = self._inflight[key] = Future()
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self) -> SingleFlightStats:
+        """Get call counters."""
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._calls,
+                executions=self._executions,
+                shared=self._shared,
+                inflight=len(self._inflight),
+            )
+
+    def reset_stats(self) -> None:
+        """Reset call counters."""
+        with self._lock:
+            self._calls = 0
+            self._executions = 0
+            self._shared = 0
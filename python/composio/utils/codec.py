@@ -0,0 +1,115 @@
+"""
+JSON codec.
+
+Uses `orjson` when it is installed and falls back to the standard library
+otherwise. Set `COMPOSIO_JSON_BACKEND=json` to force the standard library.
+
+Example:
+```python
+    from composio.utils import codec
+
+    data = codec.loads(response.content)
+    path.write_text(codec.dumps(data), encoding="utf-8")
+```
+
+Output is compact by default, pass `indent` only where the output is meant
+to be read by a human.
+"""
+
+import json
+import os
+import typing as t
+
+
+ENV_COMPOSIO_JSON_BACKEND = "COMPOSIO_JSON_BACKEND"
+"""Environment variable for selecting the JSON backend, `orjson` or `json`."""
+
+JSONDecodeError = json.JSONDecodeError
+"""Raised when decoding invalid JSON, regardless of the backend."""
+
+
+def _load_orjson() -> t.Any:
+    if os.environ.get(ENV_COMPOSIO_JSON_BACKEND, "orjson").lower() != "orjson":
+        return None
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        return orjson
+    except ImportError:
+        return None
+
+
+_orjson = _load_orjson()
+
+BACKEND = "json" if _orjson is None else "orjson"
+"""Name of the JSON backend in use."""
+
+
+def dumpb(
+    obj: t.Any,
+    indent: t.Optional[int] = None,
+    default: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+) -> bytes:
+    """
+    Encode `obj` as UTF-8 encoded JSON.
+
+    :param obj: Object to encode
+    :param indent: Indent output, only use for human readable output
+    :param default: Function for encoding unsupported objects
+    :return: JSON bytes
+    """
+    if _orjson is not None and indent in (None, 2):
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= _orjson.OPT_INDENT_2
+        try:
+            return _orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # orjson is stricter than the standard library, for example
+            # with integers larger than 64 bits
+            pass
+
+    return json.dumps(
+        obj,
+        indent=indent,
+        default=default,
+        ensure_ascii=False,
+        separators=None if indent is not None else (",", ":"),
+    ).encode("utf-8")
+
+
+def dumps(
+    obj: t.Any,
+    indent: t.Optional[int] = None,
+    default: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+) -> str:
+    """
+    Encode `obj` as a JSON string.
+
+    :param obj: Object to encode
+    :param indent: Indent output, only use for human readable output
+    :param default: Function for encoding unsupported objects
+    :return: JSON string
+    """
+    return dumpb(obj=obj, indent=indent, default=default).decode("utf-8")
+
+
+def loads(data: t.Union[str, bytes, bytearray, memoryview]) -> t.Any:
+    """
+    Decode JSON.
+
+    :param data: JSON string or bytes
+    :raises JSONDecodeError: If `data` is not valid JSON
+    :return: Decoded object
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # Retry with the standard library, which also accepts `NaN` and
+            # `Infinity` and raises the usual error for invalid documents
+            pass
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -0,0 +1,483 @@
+"""
+Execution instrumentation.
+
+Records spans and timing histograms for the phases of executing an action,
+eg. processing the request, the HTTP call or running a local action. Spans
+are tagged with the action, app, workspace type and outcome.
+
+Example:
+```python
+    from composio.utils.instrumentation import InMemoryExporter, instrumentation
+
+    exporter = InMemoryExporter()
+    instrumentation.add_exporter(exporter)
+
+    toolset.execute_action(...)
+    print(exporter.histogram("http", app="GITHUB").sum)
+```
+
+Nothing is recorded unless at least one exporter is registered, until then
+creating a span returns a shared no-op object.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+import typing as t
+from abc import ABC, abstractmethod
+from collections import deque
+
+import typing_extensions as te
+
+from composio.utils.logging import get as get_logger
+
+
+PHASE_EXECUTE = "execute"
+"""Complete action execution, parent of the other phases."""
+
+PHASE_SERIALIZE = "serialize"
+"""Serializing the request parameters."""
+
+PHASE_PREPROCESS = "preprocess"
+"""Running request pre-processors and resolving metadata."""
+
+PHASE_CONNECTED_ACCOUNT = "connected_account"
+"""Checking for a connected account."""
+
+PHASE_HTTP = "http"
+"""Executing a remote action over HTTP."""
+
+PHASE_SAVE_FILES = "save_files"
+"""Decoding and saving files from a remote action response."""
+
+PHASE_LOCAL = "local"
+"""Running a local action in the workspace."""
+
+PHASE_POSTPROCESS = "postprocess"
+"""Running response post-processors."""
+
+PHASE_PROCESSOR = "processor"
+"""Running a single pre, post or schema processor."""
+
+PHASE_TRIGGER_CALLBACK = "trigger_callback"
+"""Running a trigger callback for an event."""
+
+OUTCOME_SUCCESS = "success"
+"""Phase completed successfully."""
+
+OUTCOME_FAILURE = "failure"
+"""Action was executed but reported an unsuccessful response."""
+
+OUTCOME_ERROR = "error"
+"""Phase raised an exception."""
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default histogram bucket upper bounds in seconds."""
+
+DEFAULT_MAX_SPANS = 10000
+"""Number of finished spans kept by the in-memory exporter."""
+
+TagsType = t.Tuple[t.Tuple[str, str], ...]
+
+_current: "contextvars.ContextVar[t.Optional[Span]]" = contextvars.ContextVar(
+    "composio_span", default=None
+)
+
+
+class Span:
+    """Timed phase of an action execution."""
+
+    __slots__ = (
+        "name",
+        "tags",
+        "parent",
+        "start_time",
+        "duration",
+        "_start",
+        "_token",
+        "_instrumentation",
+    )
+
+    def __init__(
+        self,
+        instrumentation: "Instrumentation",
+        name: str,
+        tags: t.Dict[str, str],
+        parent: t.Optional["Span"] = None,
+    ) -> None:
+        self.name = name
+        self.tags = tags
+        self.parent = parent
+        self.start_time = 0.0
+        self.duration = 0.0
+        self._start = 0.0
+        self._token: t.Optional[contextvars.Token] = None
+        self._instrumentation = instrumentation
+
+    @property
+    def outcome(self) -> t.Optional[str]:
+        """Outcome of the span, available once the span has finished."""
+        return self.tags.get("outcome")
+
+    def tag(self, **tags: str) -> None:
+        """Add tags to the span."""
+        self.tags.update(tags)
+
+    def __enter__(self) -> "Span":
+        self.start_time = time.time()
+        self._token = _current.set(self)
+        self._instrumentation.dispatch("start", self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration = time.perf_counter() - self._start
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        self.tags.setdefault(
+            "outcome", OUTCOME_SUCCESS if exc_type is None else OUTCOME_ERROR
+        )
+        self._instrumentation.dispatch("export", self)
+
+
+class _NoopSpan:
+    """Span returned when instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def tag(self, **tags: str) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+SpanType = t.Union[Span, _NoopSpan]
+
+
+class Exporter(ABC):
+    """Base class for span exporters."""
+
+    def start(self, span: Span) -> None:
+        """Called when a span starts."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Called when a span finishes."""
+
+
+class Instrumentation:
+    """Create spans and hand them over to the registered exporters."""
+
+    def __init__(self, exporters: t.Optional[t.Sequence[Exporter]] = None) -> None:
+        """
+        Initialize instrumentation.
+
+        :param exporters: Exporters to send finished spans to
+        """
+        self._exporters: t.Tuple[Exporter, ...] = tuple(exporters or ())
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any exporter is registered."""
+        return len(self._exporters) > 0
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        """Register an exporter."""
+        with self._lock:
+            self._exporters = (*self._exporters, exporter)
+
+    def remove_exporter(self, exporter: Exporter) -> None:
+        """Unregister an exporter."""
+        with self._lock:
+            self._exporters = tuple(e for e in self._exporters if e is not exporter)
+
+    def span(self, name: str, **tags: str) -> SpanType:
+        """
+        Create a span for a phase.
+
+        Use the returned object as a context manager. Spans inherit tags,
+        except for `outcome`, from the enclosing span.
+
+        :param name: Name of the phase
+        :param tags: Tags for the span
+        :return: Span object, or a no-op span when instrumentation is disabled
+        """
+        if not self._exporters:
+            return _NOOP_SPAN
+
+        parent = _current.get()
+        if parent is not None:
+            tags = {
+                **{k: v for k, v in parent.tags.items() if k != "outcome"},
+                **tags,
+            }
+        return Span(instrumentation=self, name=name, tags=tags, parent=parent)
+
+    def current(self) -> SpanType:
+        """Get the innermost active span."""
+        span = _current.get()
+        return _NOOP_SPAN if span is None else span
+
+    def dispatch(self, event: te.Literal["start", "export"], span: Span) -> None:
+        """Send span event to the exporters, exporter errors are only logged."""
+        for exporter in self._exporters:
+            try:
+                getattr(exporter, event)(span)
+            except Exception as e:  # pylint: disable=broad-except
+                get_logger().debug(f"Error exporting span {span.name}: {e}")
+
+
+class Histogram:
+    """Cumulative timing histogram."""
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """Add observations from another histogram with the same buckets."""
+        for idx, count in enumerate(other.counts):
+            self.counts[idx] += count
+        self.sum += other.sum
+        self.count += other.count
+
+    def cumulative(self) -> t.List[t.Tuple[float, int]]:
+        """Get `(upper bound, cumulative count)` pairs including `+Inf`."""
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class _HistogramExporter(Exporter):
+    """Aggregate span durations into histograms by name and tags."""
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: t.Dict[t.Tuple[str, TagsType], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        key = (span.name, tuple(sorted(span.tags.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets=self.buckets)
+            histogram.observe(span.duration)
+
+    def histograms(self) -> t.Dict[t.Tuple[str, TagsType], Histogram]:
+        """Get a snapshot of the histograms by `(name, tags)`."""
+        with self._lock:
+            snapshot = {}
+            for key, histogram in self._histograms.items():
+                snapshot[key] = Histogram(buckets=self.buckets)
+                snapshot[key].merge(histogram)
+        return snapshot
+
+    def histogram(self, name: str, **tags: str) -> Histogram:
+        """
+        Get the histogram for a phase.
+
+        :param name: Name of the phase
+        :param tags: Only include spans with these tags
+        :return: Histogram merged across all other tags
+        """
+        merged = Histogram(buckets=self.buckets)
+        for (_name, _tags), histogram in self.histograms().items():
+            if _name != name:
+                continue
+            if any(dict(_tags).get(k) != v for k, v in tags.items()):
+                continue
+            merged.merge(histogram)
+        return merged
+
+    def clear(self) -> None:
+        """Remove all recorded data."""
+        with self._lock:
+            self._histograms.clear()
+
+
+class InMemoryExporter(_HistogramExporter):
+    """Keep finished spans and histograms in memory."""
+
+    def __init__(
+        self,
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+        max_spans: int = DEFAULT_MAX_SPANS,
+    ) -> None:
+        """
+        Initialize in-memory exporter.
+
+        :param buckets: Histogram bucket upper bounds in seconds
+        :param max_spans: Number of most recent spans to keep
+        """
+        super().__init__(buckets=buckets)
+        self._spans: t.Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        super().export(span)
+        self._spans.append(span)
+
+    @property
+    def spans(self) -> t.List[Span]:
+        """Finished spans, oldest first."""
+        return list(self._spans)
+
+    def clear(self) -> None:
+        super().clear()
+        self._spans.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class PrometheusExporter(_HistogramExporter):
+    """Expose phase histograms in the Prometheus text format."""
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+    """Content type for serving the output of `render`."""
+
+    def __init__(
+        self,
+        namespace: str = "composio",
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initialize Prometheus exporter.
+
+        :param namespace: Prefix for the metric name
+        :param buckets: Histogram bucket upper bounds in seconds
+        """
+        super().__init__(buckets=buckets)
+        self.metric = f"{namespace}_phase_duration_seconds"
+
+    def render(self) -> str:
+        """Render the histograms in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {self.metric} Time spent in each phase of executing an action.",
+            f"# TYPE {self.metric} histogram",
+        ]
+        for (name, tags), histogram in sorted(self.histograms().items()):
+            labels = ",".join(
+                f'{key}="{_escape_label(str(value))}"'
+                for key, value in (("phase", name), *tags)
+            )
+            for bound, count in histogram.cumulative():
+                lines.append(
+                    f'{self.metric}_bucket{{{labels},le="{_format_bound(bound)}"}} {count}'
+                )
+            lines.append(f"{self.metric}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{self.metric}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryExporter(Exporter):
+    """
+    Forward spans and durations to OpenTelemetry.
+
+    Requires `opentelemetry-api`, spans and metrics are only exported if an
+    OpenTelemetry SDK is configured by the application.
+    """
+
+    def __init__(self, tracer: t.Any = None, meter: t.Any = None) -> None:
+        """
+        Initialize OpenTelemetry exporter.
+
+        :param tracer: Tracer to use, defaults to the global `composio` tracer
+        :param meter: Meter to use, defaults to the global `composio` meter
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "`opentelemetry-api` is required for `OpenTelemetryExporter`, "
+                "install it using `pip install opentelemetry-api`"
+            ) from e
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("composio")
+        self.histogram = (meter or metrics.get_meter("composio")).create_histogram(
+            name="composio.phase.duration",
+            unit="s",
+            description="Time spent in each phase of executing an action.",
+        )
+        self._spans: t.Dict[int, t.Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _attributes(span: Span) -> t.Dict[str, str]:
+        return {f"composio.{key}": value for key, value in span.tags.items()}
+
+    def start(self, span: Span) -> None:
+        with self._lock:
+            parent = None if span.parent is None else self._spans.get(id(span.parent))
+        otel_span = self.tracer.start_span(
+            name=f"composio.{span.name}",
+            context=(
+                None if parent is None else self._trace.set_span_in_context(parent)
+            ),
+            attributes=self._attributes(span),
+            start_time=int(span.start_time * 1e9),
+        )
+        with self._lock:
+            self._spans[id(span)] = otel_span
+
+    def export(self, span: Span) -> None:
+        attributes = self._attributes(span)
+        self.histogram.record(
+            span.duration,
+            attributes={"composio.phase": span.name, **attributes},
+        )
+        with self._lock:
+            otel_span = self._spans.pop(id(span), None)
+        if otel_span is None:
+            return
+
+        otel_span.set_attributes(attributes)
+        if span.outcome == OUTCOME_ERROR:
+            otel_span.set_status(self._trace.StatusCode.ERROR)
+        otel_span.end(end_time=int((span.start_time + span.duration) * 1e9))
+
+
+instrumentation = Instrumentation()
+"""Global instrumentation object, used by the toolset by default."""
@@ -4,6 +4,7 @@ Logging utilities.
 
 import logging
 import os
+import random
 import typing as t
 from enum import Enum
 
@@ -53,6 +54,141 @@ _LEVELS: t.Dict[LogLevel, int] = {
 }
 
 
+class _BudgetExhausted(Exception):
+    """Raised when the size budget for a field runs out."""
+
+
+def _bounded_repr(value: t.Any, budget: int) -> str:
+    """
+    Get `repr` for `value` limited to `budget` characters.
+
+    Containers are walked instead of being converted to a string as a whole,
+    so the cost is bound by `budget` rather than the size of `value`.
+    """
+    if budget < 0:
+        return repr(value)
+
+    chunks: t.List[str] = []
+    remaining = budget
+
+    def _write(chunk: str) -> None:
+        nonlocal remaining
+        chunks.append(chunk[:remaining])
+        remaining -= len(chunk)
+        if remaining <= 0:
+            raise _BudgetExhausted()
+
+    def _walk(obj: t.Any) -> None:
+        if isinstance(obj, (str, bytes)):
+            _write(repr(obj[: remaining + 1]) if len(obj) > remaining else repr(obj))
+            return
+
+        if hasattr(obj, "model_fields") and not isinstance(obj, type):
+            obj = dict(obj)
+
+        if isinstance(obj, dict):
+            _write("{")
+            for idx, (key, val) in enumerate(obj.items()):
+                if idx > 0:
+                    _write(", ")
+                _walk(key)
+                _write(": ")
+                _walk(val)
+            _write("}")
+            return
+
+        if isinstance(obj, (list, tuple, set)):
+            start, end = {tuple: ("(", ")"), set: ("{", "}")}.get(type(obj), ("[", "]"))
+            _write(start)
+            for idx, val in enumerate(obj):
+                if idx > 0:
+                    _write(", ")
+                _walk(val)
+            if isinstance(obj, tuple) and len(obj) == 1:
+                _write(",")
+            _write(end)
+            return
+
+        _write(repr(obj))
+
+    try:
+        _walk(value)
+    except _BudgetExhausted:
+        return "".join(chunks) + "..."
+    return "".join(chunks)
+
+
+class LazyMessage:
+    """
+    Structured log message which is formatted only if the record is emitted.
+
+    Example:
+    ```python
+        logger.info(
+            LazyMessage(
+                "Executing action",
+                budgets={"response": 1024},
+                sample_rate=0.1,
+                action=action,
+                response=response,
+            )
+        )
+    ```
+
+    Every field is rendered as `key=repr(value)` and truncated to its budget.
+    The whole message is bound by the line size for the verbosity level of
+    the logger, fields are rendered in order until it is used up. With a
+    `sample_rate` below 1 only that fraction of messages is logged.
+    """
+
+    __slots__ = ("message", "fields", "budgets", "default_budget", "sample_rate")
+
+    def __init__(
+        self,
+        message: str,
+        budgets: t.Optional[t.Dict[str, int]] = None,
+        sample_rate: float = 1.0,
+        **fields: t.Any,
+    ) -> None:
+        """
+        Create a structured log message.
+
+        :param message: Log message
+        :param budgets: Maximum number of characters by field name, use -1
+            for no limit
+        :param sample_rate: Fraction of messages to log
+        :param fields: Fields to include in the message
+        """
+        self.message = message
+        self.fields = fields
+        self.budgets = budgets or {}
+        self.default_budget = -1
+        self.sample_rate = sample_rate
+
+    def sampled(self) -> bool:
+        """Check if the message should be logged."""
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def __str__(self) -> str:
+        parts = [self.message]
+        remaining = self.default_budget - len(self.message)
+        for key, value in self.fields.items():
+            budget = self.budgets.get(key, -1)
+            if self.default_budget >= 0:
+                # Account for the separator and the `key=` prefix
+                remaining -= len(key) + 2
+                if remaining <= 0:
+                    parts.append("...")
+                    break
+                budget = remaining if budget < 0 else min(budget, remaining)
+            value = _bounded_repr(value, budget=budget)
+            parts.append(f"{key}={value}")
+            remaining -= len(value)
+        return " ".join(parts)
+
+    __repr__ = __str__
+
+
 class _VerbosityWrapper:
     def __init__(
         self,
@@ -71,7 +207,11 @@ class _VerbosityWrapper:
         self.verbosity = verbosity_level
         self.size = _LOG_LINE_SIZE_BY_VERBOSITY[self.verbosity]
 
-    def _trim(self, msg) -> str:
+    def _trim(self, msg) -> t.Any:
+        if isinstance(msg, LazyMessage):
+            msg.default_budget = self.size
+            return msg
+
         msg = str(msg)
         if self.size == -1:
             return msg
@@ -81,14 +221,25 @@ class _VerbosityWrapper:
 
         return msg[: self.size] + "..."
 
+    def _enabled(self, msg, level: int) -> bool:
+        if not self.logger.isEnabledFor(level):
+            return False
+        return not isinstance(msg, LazyMessage) or msg.sampled()
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
     def info(self, msg, *args, **kwargs):
-        self.logger.info(self._trim(msg), *args, **kwargs)
+        if self._enabled(msg, logging.INFO):
+            self.logger.info(self._trim(msg), *args, **kwargs)
 
     def debug(self, msg, *args, **kwargs):
-        self.logger.debug(self._trim(msg), *args, **kwargs)
+        if self._enabled(msg, logging.DEBUG):
+            self.logger.debug(self._trim(msg), *args, **kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        self.logger.warning(self._trim(msg), *args, **kwargs)
+        if self._enabled(msg, logging.WARNING):
+            self.logger.warning(self._trim(msg), *args, **kwargs)
 
     def error(self, msg, *args, **kwargs):
         self.logger.error(msg, *args, **kwargs)
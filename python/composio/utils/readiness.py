@@ -0,0 +1,194 @@
+"""
+Readiness primitives for waiting on state changes.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import typing as t
+from concurrent import futures
+
+
+T = t.TypeVar("T")
+
+DEFAULT_INITIAL_DELAY = 0.25
+DEFAULT_MAX_DELAY = 5.0
+
+
+class Backoff(t.NamedTuple):
+    """
+    Adaptive delays for polling a remote state.
+
+    Polls start at `initial` seconds apart so quick state changes are picked
+    up early, and back off up to `maximum` seconds for slow ones.
+    """
+
+    initial: float = DEFAULT_INITIAL_DELAY
+    """Delay before the second poll."""
+
+    factor: float = 1.5
+    """Multiplier applied to the delay after every poll."""
+
+    maximum: float = DEFAULT_MAX_DELAY
+    """Upper bound for the delay."""
+
+    jitter: float = 0.1
+    """Fraction of the delay to randomize, spreads out concurrent pollers."""
+
+    def delays(self) -> t.Iterator[float]:
+        """Iterate over the delays between polls."""
+        delay = self.initial
+        while True:
+            yield delay * (1 + random.uniform(-self.jitter, self.jitter))
+            delay = min(delay * self.factor, self.maximum)
+
+
+class Readiness(t.Generic[T]):
+    """
+    One shot readiness latch with blocking and `asyncio` waiters.
+
+    Example:
+    ```python
+        ready = Readiness[str]()
+        threading.Timer(0.1, ready.set, args=("connected",)).start()
+        print (ready.result(timeout=1.0))
+    ```
+
+    The latch is resolved once using `set` or `fail`, waiters return as soon
+    as that happens instead of polling for it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize readiness latch."""
+        self._future: "futures.Future[T]" = futures.Future()
+        self._lock = threading.Lock()
+        self._async_futures: t.Dict[asyncio.AbstractEventLoop, "asyncio.Future[T]"] = {}
+
+    def is_set(self) -> bool:
+        """Check if the latch is resolved."""
+        return self._future.done()
+
+    def set(self, value: t.Optional[T] = None) -> None:
+        """Resolve the latch with a value, no-op if already resolved."""
+        try:
+            self._future.set_result(t.cast(T, value))
+        except futures.InvalidStateError:
+            pass
+
+    def fail(self, error: BaseException) -> None:
+        """Resolve the latch with an error, no-op if already resolved."""
+        try:
+            self._future.set_exception(error)
+        except futures.InvalidStateError:
+            pass
+
+    def wait(self, timeout: t.Optional[float] = None) -> bool:
+        """
+        Wait for the latch to be resolved.
+
+        :param timeout: Number of seconds to wait, waits indefinitely if `None`
+        :return: `True` if the latch is resolved, `False` on timeout
+        """
+        done, _ = futures.wait([self._future], timeout=timeout)
+        return len(done) > 0
+
+    def result(self, timeout: t.Optional[float] = None) -> T:
+        """
+        Wait for the latch and get its value.
+
+        :param timeout: Number of seconds to wait, waits indefinitely if `None`
+        :raises TimeoutError: If the latch is not resolved within `timeout`
+        :return: Value the latch was resolved with, raises the error if it
+            was resolved using `fail`
+        """
+        try:
+            return self._future.result(timeout=timeout)
+        except futures.TimeoutError as e:
+            raise TimeoutError("Timed out while waiting for readiness") from e
+
+    async def async_result(self, timeout: t.Optional[float] = None) -> T:
+        """
+        Wait for the latch and get its value without blocking the event loop.
+
+        :param timeout: Number of seconds to wait, waits indefinitely if `None`
+        :raises TimeoutError: If the latch is not resolved within `timeout`
+        :return: Value the latch was resolved with
+        """
+        future = self._async_future()
+        # Unlike `wait_for`, `wait` leaves the shared future pending on timeout
+        done, _ = await asyncio.wait({future}, timeout=timeout)
+        if len(done) == 0:
+            raise TimeoutError("Timed out while waiting for readiness")
+        return future.result()
+
+    def _async_future(self) -> "asyncio.Future[T]":
+        """
+        Get the `asyncio` future for the running loop.
+
+        The future is created once per loop and shared by its waiters, so
+        repeated waits do not add callbacks to the latch.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future = self._async_futures.get(loop)
+            if future is None:
+                for closed in [lp for lp in self._async_futures if lp.is_closed()]:
+                    del self._async_futures[closed]
+                future = self._async_futures[loop] = asyncio.wrap_future(
+                    self._future, loop=loop
+                )
+        return future
+
+
+def wait_until(
+    check: t.Callable[[], t.Optional[T]],
+    timeout: float,
+    backoff: Backoff = Backoff(),
+) -> T:
+    """
+    Poll `check` with adaptive backoff until it returns a value.
+
+    :param check: Function returning `None` until the state is reached
+    :param timeout: Number of seconds to keep polling
+    :param backoff: Delays between polls
+    :raises TimeoutError: If the state is not reached within `timeout`
+    :return: Value returned by `check`
+    """
+    deadline = time.monotonic() + timeout
+    for delay in backoff.delays():
+        value = check()
+        if value is not None:
+            return value
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+    raise TimeoutError("Timed out while waiting for readiness")
+
+
+async def async_wait_until(
+    check: t.Callable[[], t.Awaitable[t.Optional[T]]],
+    timeout: float,
+    backoff: Backoff = Backoff(),
+) -> T:
+    """
+    Poll the `check` coroutine with adaptive backoff until it returns a value.
+
+    :param check: Coroutine function returning `None` until the state is
+        reached
+    :param timeout: Number of seconds to keep polling
+    :param backoff: Delays between polls
+    :raises TimeoutError: If the state is not reached within `timeout`
+    :return: Value returned by `check`
+    """
+    deadline = time.monotonic() + timeout
+    for delay in backoff.delays():
+        value = await check()
+        if value is not None:
+            return value
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
+    raise TimeoutError("Timed out while waiting for readiness")
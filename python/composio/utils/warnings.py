@@ -1,24 +1,129 @@
 """Composio version helpers."""
 
+import os
+import threading
+import time
+import typing as t
+
 import requests
 import rich
 from semver import VersionInfo
 
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.storage.base import LocalStorage
+
+
+PYPI_URL = "https://pypi.org/pypi/composio-core/json"
+
+VERSION_CHECK_FILE = LOCAL_CACHE_DIRECTORY / "version_check.json"
+"""Local cache for the latest version."""
+
+ENV_COMPOSIO_DISABLE_VERSION_CHECK = "COMPOSIO_DISABLE_VERSION_CHECK"
+"""Set to `true` to disable the version check."""
+
+ENV_COMPOSIO_VERSION_CHECK_TTL = "COMPOSIO_VERSION_CHECK_TTL"
+"""Time in seconds to cache the latest version for."""
+
+DEFAULT_VERSION_CHECK_TTL = 24 * 60 * 60.0
+
+VERSION_CHECK_TIMEOUT = 3.0
+"""Deadline for fetching the latest version from PyPI."""
+
+
+class VersionCheck(LocalStorage):
+    """Cached result of the latest version check."""
+
+    latest_version: str
+    """Latest version available on PyPI."""
+
+    checked_at: float
+    """Unix timestamp of the check."""
+
+
+def _get_ttl() -> float:
+    try:
+        return float(
+            os.environ.get(ENV_COMPOSIO_VERSION_CHECK_TTL, DEFAULT_VERSION_CHECK_TTL)
+        )
+    except ValueError:
+        return DEFAULT_VERSION_CHECK_TTL
+
+
+def _load_cached(ttl: float) -> t.Optional[VersionCheck]:
+    """Load the cached check if it has not expired yet."""
+    try:
+        check = VersionCheck.load(VERSION_CHECK_FILE)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    if time.time() - check.checked_at > ttl:
+        return None
+    return check
+
+
+def _fetch_latest(timeout: float) -> t.Optional[VersionCheck]:
+    """Fetch the latest version from PyPI and cache the result."""
+    try:
+        request = requests.get(PYPI_URL, timeout=timeout)
+        if request.status_code != 200:
+            return None
+
+        check = VersionCheck(
+            latest_version=request.json()["info"]["version"],
+            checked_at=time.time(),
+            path=VERSION_CHECK_FILE,
+        )
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    try:
+        VERSION_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        check.store()
+    except OSError:
+        pass
+    return check
+
+
+class _VersionChecker:
+    """Fetch the latest version in a background thread."""
+
+    def __init__(self, ttl: float, timeout: float) -> None:
+        self.result = _load_cached(ttl=ttl)
+        self._thread: t.Optional[threading.Thread] = None
+        if self.result is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(timeout,),
+                name="composio-version-check",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self, timeout: float) -> None:
+        self.result = _fetch_latest(timeout=timeout)
+
 
 def create_latest_version_warning_hook(version: str):
+    """
+    Create an exit hook which warns if a newer version is available.
+
+    The latest version is fetched in a daemon thread with a short deadline
+    and cached in the local cache directory, the hook only reads the result
+    so it never waits on the network. If the check hasn't finished by the
+    time the process exits, the warning is skipped for this run.
+    """
+    if os.environ.get(ENV_COMPOSIO_DISABLE_VERSION_CHECK, "false") == "true":
+        return lambda: None
+
+    checker = _VersionChecker(ttl=_get_ttl(), timeout=VERSION_CHECK_TIMEOUT)
+
     def latest_version_warning() -> None:
         try:
-            request = requests.get(
-                "https://pypi.org/pypi/composio-core/json",
-                timeout=10.0,
-            )
-            if request.status_code != 200:
+            if checker.result is None:
                 return
 
-            data = request.json()
-
             current_version = VersionInfo.parse(version)
-            latest_version = VersionInfo.parse(data["info"]["version"])
+            latest_version = VersionInfo.parse(checker.result.latest_version)
 
             if current_version < latest_version:
                 rich.print(
@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 
+from composio.client.httpcache import http_cache
+
 
 IS_CI = os.environ.get("CI") == "true"
 E2E = pytest.mark.e2e
@@ -14,3 +16,14 @@ ROOT_DIR = Path(__file__).parent.parent
 
 def skip_if_ci(reason: str) -> t.Callable:
     return pytest.mark.skipif(condition=IS_CI, reason=reason)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_http_cache(tmp_path_factory: pytest.TempPathFactory) -> t.Iterator:
+    """Keep the process wide HTTP cache out of the local cache directory."""
+    path = http_cache.path
+    http_cache.close()
+    http_cache.path = tmp_path_factory.mktemp("composio") / "http.db"
+    yield
+    http_cache.close()
+    http_cache.path = path
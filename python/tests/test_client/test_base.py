@@ -2,13 +2,17 @@
 Test client base.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
 
-from composio.client.base import Collection
+from composio.client.base import Collection, single_flight
 from composio.client.endpoints import Endpoint
 from composio.client.exceptions import HTTPError
+from composio.utils import codec
 
 
 class _Collection(Collection[dict]):
@@ -50,3 +54,86 @@ def test_invalid_data_object() -> None:
 
     with pytest.raises(HTTPError, match="Received invalid data object"):
         collection.get({})
+
+
+def test_single_flight() -> None:
+    """Test identical in-flight requests are merged into one."""
+    release = threading.Event()
+    calls = []
+
+    def _get(**kwargs):
+        calls.append(kwargs["url"])
+        release.wait(timeout=5)
+        return mock.MagicMock(status_code=200, content=codec.dumpb([{"id": 1}]))
+
+    collection = _Collection(
+        client=mock.MagicMock(
+            http=mock.MagicMock(get=_get, base_url="https://api", headers={})
+        )
+    )
+
+    single_flight.reset_stats()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(collection.get, {}) for _ in range(4)]
+        while single_flight.stats().calls < 4:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [[{"id": 1}]] * 4
+    assert calls == ["/v1"]
+    stats = single_flight.stats()
+    assert (stats.executions, stats.shared, stats.inflight) == (1, 3, 0)
+
+
+def test_iterate() -> None:
+    """Test iterating over a paginated collection."""
+    pages = {
+        str(page): {
+            "items": [{"id": (page - 1) * 2 + idx} for idx in range(2)],
+            "totalPages": 3,
+        }
+        for page in range(1, 4)
+    }
+    urls = []
+
+    def _get(**kwargs):
+        urls.append(kwargs["url"])
+        page = kwargs["url"].split("page=")[1].split("&")[0]
+        return mock.MagicMock(
+            status_code=200, content=codec.dumpb(pages.get(page, {"items": []}))
+        )
+
+    collection = _Collection(
+        client=mock.MagicMock(
+            http=mock.MagicMock(get=_get, base_url="https://api", headers={})
+        )
+    )
+    assert [item["id"] for item in collection.iterate(page_size=2)] == list(range(6))
+    assert urls[-1] == "/v1?page=3&pageSize=2"
+
+    urls.clear()
+    for item in collection.iterate(queries={"q": "x"}, page_size=2):
+        if item["id"] == 1:
+            break
+    assert urls == ["/v1?q=x&page=1&pageSize=2"]
+
+    model = mock.MagicMock(side_effect=lambda **item: item)
+    with mock.patch.object(_Collection, "model", model):
+        items = list(collection.iterate(page_size=2, where=lambda i: i["id"] % 2))
+    assert [item["id"] for item in items] == [1, 3, 5]
+    assert model.call_count == 3
+
+    # Without `totalPages` short pages don't end the iteration, the server
+    # may return fewer items than requested
+    for data in pages.values():
+        del data["totalPages"]
+    urls.clear()
+    assert [item["id"] for item in collection.iterate(page_size=3)] == list(range(6))
+    assert len(urls) == 4
+
+    # Endpoints which ignore the page parameter repeat the first page
+    pages["2"] = pages["1"]
+    urls.clear()
+    assert [item["id"] for item in collection.iterate(page_size=3)] == [0, 1]
+    assert len(urls) == 2
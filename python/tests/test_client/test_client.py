@@ -2,13 +2,141 @@
 Test composio client class.
 """
 
+import asyncio
+import typing as t
+from unittest import mock
+
 import pytest
 
-from composio.client import Composio
-from composio.client.exceptions import ComposioClientError
+from composio.client import AsyncComposio, Composio, Entity
+from composio.client.collections import ConnectedAccounts
+from composio.client.exceptions import ComposioClientError, NoItemsFound
+from composio.utils import codec
 
 
 def test_raise_invalid_api_key() -> None:
     """Test invalid API key."""
     with pytest.raises(ComposioClientError, match="API Key is not valid!"):
         _ = Composio.validate_api_key(key="API_KEY")
+
+
+def _connected_account(id: str, app: str, created_at: str) -> t.Dict:
+    return {
+        "id": id,
+        "status": "ACTIVE",
+        "createdAt": created_at,
+        "updatedAt": created_at,
+        "appUniqueId": app,
+        "appName": app,
+        "integrationId": "integration",
+        "connectionParams": {},
+        "clientUniqueUserId": "default",
+    }
+
+
+def test_connection_resolution_cache() -> None:
+    """Test `Entity.get_connection` caches resolved connected accounts."""
+    http = mock.MagicMock()
+    http.get.return_value = mock.MagicMock(
+        status_code=200,
+        content=codec.dumpb(
+            {
+                "items": [
+                    _connected_account("ca_1", "github", "2024-01-01T00:00:00Z"),
+                    _connected_account("ca_2", "github", "2024-06-01T00:00:00Z"),
+                ]
+            }
+        ),
+    )
+    http.post.return_value = mock.MagicMock(
+        status_code=200,
+        content=codec.dumpb(
+            {"connectionStatus": "INITIATED", "connectedAccountId": "ca_3"}
+        ),
+    )
+    client = mock.MagicMock(http=http)
+    client.connected_accounts = ConnectedAccounts(client=client)
+    entity = Entity(client=client)
+
+    for _ in range(3):
+        assert entity.get_connection(app="github").id == "ca_2"
+    assert http.get.call_count == 1
+
+    # Cached accounts are returned as copies
+    entity.get_connection(app="github").id = "mutated"
+    assert entity.get_connection(app="github").id == "ca_2"
+
+    for _ in range(3):
+        with pytest.raises(NoItemsFound):
+            entity.get_connection(app="slack")
+    assert http.get.call_count == 2
+
+    client.connected_accounts.initiate(
+        integration_id="integration", entity_id="default"
+    )
+    assert len(client.connected_accounts.resolutions) == 0
+
+    assert entity.get_connection(app="github").id == "ca_2"
+    assert http.get.call_count == 3
+
+
+def test_async_entity_execute() -> None:
+    """Test executing an action using the async client."""
+
+    def _response(data: t.Dict) -> mock.MagicMock:
+        response = mock.MagicMock(status=200)
+        response.json = mock.AsyncMock(return_value=data)
+        return response
+
+    http = mock.MagicMock()
+    http.get = mock.AsyncMock(
+        return_value=_response(
+            {
+                "items": [
+                    _connected_account("ca_1", "github", "2024-01-01T00:00:00Z"),
+                ]
+            }
+        )
+    )
+    http.post = mock.AsyncMock(
+        return_value=_response({"data": {}, "error": None, "successfull": True})
+    )
+
+    async def _execute() -> t.Dict:
+        client = AsyncComposio(api_key="api_key")
+        action = mock.MagicMock(no_auth=False, is_local=False, app="github")
+        with mock.patch.object(
+            AsyncComposio, "http", new_callable=mock.PropertyMock, return_value=http
+        ), mock.patch.object(
+            client.actions, "get", new=mock.AsyncMock(return_value=[mock.MagicMock()])
+        ), mock.patch.object(
+            client.actions,
+            "_prepare_params",
+            side_effect=lambda action_model, params: params,
+        ):
+            return await client.get_entity().execute(action=action, params={})
+
+    assert asyncio.run(_execute())["successfull"]
+    assert http.get.await_count == 1
+    (call,) = http.post.await_args_list
+    assert call.kwargs["json"]["connectedAccountId"] == "ca_1"
+
+
+def test_async_client_event_loops() -> None:
+    """Test sessions created for a previous event loop are closed."""
+    client = AsyncComposio(api_key="api_key", base_url="http://localhost")
+
+    async def _http() -> t.Any:
+        return client.http
+
+    first = asyncio.run(_http())
+
+    async def _switch() -> t.Any:
+        http = client.http
+        await asyncio.sleep(0)
+        await client.close()
+        return http
+
+    second = asyncio.run(_switch())
+    assert first is not second
+    assert first.closed and second.closed
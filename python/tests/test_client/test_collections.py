@@ -2,16 +2,30 @@
 Test collections module.
 """
 
+import asyncio
+import json
+import threading
+import time
+import typing as t
 from logging import DEBUG
 from unittest import mock
 
+import pytest
+
 from composio.client.collections import (
+    Action,
+    Actions,
+    ConnectionRequestModel,
     Trigger,
     TriggerEventData,
     TriggerSubscription,
+    action_schema_cache,
     to_trigger_names,
 )
-from composio.utils import logging
+from composio.client.exceptions import ComposioClientError
+from composio.client.reassembly import DroppedEvent
+from composio.utils import codec, logging
+from composio.utils.readiness import Backoff
 
 
 class TestTriggerNamesSerialization:
@@ -137,3 +151,269 @@ def test_trigger_filters(capsys, caplog) -> None:
         subscription.handle_event(event="")
 
     assert "Trigger 1 called from callback 1" in capsys.readouterr().out
+
+
+def _trigger_event(app: str, name: str, trigger_id: str) -> str:
+    return json.dumps(
+        {
+            "appName": app,
+            "payload": {},
+            "originalPayload": {},
+            "metadata": {
+                "id": trigger_id,
+                "connectionId": "ca_1",
+                "triggerName": name,
+                "triggerData": "",
+                "triggerConfig": {},
+                "connection": {
+                    "id": "ca_1",
+                    "integrationId": "integration",
+                    "clientUniqueUserId": "default",
+                    "status": "ACTIVE",
+                },
+            },
+        }
+    )
+
+
+def test_trigger_routing() -> None:
+    """Test events are routed using the indexed filters."""
+    subscription = TriggerSubscription(workers=4, queue_size=8)
+    calls: t.Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def _register(name: str, filters: t.Dict) -> None:
+        def _callback(_: TriggerEventData) -> None:
+            with lock:
+                calls[name] = calls.get(name, 0) + 1
+
+        subscription.callback(filters=filters)(_callback)  # type: ignore
+
+    _register("any", {})
+    _register("github", {"app_name": "GITHUB"})
+    _register("star", {"app_name": "github", "trigger_name": "GITHUB_STAR_ADDED"})
+    _register("slack", {"app_name": "slack"})
+    _register("other_entity", {"app_name": "github", "entity_id": "someone"})
+
+    futures = [
+        subscription.dispatch_event(
+            _trigger_event("github", "GITHUB_STAR_ADDED", f"trigger_{idx}")
+        )
+        for idx in range(50)
+    ]
+    futures.append(
+        subscription.dispatch_event(_trigger_event("github", "GITHUB_PR", "pr"))
+    )
+    for future in futures:
+        future.result()
+    subscription.close()
+
+    assert calls == {"any": 51, "github": 51, "star": 50}
+    stats = subscription.stats()
+    assert stats.completed == stats.submitted == 51
+
+
+def test_chunked_events() -> None:
+    """Test chunked events are reassembled and incomplete ones are dropped."""
+    subscription = TriggerSubscription(chunk_ttl=0.05)
+    dropped: t.List[DroppedEvent] = []
+    subscription.on_drop(dropped.append)
+
+    def _chunk(key: str, index: int, chunk: str, final: bool) -> None:
+        subscription.handle_chunked_events(
+            event=json.dumps(
+                {"id": key, "index": index, "chunk": chunk, "final": final}
+            )
+        )
+
+    event = _trigger_event("github", "GITHUB_STAR_ADDED", "trigger_1")
+    with mock.patch.object(subscription, "dispatch_event") as dispatch_event:
+        _chunk(key="event_1", index=0, chunk=event[:100], final=False)
+        _chunk(key="event_1", index=1, chunk=event[100:], final=True)
+        dispatch_event.assert_called_once_with(event=event)
+
+        _chunk(key="event_2", index=0, chunk="{", final=False)
+        time.sleep(0.05)
+        _chunk(key="event_3", index=0, chunk="{", final=False)
+
+    assert [event.id for event in dropped] == ["event_2"]
+    stats = subscription.chunk_stats()
+    assert (stats.completed, stats.expired, stats.pending) == (1, 1, 1)
+
+
+def test_wait_until_active() -> None:
+    """Test connection requests and subscriptions wake up on state changes."""
+    request = ConnectionRequestModel(
+        connectionStatus="INITIATED",
+        connectedAccountId="ca_1",
+    )
+    backoff = Backoff(initial=0.01, jitter=0.0)
+    statuses = ["INITIATED", "INITIATED", "ACTIVE"]
+    client = mock.MagicMock()
+    client.connected_accounts.get.side_effect = lambda connection_id: mock.Mock(
+        status=statuses.pop(0),
+        clientUniqueUserId="default",
+        appUniqueId="github",
+    )
+    connection = request.wait_until_active(client=client, backoff=backoff)
+    assert connection.status == "ACTIVE"
+    client.connected_accounts.invalidate_resolutions.assert_called_once_with(
+        entity_id="default",
+        app="github",
+    )
+
+    async def _get(connection_id: str) -> mock.Mock:
+        return mock.Mock(id=connection_id, status="INITIATED")
+
+    client.connected_accounts.get.side_effect = _get
+    with pytest.raises(ComposioClientError):
+        asyncio.run(
+            request.async_wait_until_active(
+                client=client,
+                timeout=0.05,
+                backoff=backoff,
+            )
+        )
+
+    subscription = TriggerSubscription()
+    threading.Timer(0.05, subscription.set_alive).start()
+    subscription.wait_until_alive(timeout=5.0)
+    assert subscription.is_alive()
+
+    threading.Timer(0.05, subscription.close).start()
+    subscription.listen()
+
+
+def test_async_listen() -> None:
+    """Test `async_listen` returns as soon as the subscription is closed."""
+    subscription = TriggerSubscription()
+    threading.Timer(0.05, subscription.close).start()
+    start = time.monotonic()
+    asyncio.run(asyncio.wait_for(subscription.async_listen(), timeout=5.0))
+    assert time.monotonic() - start < 1.0
+
+    # Closed subscriptions return immediately
+    asyncio.run(asyncio.wait_for(subscription.async_listen(), timeout=1.0))
+
+
+def _action_schema(name: str, app: str) -> t.Dict:
+    return {
+        "name": name,
+        "appName": app,
+        "appId": app,
+        "tags": ["important"],
+        "parameters": {
+            "properties": {"owner": {"type": "string"}},
+            "title": "Request",
+            "type": "object",
+        },
+        "response": {"properties": {}, "title": "Response", "type": "object"},
+    }
+
+
+class TestActionSchemaCache:
+    """Test process wide action schema cache."""
+
+    def setup_method(self) -> None:
+        action_schema_cache.clear()
+        action_schema_cache.reset_stats()
+
+    def test_execute_uses_cached_schema(self) -> None:
+        """Test `Actions.execute` does not refetch a cached schema."""
+        http = mock.MagicMock(base_url="https://backend")
+        http.get.return_value = mock.MagicMock(
+            status_code=200,
+            content=codec.dumpb(
+                {
+                    "items": [
+                        _action_schema("GITHUB_META_ROOT", "github"),
+                        _action_schema("GITHUB_META_ZEN", "github"),
+                    ]
+                }
+            ),
+        )
+        http.post.return_value = mock.MagicMock(
+            status_code=200,
+            content=codec.dumpb({"successfull": True, "data": {}}),
+        )
+        actions = Actions(client=mock.MagicMock(http=http, base_url="https://backend"))
+        action = mock.MagicMock(
+            spec=Action,
+            slug="GITHUB_META_ROOT",
+            app="github",
+            is_local=False,
+            no_auth=False,
+        )
+        with mock.patch(
+            "composio.client.collections.Action",
+            side_effect=lambda x: x,
+        ):
+            for _ in range(3):
+                actions.execute(
+                    action=action,
+                    params={"owner": "composio"},
+                    connected_account="ca_1",
+                )
+
+            # Schemas for the rest of the app are warmed as well
+            (zen,) = actions.get(
+                actions=[
+                    mock.MagicMock(spec=Action, slug="GITHUB_META_ZEN", is_local=False)
+                ]
+            )
+
+        assert zen.name == "GITHUB_META_ZEN"
+        assert http.get.call_count == 1
+        assert http.post.call_count == 3
+        assert action_schema_cache.stats().hits == 3
+
+        assert actions.invalidate_cache() == 2
+        assert len(action_schema_cache) == 0
+
+    def test_cache_is_scoped_and_ordered(self) -> None:
+        """Test schemas are cached per API key and returned in request order."""
+        names = ["GITHUB_META_ZEN", "GITHUB_META_ROOT", "GITHUB_META_OCTOCAT"]
+
+        def _actions(api_key: str) -> t.Tuple[Actions, mock.MagicMock]:
+            http = mock.MagicMock(base_url="https://backend")
+            http.get.return_value = mock.MagicMock(
+                status_code=200,
+                content=codec.dumpb(
+                    {"items": [_action_schema(name, "github") for name in names]}
+                ),
+            )
+            client = mock.MagicMock(
+                http=http,
+                base_url="https://backend",
+                api_key=api_key,
+            )
+            return Actions(client=client), http
+
+        def _get(actions: Actions, *slugs: str) -> t.List[str]:
+            with mock.patch(
+                "composio.client.collections.Action",
+                side_effect=lambda x: x,
+            ):
+                items = actions.get(
+                    actions=[
+                        mock.MagicMock(
+                            spec=Action, slug=slug, app="github", is_local=False
+                        )
+                        for slug in slugs
+                    ]
+                )
+            return [item.name for item in items]
+
+        first, http = _actions(api_key="key_1")
+        assert _get(first, "GITHUB_META_ROOT") == ["GITHUB_META_ROOT"]
+        with mock.patch(
+            "composio.client.collections.Action",
+            side_effect=lambda x: mock.MagicMock(slug=x),
+        ):
+            first.invalidate_cache(actions=["GITHUB_META_ZEN"])
+        assert _get(first, *names) == names
+        assert http.get.call_count == 2
+
+        second, http = _actions(api_key="key_2")
+        assert _get(second, "GITHUB_META_ROOT") == ["GITHUB_META_ROOT"]
+        assert http.get.call_count == 1
@@ -0,0 +1,49 @@
+"""
+Test trigger event dispatcher.
+"""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from composio.client.dispatch import Dispatcher
+
+
+def test_dispatch() -> None:
+    """Test tasks run on the long lived workers and errors are reported."""
+    dispatcher = Dispatcher(workers=2, queue_size=4)
+    threads = {dispatcher.submit(threading.current_thread).result() for _ in range(8)}
+    assert len(threads) <= 2
+    assert all(thread.name.startswith("composio-dispatch") for thread in threads)
+    assert not dispatcher.in_worker()
+
+    with pytest.raises(ValueError):
+        dispatcher.submit(int, "not a number").result()
+
+    dispatcher.shutdown()
+    stats = dispatcher.stats()
+    assert (stats.submitted, stats.completed, stats.failed) == (9, 9, 1)
+    assert stats.latency.count == 9
+    assert stats.workers == 0
+
+
+def test_backpressure() -> None:
+    """Test submissions block once the queue is full."""
+    release = threading.Event()
+    dispatcher = Dispatcher(workers=1, queue_size=1)
+    running = dispatcher.submit(release.wait)
+    while dispatcher.stats().queue_depth > 0:
+        time.sleep(0.001)
+
+    queued = dispatcher.submit(release.wait)
+    with pytest.raises(queue.Full):
+        dispatcher.submit(release.wait, timeout=0.05)
+
+    stats = dispatcher.stats()
+    assert (stats.queue_depth, stats.max_queue_depth, stats.blocked) == (1, 1, 1)
+
+    release.set()
+    assert running.result() and queued.result()
+    dispatcher.shutdown()
@@ -2,6 +2,8 @@
 Test the auto-generate Enum
 """
 
+import tempfile
+from pathlib import Path
 from typing import Dict, List
 from unittest import mock
 
@@ -11,6 +13,7 @@ from pydantic import BaseModel
 from composio import action
 from composio.client.enums import Action, App, Tag, Trigger, base
 from composio.exceptions import ComposioSDKError
+from composio.storage.metadata import MetadataStore
 from composio.tools.base.local import LocalAction, LocalTool
 
 
@@ -143,3 +146,109 @@ def test_get_actions() -> None:
     for act in App.GITHUB.get_actions(tags=["repo"]):
         assert act.app == "github"
         assert "repo" in act.tags
+
+
+def test_lazy_members() -> None:
+    """Test enum members are created on first access."""
+    name = "ASANA_ADD_A_PORTFOLIO_ITEM"
+    if base.LAZY_ENUMS and name in vars(Action):
+        delattr(Action, name)
+
+    assert not base.LAZY_ENUMS or name not in vars(Action)
+    member = getattr(Action, name)
+    assert member.slug == name
+    assert vars(Action)[name] is member
+    assert getattr(Action, name) is member
+    assert next(act for act in Action.all() if act.slug == name) is member
+    assert name in dir(Action)
+    with pytest.raises(AttributeError):
+        _ = Action.NOT_AN_ACTION  # type: ignore
+
+
+def test_action_indexes() -> None:
+    """Test `App.get_actions` using the app and tag indexes."""
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(
+        base, "metadata_store", MetadataStore(path=Path(temp_dir, "metadata.db"))
+    ):
+        try:
+            base.update_metadata(
+                items=[
+                    base.AppData(name="github", path=base.APPS_CACHE / "GITHUB"),
+                    base.AppData(name="slack", path=base.APPS_CACHE / "SLACK"),
+                    base.ActionData(
+                        name="GITHUB_META_ROOT",
+                        app="github",
+                        tags=["meta"],
+                        path=base.ACTIONS_CACHE / "GITHUB_META_ROOT",
+                    ),
+                    base.ActionData(
+                        name="GITHUB_GET_GITHUB_META_INFORMATION",
+                        app="github",
+                        tags=["important"],
+                        path=base.ACTIONS_CACHE / "GITHUB_GET_GITHUB_META_INFORMATION",
+                    ),
+                    base.ActionData(
+                        name="SLACKBOT_CHAT_POST_MESSAGE",
+                        app="slackbot",
+                        tags=["important"],
+                        path=base.ACTIONS_CACHE / "SLACKBOT_CHAT_POST_MESSAGE",
+                    ),
+                ]
+            )
+            assert base.get_index(name="tags") == {
+                "important": [
+                    "GITHUB_GET_GITHUB_META_INFORMATION",
+                    "SLACKBOT_CHAT_POST_MESSAGE",
+                ],
+                "meta": ["GITHUB_META_ROOT"],
+            }
+            assert list(App.GITHUB.get_actions()) == [
+                Action.GITHUB_GET_GITHUB_META_INFORMATION,
+                Action.GITHUB_META_ROOT,
+            ]
+            assert list(App.GITHUB.get_actions(tags=["meta"])) == [
+                Action.GITHUB_META_ROOT
+            ]
+            assert list(App.SLACKBOT.get_actions()) == [
+                Action.SLACKBOT_CHAT_POST_MESSAGE
+            ]
+
+            # Apps missing from the index fall back to scanning the actions
+            with mock.patch.object(
+                Action,
+                "all",
+                return_value=iter([Action.SLACK_SENDS_A_MESSAGE_TO_A_SLACK_CHANNEL]),
+            ):
+                assert list(App.SLACK.get_actions()) == [
+                    Action.SLACK_SENDS_A_MESSAGE_TO_A_SLACK_CHANNEL
+                ]
+        finally:
+            base._index_cache.clear()  # pylint: disable=protected-access
+            base._model_cache.clear()  # pylint: disable=protected-access
+
+
+def test_all_decodes_lazily() -> None:
+    """Test `all()` defers decoding metadata until a member is loaded."""
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(
+        base, "metadata_store", MetadataStore(path=Path(temp_dir, "metadata.db"))
+    ):
+        try:
+            base.update_metadata(
+                items=[
+                    base.AppData(name="github", path=base.APPS_CACHE / "GITHUB"),
+                    base.AppData(name="slack", path=base.APPS_CACHE / "SLACK"),
+                ]
+            )
+            with mock.patch.object(
+                base.codec, "loads", wraps=base.codec.loads
+            ) as loads:
+                assert App.GITHUB in list(App.all())
+                assert loads.call_count == 0
+                cached = base._model_cache  # pylint: disable=protected-access
+                assert "GITHUB" not in cached
+                assert App.GITHUB.load().name == "github"
+                assert loads.call_count == 1
+        finally:
+            base._index_cache.clear()  # pylint: disable=protected-access
+            base._model_cache.clear()  # pylint: disable=protected-access
+            base._raw_cache.clear()  # pylint: disable=protected-access
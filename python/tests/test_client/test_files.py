@@ -0,0 +1,80 @@
+"""
+Test streaming file helpers.
+"""
+
+import base64
+import binascii
+import json
+import os
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from composio.client.files import (
+    FileReference,
+    StreamingJSONBody,
+    b64decode_to_file,
+    b64encode_file,
+)
+
+
+@pytest.fixture(name="blob")
+def _blob(tmp_path: Path) -> Path:
+    path = tmp_path / "blob.bin"
+    path.write_bytes(os.urandom(10_001))
+    return path
+
+
+def test_b64encode_file(blob: Path) -> None:
+    """Test chunked encoding matches encoding the whole file."""
+    expected = base64.b64encode(blob.read_bytes())
+    assert b"".join(b64encode_file(path=blob, chunk_size=1000)) == expected
+    assert FileReference.from_path(blob).encoded_size == len(expected)
+
+
+def test_b64decode_to_file(blob: Path, tmp_path: Path) -> None:
+    """Test chunked decoding round trips and ignores non-alphabet characters."""
+    content = base64.urlsafe_b64encode(blob.read_bytes()).decode()
+    output = tmp_path / "output.bin"
+    assert b64decode_to_file(content=content, path=output, chunk_size=1000) == 10_001
+    assert output.read_bytes() == blob.read_bytes()
+
+    lines = textwrap.wrap(content, width=76)
+    b64decode_to_file(content="\r\n".join(lines), path=output, chunk_size=1000)
+    assert output.read_bytes() == blob.read_bytes()
+
+    # Same as `base64.urlsafe_b64decode`, eg. for `data:` URLs or stray quotes
+    noisy = "*".join(f'"{line}"' for line in lines)
+    assert base64.urlsafe_b64decode(noisy) == blob.read_bytes()
+    b64decode_to_file(content=noisy, path=output, chunk_size=1000)
+    assert output.read_bytes() == blob.read_bytes()
+
+    with pytest.raises(binascii.Error):
+        b64decode_to_file(content="abc", path=output)
+    assert not output.exists()
+
+
+def test_streaming_json_body(blob: Path) -> None:
+    """Test streamed body matches the JSON encoded request and can be rewound."""
+    request = {
+        "input": {
+            "file": {"name": "blob.bin", "content": FileReference.from_path(blob)}
+        },
+        "entityId": "default",
+        "text": None,
+    }
+    body = StreamingJSONBody(request, chunk_size=999)
+    assert StreamingJSONBody.has_references(request)
+
+    data = body.readall()
+    assert len(data) == len(body) == int(body.headers["Content-Length"])
+    assert body.tell() == len(data)
+    decoded = json.loads(data)
+    assert base64.b64decode(decoded["input"]["file"]["content"]) == blob.read_bytes()
+    assert decoded["entityId"] == "default"
+
+    body.seek(0)
+    assert b"".join(iter(lambda: body.read(4096) or b"", b"")) == data
+    body.seek(0)
+    assert b"".join(body) == data
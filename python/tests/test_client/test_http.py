@@ -0,0 +1,141 @@
+"""
+Test HTTP client.
+"""
+
+import typing as t
+from unittest import mock
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests.exceptions import ChunkedEncodingError
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from composio.client.http import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpClient,
+    RetryPolicy,
+)
+
+
+def _response(status_code: int, headers: t.Optional[t.Dict] = None) -> mock.MagicMock:
+    return mock.MagicMock(status_code=status_code, headers=headers or {})
+
+
+def _client(**kwargs) -> HttpClient:
+    return HttpClient(
+        base_url="https://backend.composio.dev/api",
+        api_key="api_key",
+        retry_policy=RetryPolicy(backoff_factor=0.0),
+        **kwargs,
+    )
+
+
+@mock.patch("composio.client.http.time.sleep")
+def test_retry_with_retry_after(sleep: mock.MagicMock) -> None:
+    """Test idempotent requests are retried and `Retry-After` is honoured."""
+    client = _client()
+    with mock.patch.object(
+        client,
+        "request",
+        side_effect=[
+            _response(503, {"Retry-After": "2"}),
+            _response(502),
+            _response(200),
+        ],
+    ) as request:
+        assert client.get(url="/v1/apps").status_code == 200
+
+    assert request.call_count == 3
+    assert sleep.call_args_list[0].args == (2.0,)
+    stats = client.stats()["GET /v1/apps"]
+    assert stats.requests == 1
+    assert stats.retries == 2
+    assert stats.failures == 0
+
+
+@mock.patch("composio.client.http.time.sleep")
+def test_non_idempotent_request(_sleep: mock.MagicMock) -> None:
+    """Test non-idempotent requests are only retried on rate limits."""
+    client = _client()
+    with mock.patch.object(
+        client, "request", side_effect=[_response(429), _response(500)]
+    ) as request:
+        assert client.post(url="/v1/actions/ACTION/execute").status_code == 500
+
+    assert request.call_count == 2
+    assert client.stats()["POST /v1/actions/ACTION/execute"].failures == 1
+
+
+@mock.patch("composio.client.http.time.sleep")
+def test_non_idempotent_connection_errors(_sleep: mock.MagicMock) -> None:
+    """Test non-idempotent requests are retried only if the connection failed."""
+    refused = RequestsConnectionError(
+        MaxRetryError(
+            pool=None,  # type: ignore[arg-type]
+            url="/v1/actions/ACTION/execute",
+            reason=NewConnectionError(mock.MagicMock(), "Connection refused"),
+        )
+    )
+    client = _client()
+    with mock.patch.object(
+        client, "request", side_effect=[refused, _response(200)]
+    ) as request:
+        assert client.post(url="/v1/actions/ACTION/execute").status_code == 200
+    assert request.call_count == 2
+
+    with mock.patch.object(
+        client, "request", side_effect=RequestsConnectionError("Connection reset")
+    ) as request, pytest.raises(RequestsConnectionError):
+        client.post(url="/v1/actions/ACTION/execute")
+    assert request.call_count == 1
+
+
+def test_retry_policy_backoff() -> None:
+    """Test exponential backoff with jitter."""
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=0.5)
+    for attempt, upper in ((0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)):
+        assert upper / 2 <= policy.backoff(attempt=attempt) <= upper
+    assert policy.backoff(attempt=0, retry_after=60.0) == 5.0
+
+
+def test_circuit_breaker() -> None:
+    """Test requests fail fast once the circuit is open."""
+    client = _client(circuit_breaker=CircuitBreaker(failure_threshold=2))
+    client.retry_policy = RetryPolicy(max_retries=0)
+    with mock.patch.object(client, "request", return_value=_response(500)) as request:
+        client.get(url="/v1/apps")
+        client.get(url="/v1/apps")
+        with pytest.raises(CircuitOpenError):
+            client.get(url="/v1/apps")
+
+    assert request.call_count == 2
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+    client.circuit_breaker.reset_timeout = 0.0
+    assert client.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    with mock.patch.object(client, "request", return_value=_response(200)):
+        client.get(url="/v1/apps")
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize(
+    "error",
+    (TypeError("unexpected keyword argument"), ChunkedEncodingError("truncated")),
+)
+def test_circuit_breaker_trial_errors(error: Exception) -> None:
+    """Test a trial request failing with an unexpected error does not wedge the circuit."""
+    client = _client(circuit_breaker=CircuitBreaker(failure_threshold=1))
+    client.retry_policy = RetryPolicy(max_retries=0)
+    with mock.patch.object(client, "request", return_value=_response(500)):
+        client.get(url="/v1/apps")
+
+    client.circuit_breaker.reset_timeout = 0.0
+    with mock.patch.object(client, "request", side_effect=error), pytest.raises(
+        type(error)
+    ):
+        client.get(url="/v1/apps")
+
+    with mock.patch.object(client, "request", return_value=_response(200)):
+        assert client.get(url="/v1/apps").status_code == 200
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
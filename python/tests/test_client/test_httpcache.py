@@ -0,0 +1,103 @@
+"""
+Test persistent HTTP cache.
+"""
+
+import time
+from pathlib import Path
+from unittest import mock
+
+from composio.client.httpcache import CACHE_STATUS_HEADER, HttpCache
+
+
+def _response(status_code: int, content: bytes = b"", **headers) -> mock.MagicMock:
+    return mock.MagicMock(status_code=status_code, content=content, headers=headers)
+
+
+def _http() -> mock.MagicMock:
+    return mock.MagicMock(base_url="https://backend", headers={"x-api-key": "key"})
+
+
+def test_revalidation(tmp_path: Path) -> None:
+    """Test expired entries are revalidated using the stored validators."""
+    http = _http()
+    http.get.side_effect = [
+        _response(200, b'{"items": []}', ETag='"v1"'),
+        _response(304),
+    ]
+    cache = HttpCache(path=tmp_path / "http.db", stale_while_revalidate=0.0)
+
+    response = cache.get(http=http, url="/v1/apps")
+    assert response.content == b'{"items": []}'
+    http.get.assert_called_with(url="/v1/apps")
+
+    response = cache.get(http=http, url="/v1/apps")
+    http.get.assert_called_with(url="/v1/apps", headers={"If-None-Match": '"v1"'})
+    assert response.status_code == 200
+    assert response.headers[CACHE_STATUS_HEADER] == "revalidated"
+    assert response.json() == {"items": []}
+
+    stats = cache.stats()
+    assert (stats.misses, stats.revalidated, stats.hits) == (1, 1, 0)
+
+
+def test_stale_while_revalidate(tmp_path: Path) -> None:
+    """Test entries within the window are served and refreshed in the background."""
+    http = _http()
+    http.get.side_effect = [
+        _response(200, b"[1]", **{"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _response(200, b"[2]"),
+    ]
+    cache = HttpCache(
+        path=tmp_path / "http.db",
+        fresh_ttl=0.0,
+        stale_while_revalidate=60.0,
+    )
+    assert cache.get(http=http, url="/v1/actions").content == b"[1]"
+
+    response = cache.get(http=http, url="/v1/actions")
+    assert response.headers[CACHE_STATUS_HEADER] == "hit"
+    assert response.json() == [1]
+
+    deadline = time.monotonic() + 5
+    while cache.stats().misses < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    http.get.assert_called_with(
+        url="/v1/actions",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    )
+
+    # A new process reuses the refreshed entry
+    cache = HttpCache(
+        path=tmp_path / "http.db",
+        fresh_ttl=60.0,
+        stale_while_revalidate=60.0,
+    )
+    assert cache.get(http=http, url="/v1/actions").json() == [2]
+
+    assert cache.invalidate(http=http, url="/v1/actions") == 1
+    assert cache.lookup(key=cache.key(http=http, url="/v1/actions")) is None
+
+
+def test_fresh_ttl(tmp_path: Path) -> None:
+    """Test fresh entries are served without revalidation."""
+    http = _http()
+    http.get.return_value = _response(200, b"[1]", ETag='"v1"')
+    cache = HttpCache(
+        path=tmp_path / "http.db",
+        fresh_ttl=30.0,
+        stale_while_revalidate=60.0,
+    )
+    cache.get(http=http, url="/v1/apps")
+    with mock.patch.object(cache, "_revalidate_in_background") as revalidate:
+        for _ in range(3):
+            response = cache.get(http=http, url="/v1/apps")
+            assert response.headers[CACHE_STATUS_HEADER] == "hit"
+        assert revalidate.call_count == 0
+
+        later = time.time() + 45.0
+        with mock.patch("composio.client.httpcache.time.time", return_value=later):
+            cache.get(http=http, url="/v1/apps")
+        assert revalidate.call_count == 1
+
+    assert http.get.call_count == 1
+    assert cache.stats().hits == 4
@@ -0,0 +1,66 @@
+"""
+Test trigger event journal.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from composio.client.collections import TriggerEventData, TriggerSubscription
+from composio.client.journal import EventJournal
+
+from tests.test_client.test_collections import _trigger_event
+
+
+def test_journal(tmp_path: Path) -> None:
+    """Test batched polls, redelivery of uncommitted events, replay and compaction."""
+    journal = EventJournal(path=tmp_path / "triggers.db")
+    assert journal.append_batch(events=["a", "b", "c"]) == [1, 2, 3]
+    assert [entry.event for entry in journal.poll(limit=2, timeout=0)] == ["a", "b"]
+    assert [entry.event for entry in journal.poll(limit=2, timeout=0)] == ["c"]
+    assert journal.poll(timeout=0.01) == []
+    journal.commit(offset=2)
+
+    # Uncommitted events are delivered again after a restart
+    journal.close()
+    journal = EventJournal(path=tmp_path / "triggers.db")
+    assert [entry.offset for entry in journal.poll(timeout=0)] == [3]
+
+    journal.replay(offset=0)
+    assert [entry.offset for entry in journal.poll(timeout=0)] == [1, 2, 3]
+    journal.commit(offset=3)
+    assert journal.compact(retain=1) == 2
+    assert [entry.event for entry in journal.read()] == ["c"]
+
+    stats = journal.stats()
+    assert (stats.head, stats.committed, stats.size, stats.compacted) == (3, 3, 1, 2)
+
+
+def test_journaled_subscription(tmp_path: Path) -> None:
+    """Test events received before listening are handled and committed."""
+    journal = EventJournal(path=tmp_path / "triggers.db")
+    subscription = TriggerSubscription(journal=journal, batch_size=4)
+    for idx in range(10):
+        subscription.receive_event(
+            event=_trigger_event("github", "GITHUB_STAR_ADDED", f"trigger_{idx}")
+        )
+    assert journal.stats().size == 10
+
+    handled = []
+    done = threading.Event()
+
+    @subscription.callback()
+    def _callback(event: TriggerEventData) -> None:
+        handled.append(event.metadata.id)
+        if len(handled) == 10:
+            done.set()
+
+    subscription.start()
+    assert done.wait(timeout=5.0)
+    deadline = time.monotonic() + 5.0
+    while journal.committed() < 10 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    subscription.close()
+
+    assert sorted(handled) == sorted(f"trigger_{idx}" for idx in range(10))
+    assert journal.committed() == 10
@@ -0,0 +1,93 @@
+"""
+Test chunked event reassembly buffer.
+"""
+
+import time
+import typing as t
+
+from composio.client.reassembly import (
+    DROP_EVICTED,
+    DROP_EXPIRED,
+    DROP_INCOMPLETE,
+    DROP_LATE,
+    ChunkBuffer,
+    DroppedEvent,
+)
+
+
+def test_reassembly() -> None:
+    """Test chunks are joined in order once the final chunk arrives."""
+    buffer = ChunkBuffer()
+    assert buffer.add(key="one", index=1, chunk="b", final=False) is None
+    assert buffer.add(key="two", index=0, chunk="x", final=False) is None
+    assert buffer.add(key="one", index=0, chunk="a", final=False) is None
+    assert buffer.add(key="one", index=2, chunk="c", final=True) == "abc"
+
+    stats = buffer.stats()
+    assert (stats.pending, stats.size, stats.completed) == (1, 1, 1)
+
+
+def test_expiry_and_eviction() -> None:
+    """Test incomplete events are dropped and reported."""
+    dropped: t.List[DroppedEvent] = []
+    buffer = ChunkBuffer(ttl=0.05, max_size=10)
+
+    @buffer.on_drop
+    def _on_drop(event: DroppedEvent) -> None:
+        dropped.append(event)
+
+    @buffer.on_drop
+    def _broken(event: DroppedEvent) -> None:
+        raise ValueError(event.id)
+
+    buffer.add(key="old", index=0, chunk="12345", final=False)
+    buffer.add(key="new", index=0, chunk="123456", final=False)
+    assert [(event.id, event.reason) for event in dropped] == [("old", DROP_EVICTED)]
+
+    time.sleep(0.05)
+    assert buffer.expire() == 1
+    assert dropped[-1].id == "new"
+    assert dropped[-1].reason == DROP_EXPIRED
+    assert (dropped[-1].chunks, dropped[-1].size) == (1, 6)
+
+    stats = buffer.stats()
+    assert (stats.pending, stats.size, stats.expired, stats.evicted) == (0, 0, 1, 1)
+
+
+def test_late_chunks() -> None:
+    """Test chunks for dropped events are discarded until the TTL passes."""
+    dropped: t.List[DroppedEvent] = []
+    buffer = ChunkBuffer(ttl=0.1, max_size=4, on_drop=dropped.append)
+    buffer.add(key="big", index=0, chunk="12345", final=False)
+    assert dropped[-1].reason == DROP_EVICTED
+
+    assert buffer.add(key="big", index=1, chunk="6", final=True) is None
+    assert (dropped[-1].id, dropped[-1].reason) == ("big", DROP_LATE)
+    assert (dropped[-1].chunks, dropped[-1].size) == (1, 1)
+
+    stats = buffer.stats()
+    assert (stats.pending, stats.completed, stats.late) == (0, 0, 1)
+
+    time.sleep(0.1)
+    buffer.add(key="big", index=0, chunk="1", final=False)
+    assert buffer.add(key="big", index=1, chunk="2", final=True) == "12"
+    assert len(dropped) == 2
+
+
+def test_missing_chunks() -> None:
+    """Test events missing chunks when the final one arrives are dropped."""
+    dropped: t.List[DroppedEvent] = []
+    buffer = ChunkBuffer(on_drop=dropped.append)
+    buffer.add(key="gap", index=0, chunk="a", final=False)
+    assert buffer.add(key="gap", index=2, chunk="c", final=True) is None
+    assert [(event.id, event.reason, event.chunks) for event in dropped] == [
+        ("gap", DROP_INCOMPLETE, 2)
+    ]
+
+    # The missing chunk arriving afterwards is discarded
+    assert buffer.add(key="gap", index=1, chunk="b", final=False) is None
+    assert dropped[-1].reason == DROP_LATE
+
+    stats = buffer.stats()
+    assert (stats.pending, stats.size, stats.completed) == (0, 0, 0)
+    assert (stats.incomplete, stats.late) == (1, 1)
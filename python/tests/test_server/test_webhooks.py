@@ -0,0 +1,139 @@
+"""
+Test webhook trigger receiver.
+"""
+
+import asyncio
+import threading
+import time
+import typing as t
+from unittest import mock
+
+import httpx
+from fastapi.testclient import TestClient
+
+from composio.client.collections import TriggerEventData, TriggerSubscription
+from composio.server.api import WEBHOOK_PATH, create_app
+from composio.server.webhooks import (
+    DELIVERY_HEADER,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    DeliveryLog,
+    build_delivery,
+    generate_events,
+)
+
+
+SECRET = "whsec_test"
+
+
+def test_webhook_receiver() -> None:
+    """Test signed batches are verified and fed to the subscription callbacks."""
+    subscription = TriggerSubscription(workers=2)
+    received: t.List[str] = []
+    lock = threading.Lock()
+
+    @subscription.callback(filters={"app_name": "github"})
+    def _callback(event: TriggerEventData) -> None:
+        with lock:
+            received.append(event.metadata.triggerName)
+
+    client = TestClient(
+        create_app(trigger_subscription=subscription, webhook_secret=SECRET)
+    )
+    events = list(generate_events(count=50, seed=42))
+    body, headers = build_delivery(events=events, secret=SECRET, delivery_id="d_1")
+
+    response = client.post(WEBHOOK_PATH, content=body, headers=headers)
+    assert response.status_code == 202
+    assert response.json()["data"] == {"accepted": 50, "duplicate": False}
+
+    # Retried deliveries are not handled twice
+    response = client.post(WEBHOOK_PATH, content=body, headers=headers)
+    assert response.json()["data"] == {"accepted": 50, "duplicate": True}
+
+    subscription.close()
+    assert len(received) == sum(event["appName"] == "github" for event in events)
+    assert subscription.stats().submitted == 50
+
+
+def test_webhook_verification() -> None:
+    """Test unsigned, tampered and stale deliveries are rejected."""
+    client = TestClient(create_app(webhook_secret=SECRET))
+    body, headers = build_delivery(events=list(generate_events(count=2)), secret=SECRET)
+
+    response = client.post(WEBHOOK_PATH, content=body)
+    assert response.status_code == 401
+
+    response = client.post(WEBHOOK_PATH, content=body + b" ", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["error"] == "Invalid delivery signature"
+
+    replayed = {**headers, DELIVERY_HEADER: "d_other"}
+    response = client.post(WEBHOOK_PATH, content=body, headers=replayed)
+    assert response.json()["error"] == "Invalid delivery signature"
+
+    for timestamp in ("0", str(int(time.time()) + 3600)):
+        stale = {**headers, TIMESTAMP_HEADER: timestamp}
+        response = client.post(WEBHOOK_PATH, content=body, headers=stale)
+        assert response.json()["error"] == "Delivery timestamp is outside the tolerance"
+
+    body, headers = build_delivery(events=[], secret="other")
+    response = client.post(WEBHOOK_PATH, content=body, headers=headers)
+    assert response.status_code == 401
+    assert SIGNATURE_HEADER in headers
+
+    client = TestClient(create_app())
+    response = client.post(WEBHOOK_PATH, content=body, headers=headers)
+    assert response.status_code == 503
+
+
+def test_webhook_concurrent_retries() -> None:
+    """Test a retry arriving while the delivery is handed over is a duplicate."""
+    entered, release = threading.Event(), threading.Event()
+
+    def _receive_event(**_: t.Any) -> None:
+        entered.set()
+        release.wait(timeout=5.0)
+
+    subscription = mock.MagicMock()
+    subscription.receive_event.side_effect = _receive_event
+    app = create_app(trigger_subscription=subscription, webhook_secret=SECRET)
+    body, headers = build_delivery(
+        events=list(generate_events(count=1)),
+        secret=SECRET,
+        delivery_id="d_1",
+    )
+
+    async def _deliver() -> t.Tuple[t.Dict, t.Dict]:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            first = asyncio.create_task(
+                client.post(WEBHOOK_PATH, content=body, headers=headers)
+            )
+            await asyncio.to_thread(entered.wait, 5.0)
+            retry = await client.post(WEBHOOK_PATH, content=body, headers=headers)
+            release.set()
+            return (await first).json()["data"], retry.json()["data"]
+
+    first, retry = asyncio.run(_deliver())
+    assert first == {"accepted": 1, "duplicate": False}
+    assert retry == {"accepted": 1, "duplicate": True}
+    assert subscription.receive_event.call_count == 1
+
+
+def test_delivery_log() -> None:
+    """Test delivery IDs are remembered for the TTL regardless of volume."""
+    deliveries = DeliveryLog(ttl=0.1)
+    assert deliveries.reserve(delivery_id="d_1", accepted=5) is None
+    for idx in range(2000):
+        deliveries.reserve(delivery_id=f"d_other_{idx}", accepted=1)
+    assert deliveries.reserve(delivery_id="d_1", accepted=5) == 5
+
+    deliveries.release(delivery_id="d_1")
+    assert deliveries.reserve(delivery_id="d_1", accepted=5) is None
+
+    time.sleep(0.1)
+    assert deliveries.reserve(delivery_id="d_2", accepted=1) is None
+    assert len(deliveries) == 1
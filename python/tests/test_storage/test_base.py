@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 
 from composio.storage.base import LocalStorage
+from composio.storage.user import UserData
 
 
 def test_local_storage() -> None:
@@ -26,3 +27,11 @@ def test_local_storage() -> None:
 
         dstore = _Store.load(path=path)
         assert dstore.name == "name"
+
+
+def test_user_data_is_indented() -> None:
+    """Test `UserData` is stored in a human readable format."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir, "user_data.json")
+        UserData(api_key="key", path=path).store()
+        assert path.read_text(encoding="utf-8") == '{\n    "api_key": "key"\n}'
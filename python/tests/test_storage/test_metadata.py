@@ -0,0 +1,74 @@
+"""
+Test metadata store.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from composio.storage.metadata import MetadataStore
+from composio.utils import codec
+
+
+def test_metadata_store() -> None:
+    """Test reading, updating and replacing the store."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = MetadataStore(path=Path(temp_dir, "metadata.db"))
+        assert store.get(kind="apps", slug="GITHUB") is None
+        assert not store.items(kind="apps")
+
+        store.put(kind="apps", slug="GITHUB", data={"name": "github"})
+        assert store.get(kind="apps", slug="GITHUB") == {"name": "github"}
+
+        reader = MetadataStore(path=store.path)
+        assert reader.get(kind="apps", slug="GITHUB") == {"name": "github"}
+
+        assert (
+            store.replace(
+                entries=[
+                    ("apps", "SLACK", {"name": "slack"}),
+                    ("actions", "SLACK_SEND", {"name": "send"}),
+                ]
+            )
+            == 2
+        )
+        assert reader.get(kind="apps", slug="GITHUB") is None
+        assert reader.items(kind="apps") == {"SLACK": codec.dumps({"name": "slack"})}
+        assert list(Path(temp_dir).iterdir()) == [store.path]
+
+
+def test_metadata_store_migration() -> None:
+    """Test migrating per entry JSON files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        actions = Path(temp_dir, "actions")
+        actions.mkdir()
+        for name in ("GITHUB_META_ROOT", "SLACK_SEND"):
+            (actions / name).write_text(
+                json.dumps({"name": name, "path": str(actions / name)}),
+                encoding="utf-8",
+            )
+
+        store = MetadataStore(
+            path=Path(temp_dir, "metadata.db"),
+            legacy={"actions": actions, "apps": Path(temp_dir, "apps")},
+        )
+        assert store.get(kind="actions", slug="SLACK_SEND") == {"name": "SLACK_SEND"}
+        assert len(store.items(kind="actions")) == 2
+        assert store.migrate() == 0
+
+
+def test_metadata_store_indexes() -> None:
+    """Test storing inverted indexes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = MetadataStore(path=Path(temp_dir, "metadata.db"))
+        store.put(kind="apps", slug="GITHUB", data={"name": "github"})
+        assert store.index(name="tags") is None
+
+        store.replace(
+            entries=[],
+            indexes={"tags": {"important": ["SLACK_SEND", "GITHUB_META_ROOT"]}},
+        )
+        assert store.index(name="tags") == {
+            "important": ["GITHUB_META_ROOT", "SLACK_SEND"]
+        }
+        assert store.index(name="apps") is None
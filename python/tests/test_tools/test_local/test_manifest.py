@@ -0,0 +1,28 @@
+"""
+Test local tools registry loading.
+"""
+
+import json
+from unittest import mock
+
+from composio.tools.local import MANIFEST_PATH, build_manifest, load_local_tools
+
+
+def test_manifest_up_to_date() -> None:
+    """Test the local tools manifest matches the local tools."""
+    assert json.loads(MANIFEST_PATH.read_text(encoding="utf-8")) == build_manifest(), (
+        "Local tools manifest is outdated, run `python -c 'from "
+        "composio.tools.local import write_manifest; write_manifest()'`"
+    )
+
+
+def test_load_local_tools_once() -> None:
+    """Test local tool modules are imported once per process."""
+    load_local_tools()
+    with mock.patch("importlib.import_module") as import_module:
+        registry = load_local_tools()
+        assert import_module.call_count == 0
+        assert "SHELLTOOL" in registry["local"]
+
+        load_local_tools(refresh=True)
+        assert import_module.call_count > 0
@@ -2,16 +2,30 @@
 Test composio toolset.
 """
 
+import asyncio
+import base64
 import logging
 import re
+import time
+import typing as t
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
 from composio import Action, App
+from composio.client import AsyncComposio
+from composio.client.collections import ActionModel
+from composio.client.enums.base import ActionData
 from composio.exceptions import ApiKeyNotProvidedError, ComposioSDKError
 from composio.tools import ComposioToolSet
 from composio.tools.base.abs import action_registry, tool_registry
+from composio.tools.toolset import ActionCall
+from composio.utils.instrumentation import (
+    PHASE_PROCESSOR,
+    InMemoryExporter,
+    Instrumentation,
+)
 
 
 def test_get_schemas() -> None:
@@ -147,3 +161,303 @@ def test_api_key_missing() -> None:
         ),
     ):
         _ = toolset.workspace
+
+
+def test_execute_actions() -> None:
+    """Test `ComposioToolSet.execute_actions` method."""
+
+    def _execute_action(action, params, **_):
+        if params.get("fail"):
+            raise ComposioSDKError("Execution failed")
+        time.sleep(params.get("sleep", 0))
+        return {"action": str(action), "params": params}
+
+    toolset = ComposioToolSet()
+    action = Action.SHELLTOOL_EXEC_COMMAND
+    with mock.patch.object(
+        ComposioToolSet, "workspace", new_callable=mock.PropertyMock
+    ) as workspace, mock.patch.object(
+        toolset, "execute_action", side_effect=_execute_action
+    ):
+        results = toolset.execute_actions(
+            calls=[
+                (action, {"sleep": 0.2}),
+                ActionCall(action=action, params={"id": 1}),
+                {"action": action, "params": {"fail": True}},
+                (action, {"sleep": 2}),
+                ("NOT_AN_ACTION", {}),
+            ],
+            concurrency=4,
+            timeout=0.5,
+        )
+
+    assert workspace.call_count == 1
+    assert [result.ok for result in results] == [True, True, False, False, False]
+    assert results[0].response["params"] == {"sleep": 0.2}  # type: ignore
+    assert results[1].response["params"] == {"id": 1}  # type: ignore
+    assert isinstance(results[2].error, ComposioSDKError)
+    assert isinstance(results[3].error, TimeoutError)
+
+
+def test_execute_action_instrumentation() -> None:
+    """Test phases of `ComposioToolSet.execute_action` are instrumented."""
+    exporter = InMemoryExporter()
+    toolset = ComposioToolSet(instrumentation=Instrumentation(exporters=[exporter]))
+    with mock.patch.object(
+        ComposioToolSet, "workspace", new_callable=mock.PropertyMock
+    ) as workspace:
+        workspace.return_value.execute_action.return_value = {
+            "data": {},
+            "error": "Command failed",
+            "successful": False,
+        }
+        toolset.execute_action(
+            action=Action.SHELLTOOL_EXEC_COMMAND,
+            params={"cmd": "ls"},
+        )
+
+    assert [span.name for span in exporter.spans] == [
+        "serialize",
+        "preprocess",
+        "local",
+        "postprocess",
+        "execute",
+    ]
+    *phases, execute = exporter.spans
+    assert execute.tags == {
+        "action": "SHELLTOOL_EXEC_COMMAND",
+        "app": "shelltool",
+        "workspace": "magicmock",
+        "outcome": "failure",
+    }
+    assert all(span.parent is execute for span in phases)
+    assert all(span.outcome == "success" for span in phases)
+
+
+def test_schema_cache() -> None:
+    """Test processed schemas are cached by `ComposioToolSet.get_action_schemas`."""
+    calls = []
+
+    def _schema(properties: t.Dict) -> t.Dict:
+        calls.append(properties)
+        return properties
+
+    toolset = ComposioToolSet(
+        processors={"schema": {Action.SHELLTOOL_EXEC_COMMAND: _schema}}
+    )
+    actions = [Action.SHELLTOOL_EXEC_COMMAND]
+    (schema,) = toolset.get_action_schemas(actions=actions)
+    schema.description = "modified"
+    (cached,) = toolset.get_action_schemas(actions=["shelltool_exec_command"])
+    assert len(calls) == 1
+    assert cached.description != "modified"
+    assert cached is not schema
+
+    assert toolset.schema_cache.invalidate() == 1
+    toolset.get_action_schemas(actions=actions)
+    assert len(calls) == 2
+    assert toolset.schema_cache.stats().hits == 1
+
+
+def test_processors() -> None:
+    """Test request and response processors are dispatched in order."""
+    calls = []
+
+    def _processor(name: str):
+        def _process(data: t.Dict) -> t.Dict:
+            calls.append(name)
+            return {**data, name: True}
+
+        _process.__name__ = name
+        return _process
+
+    exporter = InMemoryExporter()
+    toolset = ComposioToolSet(
+        instrumentation=Instrumentation(exporters=[exporter]),
+        processors={
+            "pre": {
+                App.SHELLTOOL: _processor("app_pre"),
+                "shelltool_exec_command": _processor("action_pre"),
+            },
+            "post": {
+                Action.SHELLTOOL_EXEC_COMMAND: _processor("action_post"),
+                "shelltool": _processor("app_post"),
+            },
+        },
+    )
+    response: t.Dict[str, t.Any] = {"data": {}, "error": None, "successful": True}
+    with mock.patch.object(
+        ComposioToolSet, "workspace", new_callable=mock.PropertyMock
+    ) as workspace:
+        workspace.return_value.execute_action.return_value = response
+        assert toolset.execute_action(
+            action=Action.SHELLTOOL_EXEC_COMMAND,
+            params={"cmd": "ls"},
+        ) == {**response, "action_post": True, "app_post": True}
+        assert workspace.return_value.execute_action.call_args.kwargs[
+            "request_data"
+        ] == {"cmd": "ls", "app_pre": True, "action_pre": True}
+        assert calls == ["app_pre", "action_pre", "action_post", "app_post"]
+
+        # Actions without processors are passed through as they are
+        assert (
+            toolset.execute_action(
+                action=Action.FILETOOL_LIST_FILES,
+                params={"cmd": "ls"},
+            )
+            == response
+        )
+        assert workspace.return_value.execute_action.call_args.kwargs[
+            "request_data"
+        ] == {"cmd": "ls"}
+        assert len(calls) == 4
+
+    assert [
+        (span.tags["type"], span.tags["processor"])
+        for span in exporter.spans
+        if span.name == PHASE_PROCESSOR
+    ] == [
+        ("pre", "app_pre"),
+        ("pre", "action_pre"),
+        ("post", "action_post"),
+        ("post", "app_post"),
+    ]
+
+
+def _remote_action(tmp_path: Path) -> Action:
+    """Load metadata for a remote action without fetching it."""
+    action = Action.GITHUB_STAR_A_REPOSITORY_FOR_THE_AUTHENTICATED_USER
+    mock.patch.dict(
+        "composio.client.enums.base._model_cache",
+        {
+            action.slug: ActionData(
+                name=action.slug,
+                app="GITHUB",
+                tags=[],
+                no_auth=True,
+                path=tmp_path / action.slug,
+            )
+        },
+    ).start()
+    return action
+
+
+def _remote_schema(action: Action) -> ActionModel:
+    return ActionModel.model_validate(
+        {
+            "name": action.slug,
+            "appName": "github",
+            "appId": "github",
+            "tags": [],
+            "parameters": {
+                "properties": {
+                    "attachment": {
+                        "title": "FileType",
+                        "properties": {"name": {}, "content": {}},
+                    }
+                },
+                "title": "Request",
+                "type": "object",
+            },
+            "response": {"properties": {}, "title": "Response", "type": "object"},
+            "description": "Star a repository",
+            "displayName": "Star a repository",
+            "enabled": True,
+            "logo": "",
+        }
+    )
+
+
+def test_aexecute_action(tmp_path: Path) -> None:
+    """Test processors, attachments and output files on the async path."""
+    action = _remote_action(tmp_path=tmp_path)
+    attachment = tmp_path / "attachment.txt"
+    attachment.write_text("attached")
+
+    def _pre(request: t.Dict) -> t.Dict:
+        return {**request, "attachment": str(attachment)}
+
+    def _post(response: t.Dict) -> t.Dict:
+        return {**response, "post": True}
+
+    toolset = ComposioToolSet(
+        api_key="api_key",
+        output_dir=tmp_path / "output",
+        processors={"pre": {action: _pre}, "post": {action: _post}},
+    )
+    response = mock.MagicMock()
+    response.json = mock.AsyncMock(
+        return_value={
+            "data": {
+                "file": {
+                    "name": "star.txt",
+                    "content": base64.b64encode(b"starred").decode(),
+                }
+            },
+            "error": None,
+            "successfull": True,
+        }
+    )
+    http = mock.MagicMock(post=mock.AsyncMock(return_value=response))
+
+    async def _execute() -> t.Dict:
+        client = toolset.async_client
+        with mock.patch.object(
+            AsyncComposio, "http", new_callable=mock.PropertyMock, return_value=http
+        ), mock.patch.object(
+            client.actions,
+            "get",
+            new=mock.AsyncMock(return_value=[_remote_schema(action=action)]),
+        ), mock.patch.object(
+            client.actions,
+            "_raise_if_required",
+            new=mock.AsyncMock(side_effect=lambda r: r),
+        ):
+            return await toolset.aexecute_action(action=action, params={})
+
+    try:
+        output = asyncio.run(_execute())
+    finally:
+        mock.patch.stopall()
+
+    (call,) = http.post.await_args_list
+    assert call.kwargs["json"]["input"] == {
+        "attachment": {
+            "name": "attachment.txt",
+            "content": base64.b64encode(b"attached").decode(),
+        }
+    }
+    assert output["post"] is True
+    assert Path(output["data"]["file"]).read_bytes() == b"starred"
+    assert Path(output["data"]["file"]).parent == tmp_path / "output"
+
+
+def test_aget_action_schemas(tmp_path: Path) -> None:
+    """Test schema processors run on schemas fetched by the async client."""
+    action = _remote_action(tmp_path=tmp_path)
+
+    def _schema(properties: t.Dict) -> t.Dict:
+        return {**properties, "processed": {"type": "boolean"}}
+
+    toolset = ComposioToolSet(
+        api_key="api_key", processors={"schema": {action: _schema}}
+    )
+    get = mock.AsyncMock(return_value=[_remote_schema(action=action)])
+
+    async def _get_schemas() -> t.List[ActionModel]:
+        with mock.patch.object(toolset.async_client.actions, "get", new=get):
+            await toolset.aget_action_schemas(
+                actions=[action], check_connected_accounts=False
+            )
+            return await toolset.aget_action_schemas(
+                actions=[action], check_connected_accounts=False
+            )
+
+    try:
+        (schema,) = asyncio.run(_get_schemas())
+    finally:
+        mock.patch.stopall()
+
+    assert get.await_count == 1
+    assert schema.parameters.properties["processed"] == {"type": "boolean"}
+    assert schema.parameters.properties["attachment"]["format"] == "file-path"
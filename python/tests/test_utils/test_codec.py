@@ -0,0 +1,40 @@
+"""
+Test JSON codec.
+"""
+
+import json
+
+import pytest
+
+from composio.utils import codec
+
+
+DATA = {
+    "name": "composio",
+    "unicode": "ü ✓",
+    "items": [1, 2.5, None, True, {"nested": []}],
+    "big": 2**70,
+}
+
+
+def test_round_trip() -> None:
+    """Test encoding and decoding matches the standard library."""
+    encoded = codec.dumps(DATA)
+    assert "\n" not in encoded
+    assert json.loads(encoded) == DATA
+    assert codec.loads(encoded) == DATA
+    assert codec.loads(codec.dumpb(DATA)) == DATA
+    assert codec.loads(json.dumps(DATA, indent=4).encode()) == DATA
+
+
+def test_indent() -> None:
+    """Test indented output is only produced on request."""
+    assert codec.dumps({"a": 1}, indent=2) == json.dumps({"a": 1}, indent=2)
+
+
+def test_loads_errors() -> None:
+    """Test invalid documents raise the standard library error."""
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads("{invalid")
+
+    assert codec.loads("[NaN]")[0] != codec.loads("[NaN]")[0]
@@ -0,0 +1,89 @@
+"""
+Test instrumentation module.
+"""
+
+from unittest import mock
+
+import pytest
+
+from composio.utils.instrumentation import (
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    InMemoryExporter,
+    Instrumentation,
+    OpenTelemetryExporter,
+    PrometheusExporter,
+)
+
+
+def test_disabled() -> None:
+    """Test spans are no-ops without exporters."""
+    instrumentation = Instrumentation()
+    assert not instrumentation.enabled
+    with instrumentation.span("execute", action="A") as span:
+        span.tag(outcome="failure")
+    assert span is instrumentation.span("http")
+
+
+def test_spans() -> None:
+    """Test nested spans inherit tags and record outcomes."""
+    exporter = InMemoryExporter(buckets=(0.5, 1.0))
+    instrumentation = Instrumentation(exporters=[exporter])
+    with instrumentation.span("execute", action="A", app="X"):
+        with instrumentation.span("http"):
+            pass
+        with pytest.raises(ValueError):
+            with instrumentation.span("postprocess"):
+                raise ValueError()
+
+    http, postprocess, execute = exporter.spans
+    assert http.parent is execute
+    assert http.tags == {"action": "A", "app": "X", "outcome": OUTCOME_SUCCESS}
+    assert postprocess.outcome == OUTCOME_ERROR
+    assert execute.outcome == OUTCOME_SUCCESS
+    assert exporter.histogram("http", app="X").count == 1
+    assert exporter.histogram("http", app="Y").count == 0
+    assert exporter.histogram("execute").counts == [1, 0, 0]
+
+
+def test_prometheus_exporter() -> None:
+    """Test rendering histograms in the Prometheus text format."""
+    exporter = PrometheusExporter(buckets=(0.5,))
+    instrumentation = Instrumentation(exporters=[exporter])
+    with instrumentation.span("http", action='SAY_"HI"'):
+        pass
+
+    assert exporter.render().splitlines()[2:] == [
+        'composio_phase_duration_seconds_bucket{phase="http",'
+        'action="SAY_\\"HI\\"",outcome="success",le="0.5"} 1',
+        'composio_phase_duration_seconds_bucket{phase="http",'
+        'action="SAY_\\"HI\\"",outcome="success",le="+Inf"} 1',
+        'composio_phase_duration_seconds_sum{phase="http",'
+        f'action="SAY_\\"HI\\"",outcome="success"}} {exporter.histogram("http").sum}',
+        'composio_phase_duration_seconds_count{phase="http",'
+        'action="SAY_\\"HI\\"",outcome="success"} 1',
+    ]
+
+
+def test_opentelemetry_exporter() -> None:
+    """Test forwarding spans and durations to OpenTelemetry."""
+    tracer, meter = mock.MagicMock(), mock.MagicMock()
+    exporter = OpenTelemetryExporter(tracer=tracer, meter=meter)
+    instrumentation = Instrumentation(exporters=[exporter])
+    with instrumentation.span("execute", action="A"):
+        with instrumentation.span("http"):
+            pass
+
+    assert [call.kwargs["name"] for call in tracer.start_span.call_args_list] == [
+        "composio.execute",
+        "composio.http",
+    ]
+    assert tracer.start_span.call_args_list[0].kwargs["context"] is None
+    assert tracer.start_span.call_args_list[1].kwargs["context"] is not None
+    assert tracer.start_span.return_value.end.call_count == 2
+    (_, kwargs), _ = meter.create_histogram.return_value.record.call_args_list
+    assert kwargs["attributes"] == {
+        "composio.phase": "http",
+        "composio.action": "A",
+        "composio.outcome": OUTCOME_SUCCESS,
+    }
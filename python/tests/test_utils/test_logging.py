@@ -4,6 +4,7 @@ from unittest import mock
 import pytest
 
 from composio import ComposioToolSet
+from composio.utils.logging import LazyMessage
 
 
 @pytest.mark.parametrize(
@@ -22,3 +23,45 @@ def test_log_verbosity(verbosity: int, size: int):
     toolset = ComposioToolSet(verbosity_level=verbosity)
     with mock.patch.object(Logger, "info", new=_assert):
         toolset.logger.info("-" * 2048)
+
+
+def test_lazy_message() -> None:
+    """Test structured messages are formatted only when emitted."""
+    payload_repr = mock.MagicMock(return_value="payload")
+    payload = mock.MagicMock(__repr__=payload_repr)
+    toolset = ComposioToolSet(verbosity_level=0)
+    message = LazyMessage("Executing", budgets={"params": 16}, payload=payload)
+
+    with mock.patch.object(toolset.logger, "logger") as logger:
+        logger.isEnabledFor.return_value = False
+        toolset.logger.info(message)
+        assert logger.info.call_count == 0
+        assert payload_repr.call_count == 0
+
+        logger.isEnabledFor.return_value = True
+        toolset.logger.info(message)
+        (args, _), *_ = logger.info.call_args_list
+        assert args[0] is message
+        assert payload_repr.call_count == 0
+
+        toolset.logger.info(LazyMessage("Sampled", sample_rate=0.0))
+        assert logger.info.call_count == 1
+
+    message = LazyMessage(
+        "Executing",
+        budgets={"params": 16},
+        params={"data": "x" * 1024 * 1024},
+        response={"data": list(range(1024))},
+    )
+    message.default_budget = 64
+    assert str(message) == (
+        "Executing params={'data': 'xxxxxx... " "response={'data': [0, 1, 2,..."
+    )
+
+    # The line size is shared by all of the fields
+    message.default_budget = 32
+    assert str(message) == "Executing params={'data': 'xxxxx... ..."
+
+    message = LazyMessage("Executing", args=(1,), tags={"a"}, ids=[1, 2])
+    message.default_budget = 256
+    assert str(message) == "Executing args=(1,) tags={'a'} ids=[1, 2]"
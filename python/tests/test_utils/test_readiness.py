@@ -0,0 +1,81 @@
+"""
+Test readiness primitives.
+"""
+
+import asyncio
+import threading
+import time
+import typing as t
+
+import pytest
+
+from composio.utils.readiness import Backoff, Readiness, async_wait_until, wait_until
+
+
+def test_readiness() -> None:
+    """Test blocking and async waiters wake up when the latch is resolved."""
+    ready = Readiness[str]()
+    assert not ready.wait(timeout=0.01)
+    with pytest.raises(TimeoutError):
+        ready.result(timeout=0.01)
+    with pytest.raises(TimeoutError):
+        asyncio.run(ready.async_result(timeout=0.01))
+
+    start = time.monotonic()
+    threading.Timer(0.05, ready.set, args=("connected",)).start()
+    assert ready.result(timeout=5.0) == "connected"
+    assert time.monotonic() - start < 1.0
+
+    # Resolving twice keeps the first value
+    ready.set("reconnected")
+    assert ready.is_set() and ready.wait(timeout=0)
+    assert asyncio.run(ready.async_result(timeout=1.0)) == "connected"
+
+    failed = Readiness[None]()
+    failed.fail(ConnectionError("refused"))
+    with pytest.raises(ConnectionError):
+        failed.result()
+
+
+def test_async_waits_share_future() -> None:
+    """Test timed out async waits do not pile up callbacks on the latch."""
+    # pylint: disable=protected-access
+    ready = Readiness[int]()
+
+    async def _wait() -> int:
+        for _ in range(5):
+            with pytest.raises(TimeoutError):
+                await ready.async_result(timeout=0.001)
+        callbacks = ready._future._done_callbacks  # type: ignore
+        assert len(callbacks) == 1
+        asyncio.get_running_loop().call_later(0.01, ready.set, 1)
+        return await ready.async_result(timeout=1.0)
+
+    assert asyncio.run(_wait()) == 1
+    assert asyncio.run(ready.async_result()) == 1
+    assert len(ready._async_futures) == 1
+
+
+def test_wait_until() -> None:
+    """Test polling backs off and returns as soon as the state is reached."""
+    backoff = Backoff(initial=0.01, factor=2.0, maximum=0.04, jitter=0.0)
+    delays = backoff.delays()
+    assert [next(delays) for _ in range(4)] == [0.01, 0.02, 0.04, 0.04]
+
+    polls: t.List[float] = []
+
+    def _check() -> t.Optional[str]:
+        polls.append(time.monotonic())
+        return "active" if len(polls) == 3 else None
+
+    assert wait_until(check=_check, timeout=5.0, backoff=backoff) == "active"
+    assert polls[2] - polls[0] < 0.5
+
+    with pytest.raises(TimeoutError):
+        wait_until(check=lambda: None, timeout=0.05, backoff=backoff)
+
+    async def _async_check() -> t.Optional[str]:
+        polls.append(time.monotonic())
+        return "active" if len(polls) == 5 else None
+
+    assert asyncio.run(async_wait_until(check=_async_check, timeout=5.0)) == "active"
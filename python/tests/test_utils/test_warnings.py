@@ -0,0 +1,90 @@
+"""
+Test version check helpers.
+"""
+
+import contextlib
+import os
+import tempfile
+import threading
+import time
+import typing as t
+from pathlib import Path
+from unittest import mock
+
+from composio.utils import warnings
+
+
+@contextlib.contextmanager
+def _version_checkers() -> t.Iterator[t.List[t.Any]]:
+    """Enable the version check and collect the checkers it creates."""
+    checkers: t.List[t.Any] = []
+    checker_cls = warnings._VersionChecker  # pylint: disable=protected-access
+
+    def _create(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        checkers.append(checker_cls(*args, **kwargs))
+        return checkers[-1]
+
+    with mock.patch.dict(os.environ), mock.patch.object(
+        warnings, "_VersionChecker", side_effect=_create
+    ):
+        os.environ.pop(warnings.ENV_COMPOSIO_DISABLE_VERSION_CHECK, None)
+        yield checkers
+
+
+def _join(checker: t.Any) -> None:
+    """Wait for the background fetch of a checker to finish."""
+    if checker._thread is not None:  # pylint: disable=protected-access
+        checker._thread.join(timeout=5.0)  # pylint: disable=protected-access
+
+
+def test_version_check_does_not_block() -> None:
+    """Test the exit hook does not wait for the version check."""
+    release = threading.Event()
+
+    def _get(*_, **__):
+        release.wait(timeout=5.0)
+        return mock.MagicMock(
+            status_code=200,
+            json=lambda: {"info": {"version": "99.0.0"}},
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(
+        warnings, "VERSION_CHECK_FILE", Path(temp_dir, "version_check.json")
+    ), mock.patch.object(warnings.requests, "get", side_effect=_get), mock.patch.object(
+        warnings.rich, "print"
+    ) as _print, _version_checkers() as checkers:
+        hook = warnings.create_latest_version_warning_hook(version="0.1.0")
+        start = time.monotonic()
+        hook()
+        assert time.monotonic() - start < 1.0
+        assert _print.call_count == 0
+
+        release.set()
+        _join(checkers[0])
+
+        hook()
+        assert _print.call_count == 1
+
+
+def test_version_check_cached() -> None:
+    """Test cached versions are used until they expire."""
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(
+        warnings, "VERSION_CHECK_FILE", Path(temp_dir, "version_check.json")
+    ), mock.patch.object(warnings.requests, "get") as get, mock.patch.object(
+        warnings.rich, "print"
+    ) as _print, _version_checkers() as checkers:
+        warnings.VersionCheck(
+            latest_version="99.0.0",
+            checked_at=time.time(),
+            path=warnings.VERSION_CHECK_FILE,
+        ).store()
+        warnings.create_latest_version_warning_hook(version="0.1.0")()
+        assert get.call_count == 0
+        assert _print.call_count == 1
+
+        with mock.patch.dict(
+            "os.environ", {warnings.ENV_COMPOSIO_VERSION_CHECK_TTL: "0"}
+        ):
+            warnings.create_latest_version_warning_hook(version="0.1.0")
+            _join(checkers[-1])
+            assert get.call_count == 1